@@ -0,0 +1,161 @@
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Literal, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import MetricsRegistry
+
+Lane = Literal["read", "write"]
+
+_READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+_PRIORITY_SUFFIXES = ("/notes", "/close", "/reopen")
+_EXEMPT_PREFIXES = ("/healthz", "/metrics", "/debug/", "/api/v1/changes")
+
+
+class AdmissionLane:
+    def __init__(self, name: Lane, limit: int, queue_size: int):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.active = 0
+        self._priority: deque[asyncio.Future[None]] = deque()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def depth(self) -> int:
+        return len(self._priority) + len(self._waiters)
+
+    def try_acquire(self) -> bool:
+        if self.limit <= 0 or self.active < self.limit:
+            self.active += 1
+            return True
+        return False
+
+    def enqueue(self, priority: bool) -> Optional[asyncio.Future[None]]:
+        if self.depth >= self.queue_size:
+            return None
+        waiter = asyncio.get_running_loop().create_future()
+        (self._priority if priority else self._waiters).append(waiter)
+        return waiter
+
+    def discard(self, waiter: asyncio.Future[None]) -> None:
+        for queue in (self._priority, self._waiters):
+            try:
+                queue.remove(waiter)
+            except ValueError:
+                continue
+            return
+
+    def release(self) -> None:
+        for queue in (self._priority, self._waiters):
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self.active -= 1
+
+
+class AdmissionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        read_limit: int,
+        write_limit: int,
+        read_queue: int,
+        write_queue: int,
+        queue_timeout: float,
+        retry_after: int,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        self.app = app
+        self._lanes: dict[Lane, AdmissionLane] = {
+            "read": AdmissionLane("read", read_limit, read_queue),
+            "write": AdmissionLane("write", write_limit, write_queue),
+        }
+        self._queue_timeout = queue_timeout
+        self._retry_after = retry_after
+        self._shed = None
+        self._wait = None
+        if registry is not None:
+            self._shed = registry.counter(
+                "admission_shed_total", "Requests rejected by admission control.", ("lane", "reason")
+            )
+            self._wait = registry.histogram(
+                "admission_queue_wait_seconds", "Time admitted requests spent queued.", ("lane",)
+            )
+            registry.gauge_callback(
+                "admission_queue_depth",
+                "Requests waiting for an admission slot.",
+                lambda: [((lane.name,), float(lane.depth)) for lane in self._lanes.values()],
+                ("lane",),
+            )
+            registry.gauge_callback(
+                "admission_active",
+                "Requests holding an admission slot.",
+                lambda: [((lane.name,), float(lane.active)) for lane in self._lanes.values()],
+                ("lane",),
+            )
+
+    def lane(self, name: Lane) -> AdmissionLane:
+        return self._lanes[name]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(_EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        lane = self._lanes["read" if method in _READ_METHODS else "write"]
+        if not lane.try_acquire():
+            priority = lane.name == "write" and scope["path"].endswith(_PRIORITY_SUFFIXES)
+            admitted = await self._wait_for_slot(lane, priority)
+            if not admitted:
+                await self._reject(send)
+                return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            lane.release()
+
+    async def _wait_for_slot(self, lane: AdmissionLane, priority: bool) -> bool:
+        waiter = lane.enqueue(priority)
+        if waiter is None:
+            self._record_shed(lane, "queue_full")
+            return False
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, timeout=self._queue_timeout)
+        except asyncio.TimeoutError:
+            lane.discard(waiter)
+            self._record_shed(lane, "timeout")
+            return False
+        except asyncio.CancelledError:
+            lane.discard(waiter)
+            if waiter.done() and not waiter.cancelled():
+                lane.release()
+            raise
+        if self._wait is not None:
+            self._wait.observe(time.perf_counter() - started, labels=(lane.name,))
+        return True
+
+    def _record_shed(self, lane: AdmissionLane, reason: str) -> None:
+        if self._shed is not None:
+            self._shed.inc(labels=(lane.name, reason))
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": "Server overloaded, retry later"}).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("ascii")),
+                    (b"retry-after", str(self._retry_after).encode("ascii")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
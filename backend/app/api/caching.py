@@ -0,0 +1,34 @@
+import hashlib
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+
+
+def _etag(value: str) -> str:
+    return f'"{hashlib.blake2b(value.encode("utf-8"), digest_size=12).hexdigest()}"'
+
+
+def entity_etag(entity_id: str, version: str) -> str:
+    return _etag(f"{entity_id}:{version}")
+
+
+def collection_etag(store_version: str, request: Request) -> str:
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return _etag(f"{request.url.path}:{store_version}?{query}")
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
@@ -0,0 +1,51 @@
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies import get_change_log
+from app.models.changes import ChangeBatch
+from app.services.changes import ChangeLog
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+SSE_HEARTBEAT_SECONDS = 15.0
+
+
+def format_sse(batch: ChangeBatch) -> bytes:
+    if batch.reset:
+        return f"id: {batch.latest}\nevent: reset\ndata: {batch.model_dump_json()}\n\n".encode("utf-8")
+    return "".join(
+        f"id: {change.seq}\nevent: change\ndata: {change.model_dump_json()}\n\n" for change in batch.changes
+    ).encode("utf-8")
+
+
+async def _sse_stream(request: Request, change_log: ChangeLog, since: int, limit: int) -> AsyncIterator[bytes]:
+    cursor = since
+    yield b"retry: 2000\n\n"
+    while not await request.is_disconnected():
+        batch = await change_log.wait(cursor, SSE_HEARTBEAT_SECONDS, limit)
+        if batch.reset or batch.changes:
+            yield format_sse(batch)
+            cursor = batch.latest if batch.reset else batch.changes[-1].seq
+        else:
+            yield b": keepalive\n\n"
+
+
+@router.get("", response_model=ChangeBatch)
+async def list_changes(
+    request: Request,
+    since: int = Query(default=0, ge=0),
+    wait: float = Query(default=0.0, ge=0.0, le=60.0),
+    limit: int = Query(default=1000, ge=1, le=10_000),
+    last_event_id: str | None = Header(default=None),
+    change_log: ChangeLog = Depends(get_change_log),
+) -> ChangeBatch | Response:
+    if "text/event-stream" in request.headers.get("accept", ""):
+        cursor = int(last_event_id) if last_event_id and last_event_id.isdigit() else since
+        return StreamingResponse(
+            _sse_stream(request, change_log, cursor, limit),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    return await change_log.wait(since, wait, limit)
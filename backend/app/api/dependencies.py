@@ -1,12 +1,57 @@
-from fastapi import Request
+from fastapi import HTTPException, Query, Request
 
+from app.api.serialization import JsonFragmentCache
+from app.core.config import MAX_BATCH_IDS
+from app.core.metrics import MetricsRegistry
+from app.core.profiling import ProfileStore
+from app.services.changes import ChangeLog
+from app.services.context import IncidentContextService
+from app.services.idempotency import IdempotencyService
+from app.services.imports import ImportService
 from app.services.incidents import IncidentService
 from app.services.runbooks import RunbookService
 
 
-def get_incident_service(request: Request) -> IncidentService:
+async def get_incident_service(request: Request) -> IncidentService:
     return request.app.state.incident_service
 
 
-def get_runbook_service(request: Request) -> RunbookService:
+async def get_runbook_service(request: Request) -> RunbookService:
     return request.app.state.runbook_service
+
+
+async def get_json_cache(request: Request) -> JsonFragmentCache:
+    return request.app.state.json_cache
+
+
+async def get_import_service(request: Request) -> ImportService:
+    return request.app.state.import_service
+
+
+async def get_change_log(request: Request) -> ChangeLog:
+    return request.app.state.change_log
+
+
+async def get_metrics(request: Request) -> MetricsRegistry:
+    return request.app.state.metrics
+
+
+async def get_profile_store(request: Request) -> ProfileStore:
+    return request.app.state.profiles
+
+
+async def get_idempotency_service(request: Request) -> IdempotencyService:
+    return request.app.state.idempotency_service
+
+
+async def get_context_service(request: Request) -> IncidentContextService:
+    return request.app.state.context_service
+
+
+async def get_batch_ids(ids: str | None = Query(default=None)) -> list[str] | None:
+    if ids is None:
+        return None
+    values = [value.strip() for value in ids.split(",") if value.strip()]
+    if len(values) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=422, detail=f"At most {MAX_BATCH_IDS} ids per request")
+    return values
@@ -0,0 +1,59 @@
+import hashlib
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Depends, Header, HTTPException, Request, Response
+from pydantic import BaseModel
+
+from app.api.dependencies import get_idempotency_service
+from app.api.serialization import dump_json
+from app.services.idempotency import IdempotencyConflictError, IdempotencyService
+
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyContext:
+    def __init__(self, service: IdempotencyService, key: Optional[str], fingerprint: str):
+        self._service = service
+        self._key = key
+        self._fingerprint = fingerprint
+
+    def replay(self) -> Optional[Response]:
+        if self._key is None:
+            return None
+        try:
+            record = self._service.lookup(self._key, self._fingerprint)
+        except IdempotencyConflictError as exc:
+            raise HTTPException(
+                status_code=422, detail="Idempotency-Key was already used for a different request"
+            ) from exc
+        if record is None:
+            return None
+        return Response(
+            content=record.body,
+            status_code=record.status,
+            media_type="application/json",
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+    def remember(self, status: int, result: BaseModel) -> None:
+        if self._key is not None:
+            self._service.remember(self._key, self._fingerprint, status, dump_json(result).decode("utf-8"))
+
+    async def commit(self, status: int, result: BaseModel, flush: Callable[[], Awaitable[None]]) -> None:
+        # Remember before flushing, and keep the record even if the flush fails: the mutation is
+        # already applied in memory, so a retry must replay it. The replay path flushes again,
+        # which re-attempts the failed write before the stored response is returned.
+        self.remember(status, result)
+        await flush()
+
+
+async def get_idempotency(
+    request: Request,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
+    service: IdempotencyService = Depends(get_idempotency_service),
+) -> IdempotencyContext:
+    if idempotency_key is not None and not 0 < len(idempotency_key) <= MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail="Invalid Idempotency-Key")
+    digest = hashlib.sha256(f"{request.method} {request.url.path}\n".encode("utf-8"))
+    digest.update(await request.body())
+    return IdempotencyContext(service, idempotency_key, digest.hexdigest())
@@ -0,0 +1,52 @@
+import zlib
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from app.api.dependencies import get_import_service
+from app.models.imports import ImportCommitMode, ImportRecordType, ImportResult
+from app.services.imports import ImportService
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+
+@router.post("", response_model=ImportResult)
+async def import_records(
+    request: Request,
+    record_type: ImportRecordType | None = Query(default=None, alias="type"),
+    chunk_size: int = Query(default=1000, ge=1, le=100_000),
+    commit: ImportCommitMode = "end",
+    max_errors: int = Query(default=100, ge=0, le=10_000),
+    import_service: ImportService = Depends(get_import_service),
+) -> ImportResult:
+    job = import_service.start(
+        default_type=record_type, chunk_size=chunk_size, commit=commit, max_errors=max_errors
+    )
+    decompressor = (
+        zlib.decompressobj(zlib.MAX_WBITS | 32) if request.headers.get("content-encoding") == "gzip" else None
+    )
+    buffer = b""
+    try:
+        async for chunk in request.stream():
+            if decompressor is not None:
+                chunk = decompressor.decompress(chunk)
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                job.add_line(line)
+                if job.chunk_ready:
+                    job.flush()
+                    await import_service.flush()
+        if decompressor is not None:
+            buffer += decompressor.flush()
+            if not decompressor.eof:
+                raise zlib.error("truncated gzip stream")
+    except zlib.error as exc:
+        # Chunks applied before the corrupt data stay applied, so persist them before rejecting the body.
+        job.finish()
+        await import_service.flush()
+        raise HTTPException(status_code=400, detail=f"Invalid gzip body: {exc}") from exc
+    if buffer:
+        job.add_line(buffer)
+    result = job.finish()
+    await import_service.flush()
+    return result
@@ -1,90 +1,204 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
-
-from app.api.dependencies import get_incident_service
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from app.api.caching import collection_etag, entity_etag, is_not_modified, not_modified_response, set_etag
+from app.api.dependencies import get_batch_ids, get_context_service, get_incident_service, get_json_cache
+from app.api.idempotency import IdempotencyContext, get_idempotency
+from app.api.serialization import JsonFragmentCache, dump_json, json_array, json_bytes_response, json_page, ndjson_response
+from app.core.timing import timed
+from app.models.context import IncidentContext
+from app.models.facets import IncidentPage
 from app.models.incident import Incident, IncidentCreate, IncidentNoteCreate, IncidentUpdate
+from app.services.context import IncidentContextService
 from app.services.incidents import IncidentService
 
 router = APIRouter(prefix="/incidents", tags=["incidents"])
 
 
-@router.get("", response_model=list[Incident])
-def list_incidents(
+@router.get("", response_model=list[Incident] | IncidentPage)
+async def list_incidents(
+    request: Request,
+    q: str | None = None,
+    status: str | None = None,
+    severity: str | None = None,
+    service: str | None = None,
+    facets: bool = False,
+    ids: list[str] | None = Depends(get_batch_ids),
+    incident_service: IncidentService = Depends(get_incident_service),
+    json_cache: JsonFragmentCache = Depends(get_json_cache),
+) -> Response:
+    etag = collection_etag(incident_service.version, request)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    with timed("service"):
+        incidents = incident_service.list_incidents(q=q, status=status, severity=severity, service=service, ids=ids)
+        counts = None
+        if facets:
+            counts = incident_service.facet_counts(q=q, status=status, severity=severity, service=service, ids=ids)
+    with timed("serialization"):
+        body = json_array(
+            json_cache.entity("incident", incident, incident_service.entity_version(incident)) for incident in incidents
+        )
+        response = json_bytes_response(body if counts is None else json_page(body, counts))
+    set_etag(response, etag)
+    return response
+
+
+@router.get("/export")
+async def export_incidents(
     q: str | None = None,
     status: str | None = None,
     severity: str | None = None,
     service: str | None = None,
+    gzip: bool = False,
     incident_service: IncidentService = Depends(get_incident_service),
-) -> list[Incident]:
-    return incident_service.list_incidents(q=q, status=status, severity=severity, service=service)
+) -> Response:
+    incidents = incident_service.export_incidents(q=q, status=status, severity=severity, service=service)
+    return ndjson_response(incidents, filename="incidents.ndjson", gzip=gzip)
 
 
 @router.post("", response_model=Incident, status_code=201)
-def create_incident(
-    payload: IncidentCreate, incident_service: IncidentService = Depends(get_incident_service)
-) -> Incident:
-    return incident_service.create_incident(payload)
+async def create_incident(
+    payload: IncidentCreate,
+    incident_service: IncidentService = Depends(get_incident_service),
+    idempotency: IdempotencyContext = Depends(get_idempotency),
+) -> Incident | Response:
+    replay = idempotency.replay()
+    if replay is not None:
+        await incident_service.flush()
+        return replay
+    with timed("service"):
+        incident = incident_service.create_incident(payload)
+    await idempotency.commit(201, incident, incident_service.flush)
+    return incident
 
 
 @router.get("/{incident_id}", response_model=Incident)
-def get_incident(
-    incident_id: str, incident_service: IncidentService = Depends(get_incident_service)
-) -> Incident:
+async def get_incident(
+    incident_id: str,
+    request: Request,
+    incident_service: IncidentService = Depends(get_incident_service),
+    json_cache: JsonFragmentCache = Depends(get_json_cache),
+) -> Response:
     try:
-        return incident_service.get_incident(incident_id)
+        with timed("service"):
+            incident = incident_service.get_incident(incident_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Incident not found") from exc
+    version = incident_service.entity_version(incident)
+    etag = entity_etag(incident.id, version)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    with timed("serialization"):
+        response = json_bytes_response(json_cache.entity("incident", incident, version))
+    set_etag(response, etag)
+    return response
+
+
+@router.get("/{incident_id}/context", response_model=IncidentContext)
+async def get_incident_context(
+    incident_id: str,
+    request: Request,
+    notes: int = Query(default=5, ge=0, le=100),
+    runbooks: int = Query(default=5, ge=0, le=50),
+    related: int = Query(default=10, ge=0, le=100),
+    incident_service: IncidentService = Depends(get_incident_service),
+    context_service: IncidentContextService = Depends(get_context_service),
+) -> Response:
+    etag = collection_etag(incident_service.version, request)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    try:
+        with timed("service"):
+            context = context_service.get_context(incident_id, notes=notes, runbooks=runbooks, related=related)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Incident not found") from exc
+    with timed("serialization"):
+        response = json_bytes_response(dump_json(context))
+    set_etag(response, etag)
+    return response
 
 
 @router.put("/{incident_id}", response_model=Incident)
-def update_incident(
+async def update_incident(
     incident_id: str,
     payload: IncidentUpdate,
     incident_service: IncidentService = Depends(get_incident_service),
 ) -> Incident:
     try:
-        return incident_service.update_incident(incident_id, payload)
+        with timed("service"):
+            incident = incident_service.update_incident(incident_id, payload)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Incident not found") from exc
+    await incident_service.flush()
+    return incident
 
 
 @router.delete("/{incident_id}", status_code=204)
-def delete_incident(
+async def delete_incident(
     incident_id: str, incident_service: IncidentService = Depends(get_incident_service)
 ) -> Response:
     try:
-        incident_service.delete_incident(incident_id)
+        with timed("service"):
+            incident_service.delete_incident(incident_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Incident not found") from exc
+    await incident_service.flush()
     return Response(status_code=204)
 
 
 @router.post("/{incident_id}/notes", response_model=Incident)
-def add_note(
+async def add_note(
     incident_id: str,
     payload: IncidentNoteCreate,
     incident_service: IncidentService = Depends(get_incident_service),
-) -> Incident:
+    idempotency: IdempotencyContext = Depends(get_idempotency),
+) -> Incident | Response:
+    replay = idempotency.replay()
+    if replay is not None:
+        await incident_service.flush()
+        return replay
     try:
-        return incident_service.add_note(incident_id, payload)
+        with timed("service"):
+            incident = incident_service.add_note(incident_id, payload)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Incident not found") from exc
+    await idempotency.commit(200, incident, incident_service.flush)
+    return incident
 
 
 @router.post("/{incident_id}/close", response_model=Incident)
-def close_incident(
-    incident_id: str, incident_service: IncidentService = Depends(get_incident_service)
-) -> Incident:
+async def close_incident(
+    incident_id: str,
+    incident_service: IncidentService = Depends(get_incident_service),
+    idempotency: IdempotencyContext = Depends(get_idempotency),
+) -> Incident | Response:
+    replay = idempotency.replay()
+    if replay is not None:
+        await incident_service.flush()
+        return replay
     try:
-        return incident_service.close_incident(incident_id)
+        with timed("service"):
+            incident = incident_service.close_incident(incident_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Incident not found") from exc
+    await idempotency.commit(200, incident, incident_service.flush)
+    return incident
 
 
 @router.post("/{incident_id}/reopen", response_model=Incident)
-def reopen_incident(
-    incident_id: str, incident_service: IncidentService = Depends(get_incident_service)
-) -> Incident:
+async def reopen_incident(
+    incident_id: str,
+    incident_service: IncidentService = Depends(get_incident_service),
+    idempotency: IdempotencyContext = Depends(get_idempotency),
+) -> Incident | Response:
+    replay = idempotency.replay()
+    if replay is not None:
+        await incident_service.flush()
+        return replay
     try:
-        return incident_service.reopen_incident(incident_id)
+        with timed("service"):
+            incident = incident_service.reopen_incident(incident_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Incident not found") from exc
+    await idempotency.commit(200, incident, incident_service.flush)
+    return incident
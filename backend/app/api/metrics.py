@@ -0,0 +1,47 @@
+import time
+
+from fastapi import APIRouter, Depends, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.dependencies import get_metrics
+from app.core.metrics import MetricsRegistry
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        self.app = app
+        self._duration = registry.histogram(
+            "http_request_duration_seconds", "HTTP request latency by route and status.", ("method", "route", "status")
+        )
+        self._in_flight = registry.gauge("http_requests_in_flight", "HTTP requests currently being served.", ("method",))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = (scope["method"],)
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self._in_flight.inc(labels=method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._in_flight.dec(labels=method)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            self._duration.observe(time.perf_counter() - started, labels=(scope["method"], route, str(status)))
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(registry: MetricsRegistry = Depends(get_metrics)) -> Response:
+    return Response(content=registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
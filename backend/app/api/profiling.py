@@ -0,0 +1,159 @@
+import cProfile
+import threading
+import time
+from datetime import datetime, timezone
+from hmac import compare_digest
+from uuid import uuid4
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.dependencies import get_profile_store
+from app.core.profiling import ProfileStore, cprofile_report, sample_stacks
+from app.core.timing import format_server_timing, reset_timings, start_timings
+from app.models.profiling import ProfileReport, ProfileSummary
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _token_matches(candidate: str | None, token: str | None) -> bool:
+    if token is None or candidate is None:
+        return False
+    return compare_digest(candidate.encode("utf-8"), token.encode("utf-8"))
+
+
+async def require_profile_token(request: Request, x_profile_token: str | None = Header(default=None)) -> None:
+    token = request.app.state.profile_token
+    if token is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not _token_matches(x_profile_token, token):
+        raise HTTPException(status_code=403, detail="Invalid profile token")
+
+
+router = APIRouter(prefix="/debug/profiles", tags=["profiling"], dependencies=[Depends(require_profile_token)])
+
+
+PROFILE_SCOPE = "event-loop"
+
+
+class ProfilingMiddleware:
+    """Per-request cProfile capture and Server-Timing.
+
+    cProfile hooks the whole event-loop thread, so a request profile also contains every other request and
+    callback that ran while it was awaiting. Profiles are serialized, the response carries
+    ``X-Profile-Scope: event-loop`` and the report states how many other requests overlapped it. A request
+    asking for a profile while another one is being captured gets ``X-Profile-Skipped: busy`` instead.
+    """
+
+    def __init__(self, app: ASGIApp, profiles: ProfileStore, token: str | None, server_timing: bool):
+        self.app = app
+        self._profiles = profiles
+        self._token = token
+        self._server_timing = server_timing
+        self._profile_lock = threading.Lock()
+        self._active = 0
+        self._started = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (self._token is None and not self._server_timing):
+            await self.app(scope, receive, send)
+            return
+        self._active += 1
+        self._started += 1
+        try:
+            await self._call(scope, receive, send)
+        finally:
+            self._active -= 1
+
+    async def _call(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = Headers(scope=scope)
+        authorized = _token_matches(headers.get("x-profile-token"), self._token)
+        if not authorized and not self._server_timing:
+            await self.app(scope, receive, send)
+            return
+
+        profiler = None
+        profile_id = None
+        profile_skipped = False
+        if authorized and headers.get("x-profile"):
+            if self._profile_lock.acquire(blocking=False):
+                profiler = cProfile.Profile()
+                profile_id = uuid4().hex[:12]
+            else:
+                profile_skipped = True
+        timings, context_token = start_timings()
+        started = time.perf_counter()
+        overlapping, started_before = self._active - 1, self._started
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                response_headers.append("Server-Timing", format_server_timing(timings, time.perf_counter() - started))
+                if profile_id is not None:
+                    response_headers.append("X-Profile-Id", profile_id)
+                    response_headers.append("X-Profile-Scope", PROFILE_SCOPE)
+                elif profile_skipped:
+                    response_headers.append("X-Profile-Skipped", "busy")
+            await send(message)
+
+        if profiler is not None:
+            profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            reset_timings(context_token)
+            if profiler is not None:
+                profiler.disable()
+                self._profile_lock.release()
+                self._profiles.add(
+                    ProfileReport(
+                        id=profile_id,
+                        kind="request",
+                        target=f"{scope['method']} {scope['path']}",
+                        createdAt=_now_iso(),
+                        durationMs=round((time.perf_counter() - started) * 1000, 3),
+                        report=(
+                            f"# scope: {PROFILE_SCOPE} thread; "
+                            f"{overlapping + self._started - started_before} other requests overlapped this one\n"
+                            + cprofile_report(profiler)
+                        ),
+                    )
+                )
+
+
+@router.get("", response_model=list[ProfileSummary])
+async def list_profiles(profiles: ProfileStore = Depends(get_profile_store)) -> list[ProfileSummary]:
+    return profiles.summaries()
+
+
+@router.post("", response_model=ProfileReport, status_code=201)
+async def capture_profile(
+    seconds: float = Query(default=5.0, gt=0, le=60),
+    interval_ms: float = Query(default=5.0, ge=1, le=1000),
+    profiles: ProfileStore = Depends(get_profile_store),
+) -> ProfileReport:
+    started = time.perf_counter()
+    report = await run_in_threadpool(sample_stacks, seconds, interval_ms / 1000)
+    profile = ProfileReport(
+        id=uuid4().hex[:12],
+        kind="sampling",
+        target="window",
+        createdAt=_now_iso(),
+        durationMs=round((time.perf_counter() - started) * 1000, 3),
+        report=report,
+    )
+    profiles.add(profile)
+    return profile
+
+
+@router.get("/{profile_id}")
+async def get_profile(profile_id: str, profiles: ProfileStore = Depends(get_profile_store)) -> Response:
+    try:
+        profile = profiles.get(profile_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Profile not found") from exc
+    return Response(content=profile.report, media_type="text/plain; charset=utf-8")
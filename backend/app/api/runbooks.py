@@ -1,56 +1,157 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
-from app.api.dependencies import get_runbook_service
-from app.models.runbook import Runbook, RunbookCreate, RunbookUpdate
+from app.api.caching import collection_etag, entity_etag, is_not_modified, not_modified_response, set_etag
+from app.api.dependencies import get_batch_ids, get_json_cache, get_runbook_service
+from app.api.idempotency import IdempotencyContext, get_idempotency
+from app.api.serialization import JsonFragmentCache, json_array, json_bytes_response, json_page, ndjson_response
+from app.core.timing import timed
+from app.models.facets import RunbookPage
+from app.models.runbook import (
+    Runbook,
+    RunbookCreate,
+    RunbookRevision,
+    RunbookRevisionSummary,
+    RunbookSummary,
+    RunbookUpdate,
+)
 from app.services.runbooks import RunbookService
 
 router = APIRouter(prefix="/runbooks", tags=["runbooks"])
 
 
-@router.get("", response_model=list[Runbook])
-def list_runbooks(
+def _runbook_fragment(
+    json_cache: JsonFragmentCache, runbook_service: RunbookService, summary: RunbookSummary
+) -> bytes:
+    return json_cache.fragment(
+        ("runbook", summary.id, runbook_service.entity_version(summary)), lambda: runbook_service.with_content(summary)
+    )
+
+
+@router.get("", response_model=list[Runbook] | list[RunbookSummary] | RunbookPage)
+async def list_runbooks(
+    request: Request,
     q: str | None = None,
     tag: str | None = None,
+    include_content: bool = True,
+    facets: bool = False,
+    ids: list[str] | None = Depends(get_batch_ids),
     runbook_service: RunbookService = Depends(get_runbook_service),
-) -> list[Runbook]:
-    return runbook_service.list_runbooks(q=q, tag=tag)
+    json_cache: JsonFragmentCache = Depends(get_json_cache),
+) -> Response:
+    etag = collection_etag(runbook_service.version, request)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    with timed("service"):
+        summaries = runbook_service.list_runbooks(q=q, tag=tag, include_content=False, ids=ids)
+        counts = runbook_service.facet_counts(q=q, tag=tag, ids=ids) if facets else None
+    if include_content:
+        fragments = (_runbook_fragment(json_cache, runbook_service, summary) for summary in summaries)
+    else:
+        fragments = (
+            json_cache.entity("runbook-summary", summary, runbook_service.entity_version(summary))
+            for summary in summaries
+        )
+    with timed("serialization"):
+        body = json_array(fragments)
+        response = json_bytes_response(body if counts is None else json_page(body, counts))
+    set_etag(response, etag)
+    return response
+
+
+@router.get("/export")
+async def export_runbooks(
+    q: str | None = None,
+    tag: str | None = None,
+    include_content: bool = True,
+    gzip: bool = False,
+    runbook_service: RunbookService = Depends(get_runbook_service),
+) -> Response:
+    runbooks = runbook_service.export_runbooks(q=q, tag=tag, include_content=include_content)
+    return ndjson_response(runbooks, filename="runbooks.ndjson", gzip=gzip)
 
 
 @router.post("", response_model=Runbook, status_code=201)
-def create_runbook(
-    payload: RunbookCreate, runbook_service: RunbookService = Depends(get_runbook_service)
-) -> Runbook:
-    return runbook_service.create_runbook(payload)
+async def create_runbook(
+    payload: RunbookCreate,
+    runbook_service: RunbookService = Depends(get_runbook_service),
+    idempotency: IdempotencyContext = Depends(get_idempotency),
+) -> Runbook | Response:
+    replay = idempotency.replay()
+    if replay is not None:
+        await runbook_service.flush()
+        return replay
+    with timed("service"):
+        runbook = runbook_service.create_runbook(payload)
+    await idempotency.commit(201, runbook, runbook_service.flush)
+    return runbook
 
 
 @router.get("/{runbook_id}", response_model=Runbook)
-def get_runbook(
-    runbook_id: str, runbook_service: RunbookService = Depends(get_runbook_service)
-) -> Runbook:
+async def get_runbook(
+    runbook_id: str,
+    request: Request,
+    runbook_service: RunbookService = Depends(get_runbook_service),
+    json_cache: JsonFragmentCache = Depends(get_json_cache),
+) -> Response:
     try:
-        return runbook_service.get_runbook(runbook_id)
+        with timed("service"):
+            summary = runbook_service.get_runbook_summary(runbook_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Runbook not found") from exc
+    etag = entity_etag(summary.id, runbook_service.entity_version(summary))
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    with timed("serialization"):
+        response = json_bytes_response(_runbook_fragment(json_cache, runbook_service, summary))
+    set_etag(response, etag)
+    return response
 
 
 @router.put("/{runbook_id}", response_model=Runbook)
-def update_runbook(
+async def update_runbook(
     runbook_id: str,
     payload: RunbookUpdate,
     runbook_service: RunbookService = Depends(get_runbook_service),
 ) -> Runbook:
     try:
-        return runbook_service.update_runbook(runbook_id, payload)
+        with timed("service"):
+            runbook = runbook_service.update_runbook(runbook_id, payload)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Runbook not found") from exc
+    await runbook_service.flush()
+    return runbook
 
 
 @router.delete("/{runbook_id}", status_code=204)
-def delete_runbook(
+async def delete_runbook(
     runbook_id: str, runbook_service: RunbookService = Depends(get_runbook_service)
 ) -> Response:
     try:
-        runbook_service.delete_runbook(runbook_id)
+        with timed("service"):
+            runbook_service.delete_runbook(runbook_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Runbook not found") from exc
+    await runbook_service.flush()
     return Response(status_code=204)
+
+
+@router.get("/{runbook_id}/revisions", response_model=list[RunbookRevisionSummary])
+async def list_revisions(
+    runbook_id: str, runbook_service: RunbookService = Depends(get_runbook_service)
+) -> list[RunbookRevisionSummary]:
+    try:
+        with timed("service"):
+            return runbook_service.list_revisions(runbook_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Runbook not found") from exc
+
+
+@router.get("/{runbook_id}/revisions/{number}", response_model=RunbookRevision)
+async def get_revision(
+    runbook_id: str, number: int, runbook_service: RunbookService = Depends(get_runbook_service)
+) -> RunbookRevision:
+    try:
+        with timed("service"):
+            return runbook_service.get_revision(runbook_id, number)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Revision not found") from exc
@@ -0,0 +1,83 @@
+import json
+import zlib
+from typing import Callable, Iterable, Iterator
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.core.cache import LRUCache
+from app.core.config import DEFAULT_JSON_CACHE_BYTES, DEFAULT_JSON_CACHE_SIZE
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_BATCH_BYTES = 64 * 1024
+
+# Fragments are keyed by (kind, id, entity version). The version combines updatedAt
+# with the index revision, so neither an update nor a delete followed by a re-import
+# can serve a stale fragment; old ones simply age out of the LRU.
+FragmentKey = tuple[str, str, str]
+
+
+def dump_json(model: BaseModel) -> bytes:
+    return model.__pydantic_serializer__.to_json(model)
+
+
+class JsonFragmentCache:
+    def __init__(self, max_entries: int = DEFAULT_JSON_CACHE_SIZE, max_bytes: int = DEFAULT_JSON_CACHE_BYTES):
+        self._fragments: LRUCache[FragmentKey, bytes] = LRUCache(max_entries, max_weight=max_bytes, weigher=len)
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def fragment(self, key: FragmentKey, build: Callable[[], BaseModel]) -> bytes:
+        cached = self._fragments.get(key)
+        if cached is not None:
+            return cached
+        data = dump_json(build())
+        self._fragments.set(key, data)
+        return data
+
+    def entity(self, kind: str, model: BaseModel, version: str) -> bytes:
+        return self.fragment((kind, model.id, version), lambda: model)
+
+
+def json_bytes_response(content: bytes, headers: dict[str, str] | None = None) -> Response:
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def json_array(fragments: Iterable[bytes]) -> bytes:
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def json_page(items: bytes, facets: dict[str, dict[str, int]]) -> bytes:
+    return b'{"items":' + items + b',"facets":' + json.dumps(facets, separators=(",", ":")).encode("utf-8") + b"}"
+
+
+def _batched_lines(models: Iterable[BaseModel]) -> Iterator[bytes]:
+    batch = bytearray()
+    for model in models:
+        batch += dump_json(model)
+        batch += b"\n"
+        if len(batch) >= STREAM_BATCH_BYTES:
+            yield bytes(batch)
+            batch.clear()
+    if batch:
+        yield bytes(batch)
+
+
+def _gzipped(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def ndjson_response(models: Iterable[BaseModel], filename: str, gzip: bool = False) -> StreamingResponse:
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    body = _batched_lines(models)
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+        body = _gzipped(body)
+    return StreamingResponse(body, media_type=NDJSON_MEDIA_TYPE, headers=headers)
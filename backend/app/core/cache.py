@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(
+        self,
+        max_entries: int,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[V], int]] = None,
+    ):
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        self._max_entries = max_entries
+        self._max_weight = max_weight
+        self._weigher = weigher or (lambda value: 1)
+        self._weight = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def weight(self) -> int:
+        return self._weight
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        if self._max_entries == 0:
+            return
+        weight = self._weigher(value)
+        if self._max_weight is not None and weight > self._max_weight:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._weight -= self._weigher(previous)
+            self._entries[key] = value
+            self._weight += weight
+            while len(self._entries) > self._max_entries or (
+                self._max_weight is not None and self._weight > self._max_weight
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._weight -= self._weigher(evicted)
+
+    def pop(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self._weight -= self._weigher(value)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
@@ -1,5 +1,63 @@
+import os
 from pathlib import Path
 
 SCHEMA_VERSION = 1
 STATE_PATH_ENV = "BACKEND_STATE_PATH"
 DEFAULT_STATE_PATH = Path(__file__).resolve().parents[2] / ".tmp" / "state.json"
+RUNBOOK_CODEC_ENV = "BACKEND_RUNBOOK_CODEC"
+DEFAULT_RUNBOOK_CODEC = "zlib"
+RUNBOOK_CHUNK_SIZE_ENV = "BACKEND_RUNBOOK_CHUNK_SIZE"
+DEFAULT_RUNBOOK_CHUNK_SIZE = 8192
+RUNBOOK_CACHE_SIZE_ENV = "BACKEND_RUNBOOK_CACHE_SIZE"
+DEFAULT_RUNBOOK_CACHE_SIZE = 128
+REVISION_CHECKPOINT_INTERVAL_ENV = "BACKEND_REVISION_CHECKPOINT_INTERVAL"
+DEFAULT_REVISION_CHECKPOINT_INTERVAL = 20
+JSON_CACHE_SIZE_ENV = "BACKEND_JSON_CACHE_SIZE"
+DEFAULT_JSON_CACHE_SIZE = 4096
+JSON_CACHE_BYTES_ENV = "BACKEND_JSON_CACHE_BYTES"
+DEFAULT_JSON_CACHE_BYTES = 64 * 1024 * 1024
+CHANGE_LOG_SIZE_ENV = "BACKEND_CHANGE_LOG_SIZE"
+DEFAULT_CHANGE_LOG_SIZE = 10_000
+PROFILE_TOKEN_ENV = "BACKEND_PROFILE_TOKEN"
+PROFILE_HISTORY_SIZE_ENV = "BACKEND_PROFILE_HISTORY_SIZE"
+DEFAULT_PROFILE_HISTORY_SIZE = 20
+SERVER_TIMING_ENV = "BACKEND_SERVER_TIMING"
+IDEMPOTENCY_TTL_SECONDS_ENV = "BACKEND_IDEMPOTENCY_TTL_SECONDS"
+DEFAULT_IDEMPOTENCY_TTL_SECONDS = 24 * 60 * 60
+IDEMPOTENCY_MAX_KEYS_ENV = "BACKEND_IDEMPOTENCY_MAX_KEYS"
+DEFAULT_IDEMPOTENCY_MAX_KEYS = 10_000
+ADMISSION_READ_LIMIT_ENV = "BACKEND_ADMISSION_READ_LIMIT"
+DEFAULT_ADMISSION_READ_LIMIT = 64
+ADMISSION_WRITE_LIMIT_ENV = "BACKEND_ADMISSION_WRITE_LIMIT"
+DEFAULT_ADMISSION_WRITE_LIMIT = 16
+ADMISSION_READ_QUEUE_ENV = "BACKEND_ADMISSION_READ_QUEUE"
+DEFAULT_ADMISSION_READ_QUEUE = 128
+ADMISSION_WRITE_QUEUE_ENV = "BACKEND_ADMISSION_WRITE_QUEUE"
+DEFAULT_ADMISSION_WRITE_QUEUE = 256
+ADMISSION_QUEUE_TIMEOUT_MS_ENV = "BACKEND_ADMISSION_QUEUE_TIMEOUT_MS"
+DEFAULT_ADMISSION_QUEUE_TIMEOUT_MS = 2000
+ADMISSION_RETRY_AFTER_ENV = "BACKEND_ADMISSION_RETRY_AFTER"
+DEFAULT_ADMISSION_RETRY_AFTER = 1
+MAX_BATCH_IDS = 100
+
+
+def get_int_env(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise ValueError(f"Invalid {name}: {value}") from exc
+
+
+def get_bool_env(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if not value:
+        return default
+    normalized = value.strip().lower()
+    if normalized in {"1", "true", "yes", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "off"}:
+        return False
+    raise ValueError(f"Invalid {name}: {value}")
@@ -0,0 +1,209 @@
+import math
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Iterable, Optional, Sequence
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+
+    def _check(self, labels: LabelValues) -> None:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labels}")
+
+    def samples(self) -> Iterable[tuple[str, LabelValues, float]]:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {_escape(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            names = self.labelnames + ("le",) if suffix == "_bucket" else self.labelnames
+            lines.append(f"{self.name}{suffix}{_format_labels(names, labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {} if self.labelnames else {(): 0.0}
+
+    def inc(self, amount: float = 1.0, labels: LabelValues = ()) -> None:
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        with self._lock:
+            if labels not in self._values:
+                self._check(labels)
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: LabelValues = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterable[tuple[str, LabelValues, float]]:
+        with self._lock:
+            return [("", labels, value) for labels, value in self._values.items()]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {} if self.labelnames else {(): 0.0}
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        with self._lock:
+            if labels not in self._values:
+                self._check(labels)
+            self._values[labels] = value
+
+    def inc(self, amount: float = 1.0, labels: LabelValues = ()) -> None:
+        with self._lock:
+            if labels not in self._values:
+                self._check(labels)
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, labels: LabelValues = ()) -> None:
+        self.inc(-amount, labels)
+
+    def value(self, labels: LabelValues = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterable[tuple[str, LabelValues, float]]:
+        with self._lock:
+            return [("", labels, value) for labels, value in self._values.items()]
+
+
+class CallbackGauge(_Metric):
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[tuple[LabelValues, float]]],
+        labelnames: Sequence[str] = (),
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._callback = callback
+
+    def samples(self) -> Iterable[tuple[str, LabelValues, float]]:
+        return [("", labels, value) for labels, value in self._callback()]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                self._check(labels)
+                series = self._series[labels] = [0.0] * (len(self._buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, labels: LabelValues = ()) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> Iterable[tuple[str, LabelValues, float]]:
+        with self._lock:
+            snapshot = [(labels, list(series)) for labels, series in self._series.items()]
+        result = []
+        for labels, series in snapshot:
+            cumulative = 0.0
+            for bound, count in zip((*self._buckets, math.inf), series[:-1]):
+                cumulative += count
+                result.append(("_bucket", labels + (_format_value(bound),), cumulative))
+            result.append(("_sum", labels, series[-1]))
+            result.append(("_count", labels, cumulative))
+        return result
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def gauge_callback(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[tuple[LabelValues, float]]],
+        labelnames: Sequence[str] = (),
+    ) -> CallbackGauge:
+        return self._register(CallbackGauge(name, documentation, callback, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _Metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
@@ -0,0 +1,58 @@
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+
+from app.models.profiling import ProfileReport, ProfileSummary
+
+
+class ProfileStore:
+    def __init__(self, max_entries: int = 20):
+        self._reports: deque[ProfileReport] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def add(self, report: ProfileReport) -> None:
+        with self._lock:
+            self._reports.append(report)
+
+    def summaries(self) -> list[ProfileSummary]:
+        with self._lock:
+            reports = list(self._reports)
+        return [ProfileSummary.model_validate(report.model_dump(exclude={"report"})) for report in reversed(reports)]
+
+    def get(self, profile_id: str) -> ProfileReport:
+        with self._lock:
+            for report in self._reports:
+                if report.id == profile_id:
+                    return report
+        raise KeyError(profile_id)
+
+
+def cprofile_report(profiler: cProfile.Profile, limit: int = 60) -> str:
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+    return stream.getvalue()
+
+
+def sample_stacks(seconds: float, interval: float) -> str:
+    sampler = threading.get_ident()
+    counts: Counter[str] = Counter()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == sampler:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            stack.append(names.get(ident, str(ident)))
+            counts[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+    return "\n".join(f"{stack} {count}" for stack, count in counts.most_common())
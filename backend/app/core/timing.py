@@ -0,0 +1,38 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Optional
+
+_timings: ContextVar[Optional[dict[str, float]]] = ContextVar("server_timings", default=None)
+
+
+def start_timings() -> tuple[dict[str, float], Token]:
+    timings: dict[str, float] = {}
+    return timings, _timings.set(timings)
+
+
+def reset_timings(token: Token) -> None:
+    _timings.reset(token)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + perf_counter() - started
+
+
+def format_server_timing(timings: dict[str, float], total: float) -> str:
+    entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items()]
+    remainder = total - sum(timings.values())
+    if remainder > 0:
+        entries.append(f'app;desc="routing, validation, response";dur={remainder * 1000:.2f}')
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
@@ -1,39 +1,149 @@
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import health, incidents, runbooks
-from app.core.config import DEFAULT_STATE_PATH, STATE_PATH_ENV
+from app.api import changes, health, imports, incidents, metrics, profiling, runbooks
+from app.api.admission import AdmissionMiddleware
+from app.api.metrics import MetricsMiddleware
+from app.api.profiling import ProfilingMiddleware
+from app.api.serialization import JsonFragmentCache
+from app.core.config import (
+    ADMISSION_QUEUE_TIMEOUT_MS_ENV,
+    ADMISSION_READ_LIMIT_ENV,
+    ADMISSION_READ_QUEUE_ENV,
+    ADMISSION_RETRY_AFTER_ENV,
+    ADMISSION_WRITE_LIMIT_ENV,
+    ADMISSION_WRITE_QUEUE_ENV,
+    CHANGE_LOG_SIZE_ENV,
+    DEFAULT_ADMISSION_QUEUE_TIMEOUT_MS,
+    DEFAULT_ADMISSION_READ_LIMIT,
+    DEFAULT_ADMISSION_READ_QUEUE,
+    DEFAULT_ADMISSION_RETRY_AFTER,
+    DEFAULT_ADMISSION_WRITE_LIMIT,
+    DEFAULT_ADMISSION_WRITE_QUEUE,
+    DEFAULT_CHANGE_LOG_SIZE,
+    DEFAULT_IDEMPOTENCY_MAX_KEYS,
+    DEFAULT_IDEMPOTENCY_TTL_SECONDS,
+    DEFAULT_JSON_CACHE_BYTES,
+    DEFAULT_JSON_CACHE_SIZE,
+    DEFAULT_PROFILE_HISTORY_SIZE,
+    DEFAULT_REVISION_CHECKPOINT_INTERVAL,
+    DEFAULT_RUNBOOK_CACHE_SIZE,
+    DEFAULT_RUNBOOK_CHUNK_SIZE,
+    DEFAULT_RUNBOOK_CODEC,
+    DEFAULT_STATE_PATH,
+    IDEMPOTENCY_MAX_KEYS_ENV,
+    IDEMPOTENCY_TTL_SECONDS_ENV,
+    JSON_CACHE_BYTES_ENV,
+    JSON_CACHE_SIZE_ENV,
+    PROFILE_HISTORY_SIZE_ENV,
+    PROFILE_TOKEN_ENV,
+    REVISION_CHECKPOINT_INTERVAL_ENV,
+    RUNBOOK_CACHE_SIZE_ENV,
+    RUNBOOK_CHUNK_SIZE_ENV,
+    RUNBOOK_CODEC_ENV,
+    SERVER_TIMING_ENV,
+    STATE_PATH_ENV,
+    get_bool_env,
+    get_int_env,
+)
+from app.core.metrics import MetricsRegistry
+from app.core.profiling import ProfileStore
+from app.persistence.content import RunbookContentStore
 from app.persistence.file_store import FileStateStore
+from app.persistence.revisions import RunbookRevisionStore
 from app.seed.data import seed_state
+from app.services.changes import ChangeLog
+from app.services.context import IncidentContextService
+from app.services.idempotency import IdempotencyService
+from app.services.imports import ImportService
 from app.services.incidents import IncidentService
 from app.services.runbooks import RunbookService
 
 
 def create_app(state_path: Path | None = None) -> FastAPI:
     logging.basicConfig(level=logging.INFO)
-    app = FastAPI(title="DevOps Runbook Assistant API", version="1.0.0")
-
     env_state_path = os.getenv(STATE_PATH_ENV)
     resolved_state_path = state_path or (Path(env_state_path) if env_state_path else None)
-    store = FileStateStore(path=resolved_state_path or DEFAULT_STATE_PATH, seed_provider=seed_state)
-    app.state.incident_service = IncidentService(store)
-    app.state.runbook_service = RunbookService(store)
+    registry = MetricsRegistry()
+    store = FileStateStore(
+        path=resolved_state_path or DEFAULT_STATE_PATH, seed_provider=seed_state, metrics=registry
+    )
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        await store.start()
+        try:
+            yield
+        finally:
+            await store.stop()
+
+    app = FastAPI(title="DevOps Runbook Assistant API", version="1.0.0", lifespan=lifespan)
+    app.state.metrics = registry
+    app.state.change_log = ChangeLog(max_entries=get_int_env(CHANGE_LOG_SIZE_ENV, DEFAULT_CHANGE_LOG_SIZE))
+    app.state.incident_service = IncidentService(store, app.state.change_log)
+    content = RunbookContentStore(
+        codec=os.getenv(RUNBOOK_CODEC_ENV, DEFAULT_RUNBOOK_CODEC),
+        cache_size=get_int_env(RUNBOOK_CACHE_SIZE_ENV, DEFAULT_RUNBOOK_CACHE_SIZE),
+        chunk_size=get_int_env(RUNBOOK_CHUNK_SIZE_ENV, DEFAULT_RUNBOOK_CHUNK_SIZE),
+    )
+    revisions = RunbookRevisionStore(
+        content,
+        checkpoint_interval=get_int_env(REVISION_CHECKPOINT_INTERVAL_ENV, DEFAULT_REVISION_CHECKPOINT_INTERVAL),
+    )
+    app.state.runbook_service = RunbookService(store, content, revisions, app.state.change_log)
+    app.state.context_service = IncidentContextService(app.state.incident_service, app.state.runbook_service)
+    app.state.idempotency_service = IdempotencyService(
+        store,
+        max_keys=get_int_env(IDEMPOTENCY_MAX_KEYS_ENV, DEFAULT_IDEMPOTENCY_MAX_KEYS),
+        ttl_seconds=get_int_env(IDEMPOTENCY_TTL_SECONDS_ENV, DEFAULT_IDEMPOTENCY_TTL_SECONDS),
+    )
+    app.state.import_service = ImportService(store, app.state.incident_service, app.state.runbook_service)
+    app.state.json_cache = JsonFragmentCache(
+        max_entries=get_int_env(JSON_CACHE_SIZE_ENV, DEFAULT_JSON_CACHE_SIZE),
+        max_bytes=get_int_env(JSON_CACHE_BYTES_ENV, DEFAULT_JSON_CACHE_BYTES),
+    )
+    app.state.profile_token = os.getenv(PROFILE_TOKEN_ENV) or None
+    app.state.profiles = ProfileStore(max_entries=get_int_env(PROFILE_HISTORY_SIZE_ENV, DEFAULT_PROFILE_HISTORY_SIZE))
 
+    app.add_middleware(
+        AdmissionMiddleware,
+        read_limit=get_int_env(ADMISSION_READ_LIMIT_ENV, DEFAULT_ADMISSION_READ_LIMIT),
+        write_limit=get_int_env(ADMISSION_WRITE_LIMIT_ENV, DEFAULT_ADMISSION_WRITE_LIMIT),
+        read_queue=get_int_env(ADMISSION_READ_QUEUE_ENV, DEFAULT_ADMISSION_READ_QUEUE),
+        write_queue=get_int_env(ADMISSION_WRITE_QUEUE_ENV, DEFAULT_ADMISSION_WRITE_QUEUE),
+        queue_timeout=get_int_env(ADMISSION_QUEUE_TIMEOUT_MS_ENV, DEFAULT_ADMISSION_QUEUE_TIMEOUT_MS) / 1000,
+        retry_after=get_int_env(ADMISSION_RETRY_AFTER_ENV, DEFAULT_ADMISSION_RETRY_AFTER),
+        registry=registry,
+    )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:4200", "http://127.0.0.1:4200"],
         allow_credentials=True,
         allow_methods=["*"],
-        allow_headers=["*"]
+        allow_headers=["*"],
+        expose_headers=["ETag", "Idempotent-Replayed", "Retry-After", "Server-Timing", "X-Profile-Id"],
+    )
+    app.add_middleware(
+        ProfilingMiddleware,
+        profiles=app.state.profiles,
+        token=app.state.profile_token,
+        server_timing=get_bool_env(SERVER_TIMING_ENV, False),
     )
+    app.add_middleware(MetricsMiddleware, registry=registry)
 
     app.include_router(health.router)
+    app.include_router(metrics.router)
+    app.include_router(profiling.router)
     app.include_router(incidents.router, prefix="/api/v1")
     app.include_router(runbooks.router, prefix="/api/v1")
+    app.include_router(imports.router, prefix="/api/v1")
+    app.include_router(changes.router, prefix="/api/v1")
 
     return app
 
@@ -0,0 +1,20 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+ChangeEntity = Literal["incident", "runbook"]
+ChangeOperation = Literal["create", "update", "delete"]
+
+
+class Change(BaseModel):
+    seq: int
+    entity: ChangeEntity
+    id: str
+    op: ChangeOperation
+    at: str
+
+
+class ChangeBatch(BaseModel):
+    changes: list[Change]
+    latest: int
+    reset: bool
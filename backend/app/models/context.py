@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+from app.models.incident import Incident, IncidentNote
+from app.models.runbook import RunbookSummary
+
+
+class IncidentContext(BaseModel):
+    incident: Incident
+    latestNotes: list[IncidentNote]
+    runbooks: list[RunbookSummary]
+    relatedIncidents: list[Incident]
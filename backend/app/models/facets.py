@@ -0,0 +1,18 @@
+from typing import Union
+
+from pydantic import BaseModel
+
+from app.models.incident import Incident
+from app.models.runbook import Runbook, RunbookSummary
+
+FacetCounts = dict[str, dict[str, int]]
+
+
+class IncidentPage(BaseModel):
+    items: list[Incident]
+    facets: FacetCounts
+
+
+class RunbookPage(BaseModel):
+    items: Union[list[Runbook], list[RunbookSummary]]
+    facets: FacetCounts
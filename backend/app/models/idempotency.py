@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class IdempotencyRecord(BaseModel):
+    key: str
+    fingerprint: str
+    status: int
+    body: str
+    createdAt: str
+    expiresAt: str
@@ -0,0 +1,45 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+from app.models.incident import IncidentNote, IncidentSeverity, IncidentStatus
+
+ImportRecordType = Literal["incident", "runbook"]
+ImportCommitMode = Literal["end", "chunk"]
+
+
+class IncidentImport(BaseModel):
+    id: Optional[str] = None
+    title: str
+    severity: IncidentSeverity
+    status: IncidentStatus = "Open"
+    service: str
+    createdAt: Optional[str] = None
+    updatedAt: Optional[str] = None
+    notes: list[IncidentNote] = []
+
+
+class RunbookImport(BaseModel):
+    id: Optional[str] = None
+    title: str
+    tags: list[str] = []
+    content: str
+    createdAt: Optional[str] = None
+    updatedAt: Optional[str] = None
+
+
+class ImportLineError(BaseModel):
+    line: int
+    error: str
+
+
+class ImportResult(BaseModel):
+    lines: int
+    incidents: int
+    runbooks: int
+    chunks: int
+    commits: int
+    errors: list[ImportLineError]
+    errorsTruncated: bool
+    durationSeconds: float
+    recordsPerSecond: float
@@ -0,0 +1,17 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+ProfileKind = Literal["request", "sampling"]
+
+
+class ProfileSummary(BaseModel):
+    id: str
+    kind: ProfileKind
+    target: str
+    createdAt: str
+    durationMs: float
+
+
+class ProfileReport(ProfileSummary):
+    report: str
@@ -1,17 +1,58 @@
-from typing import Optional
+from typing import Literal, Optional, Union
 
 from pydantic import BaseModel
 
+RunbookCodec = Literal["none", "zlib", "lzma"]
 
-class Runbook(BaseModel):
+
+class RunbookSummary(BaseModel):
     id: str
     title: str
     tags: list[str]
-    content: str
     createdAt: str
     updatedAt: str
 
 
+class Runbook(RunbookSummary):
+    content: str
+
+
+class RunbookContent(BaseModel):
+    codec: RunbookCodec
+    data: str
+
+
+class ContentBlob(RunbookContent):
+    refs: int = 0
+
+
+# Stored content is either a list of content-addressed chunk digests or, for
+# data written before chunking existed, a single inline encoded body.
+StoredContent = Union[list[str], RunbookContent]
+
+
+class RunbookRevisionRecord(BaseModel):
+    number: int
+    createdAt: str
+    size: int
+    checkpoint: Optional[StoredContent] = None
+    delta: Optional[list[Union[int, list[str]]]] = None
+
+
+class RunbookRevisionSummary(BaseModel):
+    number: int
+    createdAt: str
+    kind: Literal["checkpoint", "delta"]
+    size: int
+
+
+class RunbookRevision(BaseModel):
+    runbookId: str
+    number: int
+    createdAt: str
+    content: str
+
+
 class RunbookCreate(BaseModel):
     title: str
     tags: list[str]
@@ -1,10 +1,33 @@
-from pydantic import BaseModel
+from typing import Any
 
+from pydantic import BaseModel, Field, model_validator
+
+from app.models.idempotency import IdempotencyRecord
 from app.models.incident import Incident
-from app.models.runbook import Runbook
+from app.models.runbook import ContentBlob, RunbookRevisionRecord, RunbookSummary, StoredContent
 
 
 class AppState(BaseModel):
     schemaVersion: int
     incidents: list[Incident]
-    runbooks: list[Runbook]
+    runbooks: list[RunbookSummary]
+    runbookContent: dict[str, StoredContent] = Field(default_factory=dict)
+    contentBlobs: dict[str, ContentBlob] = Field(default_factory=dict)
+    runbookRevisions: dict[str, list[RunbookRevisionRecord]] = Field(default_factory=dict)
+    idempotencyKeys: dict[str, IdempotencyRecord] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_inline_runbook_content(cls, data: Any) -> Any:
+        # Older state files (and the seed data) carry runbook content inline;
+        # move it into the content table, where the content store chunks it.
+        if not isinstance(data, dict):
+            return data
+        runbooks = []
+        content = dict(data.get("runbookContent") or {})
+        for item in data.get("runbooks") or []:
+            raw = item.model_dump() if isinstance(item, BaseModel) else dict(item)
+            if "content" in raw:
+                content.setdefault(raw["id"], {"codec": "none", "data": raw.pop("content")})
+            runbooks.append(raw)
+        return {**data, "runbooks": runbooks, "runbookContent": content}
@@ -0,0 +1,182 @@
+import base64
+import hashlib
+import lzma
+import zlib
+from typing import get_args
+
+from app.core.cache import LRUCache
+from app.core.config import DEFAULT_RUNBOOK_CACHE_SIZE, DEFAULT_RUNBOOK_CHUNK_SIZE, DEFAULT_RUNBOOK_CODEC
+from app.models.runbook import ContentBlob, RunbookCodec, RunbookContent, StoredContent
+from app.models.state import AppState
+
+CODECS: tuple[str, ...] = get_args(RunbookCodec)
+_FENCES = ("```", "~~~")
+
+
+def encode_content(text: str, codec: str) -> RunbookContent:
+    if codec == "none":
+        return RunbookContent(codec="none", data=text)
+    raw = text.encode("utf-8")
+    if codec == "zlib":
+        compressed = zlib.compress(raw, 6)
+    elif codec == "lzma":
+        compressed = lzma.compress(raw, preset=6)
+    else:
+        raise ValueError(f"Unsupported runbook codec: {codec}")
+    return RunbookContent(codec=codec, data=base64.b64encode(compressed).decode("ascii"))
+
+
+def decode_content(content: RunbookContent) -> str:
+    if content.codec == "none":
+        return content.data
+    compressed = base64.b64decode(content.data)
+    if content.codec == "zlib":
+        return zlib.decompress(compressed).decode("utf-8")
+    return lzma.decompress(compressed).decode("utf-8")
+
+
+def chunk_digest(chunk: str) -> str:
+    return hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def split_chunks(text: str, chunk_size: int = DEFAULT_RUNBOOK_CHUNK_SIZE) -> list[str]:
+    # Boundaries depend only on the markdown structure: a new chunk starts at
+    # every heading outside a code fence, and long sections are cut after a
+    # blank line once they reach chunk_size. Editing one section therefore
+    # leaves the chunks of every other section unchanged.
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        if not in_fence and line.startswith("#") and current:
+            chunks.append("".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+        if line.lstrip().startswith(_FENCES):
+            in_fence = not in_fence
+        elif not in_fence and size >= chunk_size and not line.strip():
+            chunks.append("".join(current))
+            current, size = [], 0
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+class RunbookContentStore:
+    def __init__(
+        self,
+        codec: str = DEFAULT_RUNBOOK_CODEC,
+        cache_size: int = DEFAULT_RUNBOOK_CACHE_SIZE,
+        chunk_size: int = DEFAULT_RUNBOOK_CHUNK_SIZE,
+    ):
+        if codec not in CODECS:
+            raise ValueError(f"Unsupported runbook codec: {codec}")
+        self._codec = codec
+        self._chunk_size = chunk_size
+        self._cache: LRUCache[str, tuple[StoredContent, str]] = LRUCache(cache_size)
+
+    @property
+    def codec(self) -> str:
+        return self._codec
+
+    def read(self, state: AppState, runbook_id: str) -> str:
+        stored = state.runbookContent[runbook_id]
+        cached = self._cache.get(runbook_id)
+        if cached is not None and cached[0] is stored:
+            return cached[1]
+        text = self.load(state, stored)
+        self._cache.set(runbook_id, (stored, text))
+        return text
+
+    def write(self, state: AppState, runbook_id: str, text: str) -> None:
+        previous = state.runbookContent.get(runbook_id)
+        stored = self.store(state, text)
+        state.runbookContent[runbook_id] = stored
+        if previous is not None:
+            self.release(state, previous)
+        self._cache.set(runbook_id, (stored, text))
+
+    def remove(self, state: AppState, runbook_id: str) -> None:
+        stored = state.runbookContent.pop(runbook_id, None)
+        if stored is not None:
+            self.release(state, stored)
+        self._cache.pop(runbook_id)
+
+    def store(self, state: AppState, text: str) -> list[str]:
+        digests = []
+        for chunk in split_chunks(text, self._chunk_size):
+            digest = chunk_digest(chunk)
+            blob = state.contentBlobs.get(digest)
+            if blob is None:
+                blob = self._encode_blob(chunk)
+                state.contentBlobs[digest] = blob
+            blob.refs += 1
+            digests.append(digest)
+        return digests
+
+    def load(self, state: AppState, stored: StoredContent) -> str:
+        if isinstance(stored, RunbookContent):
+            return decode_content(stored)
+        return "".join(decode_content(state.contentBlobs[digest]) for digest in stored)
+
+    def release(self, state: AppState, stored: StoredContent) -> None:
+        if isinstance(stored, RunbookContent):
+            return
+        for digest in stored:
+            blob = state.contentBlobs.get(digest)
+            if blob is None:
+                continue
+            blob.refs -= 1
+            if blob.refs <= 0:
+                del state.contentBlobs[digest]
+
+    def migrate(self, state: AppState) -> bool:
+        changed = False
+        for digest, blob in list(state.contentBlobs.items()):
+            if blob.codec != self._codec:
+                encoded = self._encode_blob(decode_content(blob))
+                if encoded.codec != blob.codec:
+                    state.contentBlobs[digest] = encoded
+                    changed = True
+        for runbook_id, stored in list(state.runbookContent.items()):
+            if isinstance(stored, RunbookContent):
+                state.runbookContent[runbook_id] = self.store(state, decode_content(stored))
+                changed = True
+        for history in state.runbookRevisions.values():
+            for revision in history:
+                if isinstance(revision.checkpoint, RunbookContent):
+                    revision.checkpoint = self.store(state, decode_content(revision.checkpoint))
+                    changed = True
+        return self._recount(state) or changed
+
+    def _recount(self, state: AppState) -> bool:
+        counts: dict[str, int] = {}
+        references = [*state.runbookContent.values()] + [
+            revision.checkpoint
+            for history in state.runbookRevisions.values()
+            for revision in history
+            if revision.checkpoint is not None
+        ]
+        for stored in references:
+            if isinstance(stored, RunbookContent):
+                continue
+            for digest in stored:
+                counts[digest] = counts.get(digest, 0) + 1
+        changed = False
+        for digest, blob in list(state.contentBlobs.items()):
+            refs = counts.get(digest, 0)
+            if refs == 0:
+                del state.contentBlobs[digest]
+                changed = True
+            elif blob.refs != refs:
+                blob.refs = refs
+                changed = True
+        return changed
+
+    def _encode_blob(self, chunk: str) -> ContentBlob:
+        encoded = encode_content(chunk, self._codec)
+        if len(encoded.data) >= len(chunk):
+            return ContentBlob(codec="none", data=chunk)
+        return ContentBlob(codec=encoded.codec, data=encoded.data)
@@ -1,24 +1,151 @@
+import asyncio
 import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
 from typing import Callable
+from uuid import uuid4
 
+from app.core.metrics import MetricsRegistry
+from app.core.timing import timed
 from app.models.state import AppState
 
+_WRITE_BYTES_BUCKETS = tuple(float(1024 * 4**power) for power in range(10))
+
 
 class FileStateStore:
-    def __init__(self, path: Path, seed_provider: Callable[[], AppState], logger: logging.Logger | None = None):
+    def __init__(
+        self,
+        path: Path,
+        seed_provider: Callable[[], AppState],
+        logger: logging.Logger | None = None,
+        metrics: MetricsRegistry | None = None,
+    ):
         self._path = path
         self._seed_provider = seed_provider
         self._logger = logger or logging.getLogger(__name__)
+        self._epoch = uuid4().hex[:12]
+        self._generation = 0
+        self._persisted = 0
+        self._write_failed = False
+        self._write_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._writer: asyncio.Task[None] | None = None
+        self._dirty: asyncio.Event | None = None
+        self._waiters: list[tuple[int, asyncio.Future[None]]] = []
+        self._metrics = metrics
+        if metrics is not None:
+            self._register_metrics(metrics)
+        started = time.perf_counter()
         self._state = self._load_or_seed()
+        if metrics is not None:
+            self._load_seconds.set(time.perf_counter() - started)
+
+    @property
+    def epoch(self) -> str:
+        return self._epoch
+
+    @property
+    def version(self) -> str:
+        return f"{self._epoch}.{self._generation}"
+
+    @property
+    def writer_running(self) -> bool:
+        return self._writer is not None
 
     def get_state(self) -> AppState:
         return self._state
 
+    def snapshot(self) -> AppState:
+        state = self._state
+        return AppState.model_construct(
+            schemaVersion=state.schemaVersion,
+            incidents=list(state.incidents),
+            runbooks=list(state.runbooks),
+            runbookContent=dict(state.runbookContent),
+            contentBlobs=dict(state.contentBlobs),
+            runbookRevisions={runbook_id: list(history) for runbook_id, history in state.runbookRevisions.items()},
+            idempotencyKeys=dict(state.idempotencyKeys),
+        )
+
     def save_state(self, state: AppState) -> None:
         self._state = state
-        self._write_state(state)
+        self._generation += 1
+        if self._writer is None:
+            self._write_state(state)
+            self._persisted = self._generation
+            return
+        self._loop.call_soon_threadsafe(self._dirty.set)
+
+    async def start(self) -> None:
+        if self._writer is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._dirty = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-writer")
+        self._writer = asyncio.create_task(self._run_writer())
+        if self._persisted < self._generation:
+            self._dirty.set()
+
+    async def stop(self) -> None:
+        if self._writer is None:
+            return
+        try:
+            await self.flush()
+        finally:
+            self._writer.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._writer
+            self._writer = None
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def flush(self) -> None:
+        if self._writer is None or self._persisted >= self._generation:
+            return
+        waiter = self._loop.create_future()
+        self._waiters.append((self._generation, waiter))
+        if self._write_failed:
+            # A failed write is otherwise only retried on the next save; a waiter must not hang until then.
+            self._dirty.set()
+        with timed("persistence"):
+            await waiter
+
+    async def _run_writer(self) -> None:
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            generation = self._generation
+            snapshot = self.snapshot()
+            try:
+                await self._loop.run_in_executor(self._executor, self._write_state, snapshot)
+            except Exception as exc:  # noqa: BLE001 - surface to waiters, retry on next save
+                self._logger.exception("State write failed")
+                if self._metrics is not None:
+                    self._write_errors.inc()
+                self._write_failed = True
+                self._resolve_waiters(generation, exc)
+                continue
+            self._write_failed = False
+            self._persisted = generation
+            self._resolve_waiters(generation)
+
+    def _resolve_waiters(self, generation: int, error: Exception | None = None) -> None:
+        pending = []
+        for target, waiter in self._waiters:
+            if target > generation:
+                pending.append((target, waiter))
+            elif not waiter.done():
+                if error is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(error)
+        self._waiters = pending
 
     def _load_or_seed(self) -> AppState:
         if self._path.exists():
@@ -33,6 +160,40 @@ class FileStateStore:
         return state
 
     def _write_state(self, state: AppState) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        payload = state.model_dump(mode="json")
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        started = time.perf_counter()
+        payload = json.dumps(state.model_dump(mode="json"), indent=2).encode("utf-8")
+        temp_path = self._path.with_name(f"{self._path.name}.tmp")
+        with self._write_lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(payload)
+            os.replace(temp_path, self._path)
+        if self._metrics is not None:
+            self._write_seconds.observe(time.perf_counter() - started)
+            self._write_bytes.observe(len(payload))
+            self._file_bytes.set(len(payload))
+
+    def _register_metrics(self, metrics: MetricsRegistry) -> None:
+        self._load_seconds = metrics.gauge("state_store_load_seconds", "Time spent loading or seeding the state file.")
+        self._write_seconds = metrics.histogram(
+            "state_store_write_seconds", "Time spent serializing and writing the state file per commit."
+        )
+        self._write_bytes = metrics.histogram(
+            "state_store_write_bytes", "Bytes written per state file commit.", buckets=_WRITE_BYTES_BUCKETS
+        )
+        self._write_errors = metrics.counter("state_store_write_errors_total", "Background state writes that failed.")
+        self._file_bytes = metrics.gauge("state_store_file_bytes", "Size of the state file after the last write.")
+        metrics.gauge_callback(
+            "state_store_pending_generations",
+            "State generations saved in memory but not yet written to disk.",
+            lambda: [((), float(self._generation - self._persisted))],
+        )
+        metrics.gauge_callback("state_entities", "Entities held in the state.", self._entity_counts, ("kind",))
+
+    def _entity_counts(self) -> list[tuple[tuple[str, ...], float]]:
+        state = self._state
+        return [
+            (("incident",), float(len(state.incidents))),
+            (("runbook",), float(len(state.runbooks))),
+            (("content_blob",), float(len(state.contentBlobs))),
+            (("runbook_revision",), float(sum(len(history) for history in state.runbookRevisions.values()))),
+        ]
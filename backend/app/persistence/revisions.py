@@ -0,0 +1,121 @@
+import json
+from difflib import SequenceMatcher
+from typing import Optional, Union
+
+from app.core.config import DEFAULT_REVISION_CHECKPOINT_INTERVAL
+from app.models.runbook import RunbookRevision, RunbookRevisionRecord, RunbookRevisionSummary
+from app.models.state import AppState
+from app.persistence.content import RunbookContentStore
+
+# A delta is a list of ops applied to the previous revision's lines: a positive
+# int copies that many lines, a negative int skips them, and a list of strings
+# inserts those lines.
+Delta = list[Union[int, list[str]]]
+
+
+def compute_delta(previous: list[str], current: list[str]) -> Delta:
+    ops: Delta = []
+    matcher = SequenceMatcher(None, previous, current)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(i2 - i1)
+            continue
+        if tag in ("delete", "replace"):
+            ops.append(i1 - i2)
+        if tag in ("insert", "replace"):
+            ops.append(current[j1:j2])
+    return ops
+
+
+def apply_delta(previous: list[str], delta: Delta) -> list[str]:
+    lines: list[str] = []
+    position = 0
+    for op in delta:
+        if isinstance(op, list):
+            lines.extend(op)
+        elif op > 0:
+            lines.extend(previous[position : position + op])
+            position += op
+        else:
+            position -= op
+    return lines
+
+
+class RunbookRevisionStore:
+    def __init__(
+        self,
+        content: Optional[RunbookContentStore] = None,
+        checkpoint_interval: int = DEFAULT_REVISION_CHECKPOINT_INTERVAL,
+    ):
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be >= 1")
+        self._content = content or RunbookContentStore()
+        self._checkpoint_interval = checkpoint_interval
+
+    def record(
+        self, state: AppState, runbook_id: str, previous: Optional[str], content: str, created_at: str
+    ) -> RunbookRevisionRecord:
+        history = state.runbookRevisions.setdefault(runbook_id, [])
+        if (
+            previous is None
+            or not history
+            or self._deltas_since_checkpoint(history) + 1 >= self._checkpoint_interval
+        ):
+            return self._append_checkpoint(state, history, content, created_at)
+        delta = compute_delta(previous.splitlines(keepends=True), content.splitlines(keepends=True))
+        size = len(json.dumps(delta, separators=(",", ":")))
+        if size >= len(content) // 2:
+            return self._append_checkpoint(state, history, content, created_at)
+        revision = RunbookRevisionRecord(number=len(history) + 1, createdAt=created_at, size=size, delta=delta)
+        history.append(revision)
+        return revision
+
+    def list_revisions(self, state: AppState, runbook_id: str) -> list[RunbookRevisionSummary]:
+        return [
+            RunbookRevisionSummary(
+                number=revision.number,
+                createdAt=revision.createdAt,
+                kind="checkpoint" if revision.checkpoint is not None else "delta",
+                size=revision.size,
+            )
+            for revision in state.runbookRevisions.get(runbook_id, [])
+        ]
+
+    def reconstruct(self, state: AppState, runbook_id: str, number: int) -> RunbookRevision:
+        history = state.runbookRevisions.get(runbook_id, [])
+        if number < 1 or number > len(history):
+            raise KeyError(number)
+        start = number - 1
+        while history[start].checkpoint is None:
+            start -= 1
+        lines = self._content.load(state, history[start].checkpoint).splitlines(keepends=True)
+        for revision in history[start + 1 : number]:
+            lines = apply_delta(lines, revision.delta or [])
+        target = history[number - 1]
+        return RunbookRevision(
+            runbookId=runbook_id, number=target.number, createdAt=target.createdAt, content="".join(lines)
+        )
+
+    def remove(self, state: AppState, runbook_id: str) -> None:
+        for revision in state.runbookRevisions.pop(runbook_id, []):
+            if revision.checkpoint is not None:
+                self._content.release(state, revision.checkpoint)
+
+    def _append_checkpoint(
+        self, state: AppState, history: list[RunbookRevisionRecord], content: str, created_at: str
+    ) -> RunbookRevisionRecord:
+        checkpoint = self._content.store(state, content)
+        size = sum(len(state.contentBlobs[digest].data) for digest in checkpoint)
+        revision = RunbookRevisionRecord(
+            number=len(history) + 1, createdAt=created_at, size=size, checkpoint=checkpoint
+        )
+        history.append(revision)
+        return revision
+
+    def _deltas_since_checkpoint(self, history: list[RunbookRevisionRecord]) -> int:
+        count = 0
+        for revision in reversed(history):
+            if revision.checkpoint is not None:
+                break
+            count += 1
+        return count
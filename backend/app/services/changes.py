@@ -0,0 +1,65 @@
+import asyncio
+from collections import deque
+from datetime import datetime, timezone
+from threading import Lock
+
+from app.models.changes import Change, ChangeBatch, ChangeEntity, ChangeOperation
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class ChangeLog:
+    def __init__(self, max_entries: int = 10_000):
+        self._entries: deque[Change] = deque(maxlen=max_entries)
+        self._seq = 0
+        self._lock = Lock()
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def latest(self) -> int:
+        return self._seq
+
+    def append(self, entity: ChangeEntity, entity_id: str, op: ChangeOperation) -> Change:
+        with self._lock:
+            self._seq += 1
+            change = Change(seq=self._seq, entity=entity, id=entity_id, op=op, at=_now_iso())
+            self._entries.append(change)
+            waiters = list(self._waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                continue
+        return change
+
+    def since(self, seq: int, limit: int = 1000) -> ChangeBatch:
+        with self._lock:
+            latest = self._seq
+            oldest = self._entries[0].seq if self._entries else latest + 1
+            # A cursor ahead of the log (e.g. after a restart) or older than the
+            # retained window cannot be served incrementally; clients must resync.
+            if seq > latest or seq < oldest - 1:
+                return ChangeBatch(changes=[], latest=latest, reset=True)
+            start = seq - oldest + 1
+            changes = [self._entries[index] for index in range(start, min(start + limit, len(self._entries)))]
+        return ChangeBatch(changes=changes, latest=latest, reset=False)
+
+    async def wait(self, seq: int, timeout: float, limit: int = 1000) -> ChangeBatch:
+        batch = self.since(seq, limit)
+        if batch.changes or batch.reset or timeout <= 0:
+            return batch
+        event = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), event)
+        with self._lock:
+            self._waiters.add(waiter)
+        try:
+            if self._seq == seq:
+                await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+        return self.since(seq, limit)
@@ -0,0 +1,30 @@
+import re
+
+from app.models.context import IncidentContext
+from app.services.incidents import IncidentService
+from app.services.runbooks import RunbookService
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def service_tags(service: str) -> set[str]:
+    name = service.strip().lower()
+    words = {word for word in _NON_ALNUM.split(name) if len(word) > 2}
+    return {name, _NON_ALNUM.sub("-", name).strip("-"), *words} - {""}
+
+
+class IncidentContextService:
+    def __init__(self, incident_service: IncidentService, runbook_service: RunbookService):
+        self._incident_service = incident_service
+        self._runbook_service = runbook_service
+
+    def get_context(
+        self, incident_id: str, notes: int = 5, runbooks: int = 5, related: int = 10
+    ) -> IncidentContext:
+        incident = self._incident_service.get_incident(incident_id)
+        return IncidentContext(
+            incident=incident,
+            latestNotes=list(reversed(incident.notes[-notes:])) if notes else [],
+            runbooks=self._runbook_service.runbooks_for_tags(service_tags(incident.service), limit=runbooks),
+            relatedIncidents=self._incident_service.related_open_incidents(incident, limit=related),
+        )
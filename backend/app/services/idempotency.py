@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.models.idempotency import IdempotencyRecord
+from app.models.state import AppState
+from app.persistence.file_store import FileStateStore
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class IdempotencyConflictError(ValueError):
+    pass
+
+
+class IdempotencyService:
+    def __init__(self, store: FileStateStore, max_keys: int = 10_000, ttl_seconds: int = 24 * 60 * 60):
+        self._store = store
+        self._max_keys = max_keys
+        self._ttl = timedelta(seconds=ttl_seconds)
+
+    def lookup(self, key: str, fingerprint: str) -> Optional[IdempotencyRecord]:
+        state = self._store.get_state()
+        self._evict(state, _now())
+        record = state.idempotencyKeys.get(key)
+        if record is None:
+            return None
+        if record.fingerprint != fingerprint:
+            raise IdempotencyConflictError(key)
+        return record
+
+    def remember(self, key: str, fingerprint: str, status: int, body: str) -> IdempotencyRecord:
+        state = self._store.get_state()
+        now = _now()
+        record = IdempotencyRecord(
+            key=key,
+            fingerprint=fingerprint,
+            status=status,
+            body=body,
+            createdAt=_iso(now),
+            expiresAt=_iso(now + self._ttl),
+        )
+        state.idempotencyKeys.pop(key, None)
+        state.idempotencyKeys[key] = record
+        self._evict(state, now)
+        self._store.save_state(state)
+        return record
+
+    def _evict(self, state: AppState, now: datetime) -> None:
+        keys = state.idempotencyKeys
+        while keys:
+            oldest = next(iter(keys))
+            if len(keys) <= self._max_keys and datetime.fromisoformat(keys[oldest].expiresAt) > now:
+                break
+            del keys[oldest]
@@ -0,0 +1,158 @@
+import json
+import time
+from typing import Optional, Union
+
+from pydantic import ValidationError
+
+from app.models.imports import (
+    ImportCommitMode,
+    ImportLineError,
+    ImportRecordType,
+    ImportResult,
+    IncidentImport,
+    RunbookImport,
+)
+from app.persistence.file_store import FileStateStore
+from app.services.incidents import IncidentService
+from app.services.runbooks import RunbookService
+
+ImportRecord = Union[IncidentImport, RunbookImport]
+_RECORD_MODELS: dict[str, type[ImportRecord]] = {"incident": IncidentImport, "runbook": RunbookImport}
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}" for error in exc.errors()
+    )
+
+
+class ImportJob:
+    def __init__(
+        self,
+        service: "ImportService",
+        default_type: Optional[ImportRecordType],
+        chunk_size: int,
+        commit: ImportCommitMode,
+        max_errors: int,
+    ):
+        self._service = service
+        self._default_type = default_type
+        self._chunk_size = chunk_size
+        self._commit = commit
+        self._max_errors = max_errors
+        self._known_ids = service.existing_ids()
+        self._pending: list[tuple[int, ImportRecord]] = []
+        self._errors: list[ImportLineError] = []
+        self._error_count = 0
+        self._started = time.perf_counter()
+        self.lines = 0
+        self.incidents = 0
+        self.runbooks = 0
+        self.chunks = 0
+        self.commits = 0
+
+    @property
+    def chunk_ready(self) -> bool:
+        return len(self._pending) >= self._chunk_size
+
+    def add_line(self, raw: bytes) -> None:
+        self.lines += 1
+        if not raw.strip():
+            return
+        try:
+            record = self._parse(raw)
+        except ValueError as exc:
+            self._error(self.lines, str(exc))
+            return
+        if record.id is not None:
+            if record.id in self._known_ids:
+                self._error(self.lines, f"id already exists: {record.id}")
+                return
+            self._known_ids.add(record.id)
+        self._pending.append((self.lines, record))
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        incidents = [record for _, record in self._pending if isinstance(record, IncidentImport)]
+        runbooks = [record for _, record in self._pending if isinstance(record, RunbookImport)]
+        self._pending = []
+        self._service.apply(incidents, runbooks)
+        self.incidents += len(incidents)
+        self.runbooks += len(runbooks)
+        self.chunks += 1
+        if self._commit == "chunk":
+            self._service.commit()
+            self.commits += 1
+
+    def finish(self) -> ImportResult:
+        self.flush()
+        if self._commit == "end" and self.chunks:
+            self._service.commit()
+            self.commits += 1
+        duration = time.perf_counter() - self._started
+        records = self.incidents + self.runbooks
+        return ImportResult(
+            lines=self.lines,
+            incidents=self.incidents,
+            runbooks=self.runbooks,
+            chunks=self.chunks,
+            commits=self.commits,
+            errors=self._errors,
+            errorsTruncated=self._error_count > len(self._errors),
+            durationSeconds=round(duration, 6),
+            recordsPerSecond=round(records / duration, 1) if duration > 0 else 0.0,
+        )
+
+    def _parse(self, raw: bytes) -> ImportRecord:
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON: {exc.msg}") from exc
+        if not isinstance(data, dict):
+            raise ValueError("record must be a JSON object")
+        record_type = data.pop("type", None) or self._default_type
+        model = _RECORD_MODELS.get(record_type or "")
+        if model is None:
+            raise ValueError("record type must be 'incident' or 'runbook'")
+        try:
+            return model.model_validate(data)
+        except ValidationError as exc:
+            raise ValueError(_format_validation_error(exc)) from exc
+
+    def _error(self, line: int, message: str) -> None:
+        self._error_count += 1
+        if len(self._errors) < self._max_errors:
+            self._errors.append(ImportLineError(line=line, error=message))
+
+
+class ImportService:
+    def __init__(self, store: FileStateStore, incident_service: IncidentService, runbook_service: RunbookService):
+        self._store = store
+        self._incident_service = incident_service
+        self._runbook_service = runbook_service
+
+    def start(
+        self,
+        default_type: Optional[ImportRecordType] = None,
+        chunk_size: int = 1000,
+        commit: ImportCommitMode = "end",
+        max_errors: int = 100,
+    ) -> ImportJob:
+        return ImportJob(self, default_type, chunk_size, commit, max_errors)
+
+    def existing_ids(self) -> set[str]:
+        state = self._store.get_state()
+        return {incident.id for incident in state.incidents} | {runbook.id for runbook in state.runbooks}
+
+    def apply(self, incidents: list[IncidentImport], runbooks: list[RunbookImport]) -> None:
+        if incidents:
+            self._incident_service.import_incidents(incidents)
+        if runbooks:
+            self._runbook_service.import_runbooks(runbooks)
+
+    def commit(self) -> None:
+        self._store.save_state(self._store.get_state())
+
+    async def flush(self) -> None:
+        await self._store.flush()
@@ -1,9 +1,13 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import uuid4
 
+from app.models.imports import IncidentImport
 from app.models.incident import Incident, IncidentCreate, IncidentNote, IncidentNoteCreate, IncidentUpdate
+from app.models.changes import ChangeOperation
 from app.persistence.file_store import FileStateStore
+from app.services.changes import ChangeLog
+from app.services.indexes import incident_index
 
 
 def _now_iso() -> str:
@@ -16,9 +20,43 @@ def _matches_term(value: str, term: Optional[str]) -> bool:
     return term.lower() in value.lower()
 
 
+INCIDENT_FACETS = ("status", "severity", "service")
+
+
+def _matches_filters(
+    incident: Incident,
+    q: Optional[str],
+    status: Optional[str],
+    severity: Optional[str],
+    service: Optional[str],
+) -> bool:
+    return (
+        (_matches_term(incident.title, q) or _matches_term(incident.service, q))
+        and (not status or incident.status == status)
+        and (not severity or incident.severity == severity)
+        and (not service or incident.service == service)
+    )
+
+
 class IncidentService:
-    def __init__(self, store: FileStateStore):
+    def __init__(self, store: FileStateStore, changes: Optional[ChangeLog] = None):
         self._store = store
+        self._changes = changes
+        self._index = incident_index()
+        self.reindex()
+
+    @property
+    def version(self) -> str:
+        return self._store.version
+
+    def entity_version(self, entity: Incident) -> str:
+        return f"{entity.updatedAt}:{self._store.epoch}.{self._index.revisions.get(entity.id, 0)}"
+
+    async def flush(self) -> None:
+        await self._store.flush()
+
+    def reindex(self) -> None:
+        self._index.rebuild(self._store.get_state().incidents)
 
     def list_incidents(
         self,
@@ -26,27 +64,70 @@ class IncidentService:
         status: Optional[str] = None,
         severity: Optional[str] = None,
         service: Optional[str] = None,
+        ids: Optional[list[str]] = None,
     ) -> list[Incident]:
+        if ids is not None:
+            return [
+                incident
+                for incident in self.get_incidents(ids)
+                if _matches_filters(incident, q, status, severity, service)
+            ]
         incidents = self._store.get_state().incidents
         filtered = [
-            incident
-            for incident in incidents
-            if _matches_term(incident.title, q)
-            or _matches_term(incident.service, q)
+            incident for incident in incidents if _matches_filters(incident, q, status, severity, service)
         ]
-        if status:
-            filtered = [incident for incident in filtered if incident.status == status]
-        if severity:
-            filtered = [incident for incident in filtered if incident.severity == severity]
-        if service:
-            filtered = [incident for incident in filtered if incident.service == service]
         return sorted(filtered, key=lambda incident: incident.createdAt, reverse=True)
 
+    def facet_counts(
+        self,
+        q: Optional[str] = None,
+        status: Optional[str] = None,
+        severity: Optional[str] = None,
+        service: Optional[str] = None,
+        ids: Optional[list[str]] = None,
+    ) -> dict[str, dict[str, int]]:
+        postings = self._index.postings
+        within: Optional[set[str]] = None if ids is None else set(ids) & self._index.by_id.keys()
+        for field, value in (("status", status), ("severity", severity), ("service", service)):
+            if value:
+                within = postings[field].get(value) if within is None else within & postings[field].get(value)
+        if q:
+            candidates = self._index.by_id if within is None else within
+            within = {
+                incident_id
+                for incident_id in candidates
+                if _matches_filters(self._index.get(incident_id), q, None, None, None)
+            }
+        return {field: postings[field].counts(within=within) for field in INCIDENT_FACETS}
+
+    def export_incidents(
+        self,
+        q: Optional[str] = None,
+        status: Optional[str] = None,
+        severity: Optional[str] = None,
+        service: Optional[str] = None,
+    ) -> Iterator[Incident]:
+        snapshot = self._store.snapshot()
+        return (
+            incident
+            for incident in snapshot.incidents
+            if _matches_filters(incident, q, status, severity, service)
+        )
+
     def get_incident(self, incident_id: str) -> Incident:
-        for incident in self._store.get_state().incidents:
-            if incident.id == incident_id:
-                return incident
-        raise KeyError(incident_id)
+        return self._index.get(incident_id)
+
+    def get_incidents(self, ids: list[str]) -> list[Incident]:
+        by_id = self._index.by_id
+        return [by_id[incident_id] for incident_id in dict.fromkeys(ids) if incident_id in by_id]
+
+    def related_open_incidents(self, incident: Incident, limit: int = 10) -> list[Incident]:
+        postings = self._index.postings
+        ids = (postings["service"].get(incident.service) & postings["status"].get("Open")) - {incident.id}
+        related = sorted(
+            (self._index.get(related_id) for related_id in ids), key=lambda item: item.createdAt, reverse=True
+        )
+        return related[:limit]
 
     def create_incident(self, payload: IncidentCreate) -> Incident:
         now = _now_iso()
@@ -62,9 +143,33 @@ class IncidentService:
         )
         state = self._store.get_state()
         state.incidents.insert(0, incident)
+        self._index.add(incident)
         self._store.save_state(state)
+        self._record("create", incident.id)
         return incident
 
+    def import_incidents(self, records: list[IncidentImport]) -> list[Incident]:
+        now = _now_iso()
+        incidents = [
+            Incident(
+                id=record.id or str(uuid4()),
+                title=record.title,
+                severity=record.severity,
+                status=record.status,
+                service=record.service,
+                createdAt=record.createdAt or now,
+                updatedAt=record.updatedAt or record.createdAt or now,
+                notes=record.notes,
+            )
+            for record in records
+        ]
+        state = self._store.get_state()
+        state.incidents[0:0] = incidents
+        for incident in incidents:
+            self._index.add(incident)
+            self._record("create", incident.id)
+        return incidents
+
     def update_incident(self, incident_id: str, payload: IncidentUpdate) -> Incident:
         state = self._store.get_state()
         for index, incident in enumerate(state.incidents):
@@ -79,7 +184,9 @@ class IncidentService:
                     }
                 )
                 state.incidents[index] = updated
+                self._index.add(updated)
                 self._store.save_state(state)
+                self._record("update", incident_id)
                 return updated
         raise KeyError(incident_id)
 
@@ -89,7 +196,9 @@ class IncidentService:
         if len(next_incidents) == len(state.incidents):
             raise KeyError(incident_id)
         state.incidents = next_incidents
+        self._index.remove(incident_id)
         self._store.save_state(state)
+        self._record("delete", incident_id)
 
     def add_note(self, incident_id: str, payload: IncidentNoteCreate) -> Incident:
         state = self._store.get_state()
@@ -103,7 +212,9 @@ class IncidentService:
                     }
                 )
                 state.incidents[index] = updated
+                self._index.add(updated)
                 self._store.save_state(state)
+                self._record("update", incident_id)
                 return updated
         raise KeyError(incident_id)
 
@@ -119,6 +230,12 @@ class IncidentService:
             if incident.id == incident_id:
                 updated = incident.model_copy(update={"status": status, "updatedAt": _now_iso()})
                 state.incidents[index] = updated
+                self._index.add(updated)
                 self._store.save_state(state)
+                self._record("update", incident_id)
                 return updated
         raise KeyError(incident_id)
+
+    def _record(self, op: ChangeOperation, incident_id: str) -> None:
+        if self._changes is not None:
+            self._changes.append("incident", incident_id, op)
@@ -0,0 +1,92 @@
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+from app.models.incident import Incident
+from app.models.runbook import RunbookSummary
+
+T = TypeVar("T", Incident, RunbookSummary)
+
+
+class Postings:
+    def __init__(self) -> None:
+        self._postings: dict[str, set[str]] = {}
+
+    def add(self, value: str, entity_id: str) -> None:
+        self._postings.setdefault(value, set()).add(entity_id)
+
+    def remove(self, value: str, entity_id: str) -> None:
+        ids = self._postings.get(value)
+        if ids is None:
+            return
+        ids.discard(entity_id)
+        if not ids:
+            del self._postings[value]
+
+    def get(self, value: str) -> set[str]:
+        return self._postings.get(value, set())
+
+    def values(self) -> list[str]:
+        return list(self._postings)
+
+    def counts(self, within: Optional[set[str]] = None) -> dict[str, int]:
+        if within is None:
+            return {value: len(ids) for value, ids in self._postings.items()}
+        counts = {value: len(ids & within) for value, ids in self._postings.items()}
+        return {value: count for value, count in counts.items() if count}
+
+
+class EntityIndex(Generic[T]):
+    def __init__(self, fields: dict[str, Callable[[T], Iterable[str]]]):
+        self._fields = fields
+        self.by_id: dict[str, T] = {}
+        self.postings: dict[str, Postings] = {name: Postings() for name in fields}
+        # Every add gets a fresh revision, so an entity deleted and re-imported with the
+        # same id and updatedAt is still told apart from the copy it replaced.
+        self.revisions: dict[str, int] = {}
+        self._revision = 0
+
+    def rebuild(self, entities: Iterable[T]) -> None:
+        self.by_id = {}
+        self.revisions = {}
+        self.postings = {name: Postings() for name in self._fields}
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, entity: T) -> None:
+        self.remove(entity.id)
+        self.by_id[entity.id] = entity
+        self._revision += 1
+        self.revisions[entity.id] = self._revision
+        for name, extract in self._fields.items():
+            for value in extract(entity):
+                self.postings[name].add(value, entity.id)
+
+    def remove(self, entity_id: str) -> None:
+        entity = self.by_id.pop(entity_id, None)
+        self.revisions.pop(entity_id, None)
+        if entity is None:
+            return
+        for name, extract in self._fields.items():
+            for value in extract(entity):
+                self.postings[name].remove(value, entity_id)
+
+    def get(self, entity_id: str) -> T:
+        return self.by_id[entity_id]
+
+
+def incident_index() -> EntityIndex[Incident]:
+    return EntityIndex(
+        {
+            "status": lambda incident: (incident.status,),
+            "severity": lambda incident: (incident.severity,),
+            "service": lambda incident: (incident.service,),
+        }
+    )
+
+
+def runbook_index() -> EntityIndex[RunbookSummary]:
+    return EntityIndex(
+        {
+            "tag": lambda runbook: set(runbook.tags),
+            "tag_lower": lambda runbook: {tag.lower() for tag in runbook.tags},
+        }
+    )
@@ -1,9 +1,23 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional, Union
 from uuid import uuid4
 
-from app.models.runbook import Runbook, RunbookCreate, RunbookUpdate
+from app.models.changes import ChangeOperation
+from app.models.imports import RunbookImport
+from app.models.runbook import (
+    Runbook,
+    RunbookCreate,
+    RunbookRevision,
+    RunbookRevisionSummary,
+    RunbookSummary,
+    RunbookUpdate,
+)
+from app.models.state import AppState
+from app.persistence.content import RunbookContentStore
 from app.persistence.file_store import FileStateStore
+from app.persistence.revisions import RunbookRevisionStore
+from app.services.changes import ChangeLog
+from app.services.indexes import runbook_index
 
 
 def _now_iso() -> str:
@@ -16,42 +30,154 @@ def _matches_term(value: str, term: Optional[str]) -> bool:
     return term.lower() in value.lower()
 
 
+def _matches_filters(runbook: RunbookSummary, q: Optional[str], tag: Optional[str]) -> bool:
+    return (
+        _matches_term(runbook.title, q) or any(_matches_term(tag_value, q) for tag_value in runbook.tags)
+    ) and (not tag or tag in runbook.tags)
+
+
 class RunbookService:
-    def __init__(self, store: FileStateStore):
+    def __init__(
+        self,
+        store: FileStateStore,
+        content: Optional[RunbookContentStore] = None,
+        revisions: Optional[RunbookRevisionStore] = None,
+        changes: Optional[ChangeLog] = None,
+    ):
         self._store = store
+        self._changes = changes
+        self._content = content or RunbookContentStore()
+        self._revisions = revisions or RunbookRevisionStore(self._content)
+        self._index = runbook_index()
+        state = self._store.get_state()
+        if self._content.migrate(state):
+            self._store.save_state(state)
+        self.reindex()
+
+    @property
+    def version(self) -> str:
+        return self._store.version
+
+    def entity_version(self, entity: RunbookSummary) -> str:
+        return f"{entity.updatedAt}:{self._store.epoch}.{self._index.revisions.get(entity.id, 0)}"
+
+    async def flush(self) -> None:
+        await self._store.flush()
+
+    def reindex(self) -> None:
+        self._index.rebuild(self._store.get_state().runbooks)
 
-    def list_runbooks(self, q: Optional[str] = None, tag: Optional[str] = None) -> list[Runbook]:
-        runbooks = self._store.get_state().runbooks
-        filtered = [
-            runbook
-            for runbook in runbooks
-            if _matches_term(runbook.title, q)
-            or any(_matches_term(tag_value, q) for tag_value in runbook.tags)
-        ]
+    def list_runbooks(
+        self,
+        q: Optional[str] = None,
+        tag: Optional[str] = None,
+        include_content: bool = True,
+        ids: Optional[list[str]] = None,
+    ) -> list[Union[Runbook, RunbookSummary]]:
+        if ids is not None:
+            ordered = [runbook for runbook in self.get_runbook_summaries(ids) if _matches_filters(runbook, q, tag)]
+        else:
+            runbooks = self._store.get_state().runbooks
+            filtered = [runbook for runbook in runbooks if _matches_filters(runbook, q, tag)]
+            ordered = sorted(filtered, key=lambda runbook: runbook.updatedAt, reverse=True)
+        if not include_content:
+            return ordered
+        return [self.with_content(runbook) for runbook in ordered]
+
+    def facet_counts(
+        self, q: Optional[str] = None, tag: Optional[str] = None, ids: Optional[list[str]] = None
+    ) -> dict[str, dict[str, int]]:
+        postings = self._index.postings["tag"]
+        within: Optional[set[str]] = None if ids is None else set(ids) & self._index.by_id.keys()
         if tag:
-            filtered = [runbook for runbook in filtered if tag in runbook.tags]
-        return sorted(filtered, key=lambda runbook: runbook.updatedAt, reverse=True)
+            within = postings.get(tag) if within is None else within & postings.get(tag)
+        if q:
+            candidates = self._index.by_id if within is None else within
+            within = {
+                runbook_id
+                for runbook_id in candidates
+                if _matches_filters(self._index.get(runbook_id), q, None)
+            }
+        return {"tag": postings.counts(within=within)}
+
+    def export_runbooks(
+        self, q: Optional[str] = None, tag: Optional[str] = None, include_content: bool = True
+    ) -> Iterator[Union[Runbook, RunbookSummary]]:
+        snapshot = self._store.snapshot()
+        matches = (runbook for runbook in snapshot.runbooks if _matches_filters(runbook, q, tag))
+        if not include_content:
+            return matches
+        return (
+            Runbook(
+                **runbook.model_dump(),
+                content=self._content.load(snapshot, snapshot.runbookContent[runbook.id]),
+            )
+            for runbook in matches
+        )
 
     def get_runbook(self, runbook_id: str) -> Runbook:
-        for runbook in self._store.get_state().runbooks:
-            if runbook.id == runbook_id:
-                return runbook
-        raise KeyError(runbook_id)
+        return self.with_content(self.get_runbook_summary(runbook_id))
+
+    def get_runbook_summary(self, runbook_id: str) -> RunbookSummary:
+        return self._index.get(runbook_id)
+
+    def get_runbook_summaries(self, ids: list[str]) -> list[RunbookSummary]:
+        by_id = self._index.by_id
+        return [by_id[runbook_id] for runbook_id in dict.fromkeys(ids) if runbook_id in by_id]
+
+    def runbooks_for_tags(self, tags: set[str], limit: int = 5) -> list[RunbookSummary]:
+        postings = self._index.postings["tag_lower"]
+        scores: dict[str, int] = {}
+        for tag in tags:
+            for runbook_id in postings.get(tag.lower()):
+                scores[runbook_id] = scores.get(runbook_id, 0) + 1
+        matches = sorted(
+            (self._index.get(runbook_id) for runbook_id in scores),
+            key=lambda runbook: runbook.updatedAt,
+            reverse=True,
+        )
+        matches.sort(key=lambda runbook: scores[runbook.id], reverse=True)
+        return matches[:limit]
 
     def create_runbook(self, payload: RunbookCreate) -> Runbook:
         now = _now_iso()
-        runbook = Runbook(
+        runbook = RunbookSummary(
             id=str(uuid4()),
             title=payload.title,
             tags=payload.tags,
-            content=payload.content,
             createdAt=now,
             updatedAt=now,
         )
         state = self._store.get_state()
+        self._content.write(state, runbook.id, payload.content)
+        self._revisions.record(state, runbook.id, None, payload.content, now)
         state.runbooks.insert(0, runbook)
+        self._index.add(runbook)
         self._store.save_state(state)
-        return runbook
+        self._record("create", runbook.id)
+        return Runbook(**runbook.model_dump(), content=payload.content)
+
+    def import_runbooks(self, records: list[RunbookImport]) -> list[RunbookSummary]:
+        now = _now_iso()
+        state = self._store.get_state()
+        runbooks = []
+        for record in records:
+            created_at = record.createdAt or now
+            runbook = RunbookSummary(
+                id=record.id or str(uuid4()),
+                title=record.title,
+                tags=record.tags,
+                createdAt=created_at,
+                updatedAt=record.updatedAt or created_at,
+            )
+            self._content.write(state, runbook.id, record.content)
+            self._revisions.record(state, runbook.id, None, record.content, runbook.updatedAt)
+            runbooks.append(runbook)
+        state.runbooks[0:0] = runbooks
+        for runbook in runbooks:
+            self._index.add(runbook)
+            self._record("create", runbook.id)
+        return runbooks
 
     def update_runbook(self, runbook_id: str, payload: RunbookUpdate) -> Runbook:
         state = self._store.get_state()
@@ -61,13 +187,16 @@ class RunbookService:
                     update={
                         "title": payload.title or runbook.title,
                         "tags": payload.tags if payload.tags is not None else runbook.tags,
-                        "content": payload.content or runbook.content,
                         "updatedAt": _now_iso(),
                     }
                 )
+                if payload.content:
+                    self._write_content(state, runbook, payload.content, updated.updatedAt)
                 state.runbooks[index] = updated
+                self._index.add(updated)
                 self._store.save_state(state)
-                return updated
+                self._record("update", runbook_id)
+                return self.with_content(updated)
         raise KeyError(runbook_id)
 
     def delete_runbook(self, runbook_id: str) -> None:
@@ -76,4 +205,37 @@ class RunbookService:
         if len(next_runbooks) == len(state.runbooks):
             raise KeyError(runbook_id)
         state.runbooks = next_runbooks
+        self._index.remove(runbook_id)
+        self._content.remove(state, runbook_id)
+        self._revisions.remove(state, runbook_id)
         self._store.save_state(state)
+        self._record("delete", runbook_id)
+
+    def list_revisions(self, runbook_id: str) -> list[RunbookRevisionSummary]:
+        state = self._store.get_state()
+        if runbook_id not in state.runbookContent:
+            raise KeyError(runbook_id)
+        return self._revisions.list_revisions(state, runbook_id)
+
+    def get_revision(self, runbook_id: str, number: int) -> RunbookRevision:
+        state = self._store.get_state()
+        if runbook_id not in state.runbookContent:
+            raise KeyError(runbook_id)
+        return self._revisions.reconstruct(state, runbook_id, number)
+
+    def with_content(self, runbook: RunbookSummary) -> Runbook:
+        content = self._content.read(self._store.get_state(), runbook.id)
+        return Runbook(**runbook.model_dump(), content=content)
+
+    def _write_content(self, state: AppState, runbook: RunbookSummary, content: str, updated_at: str) -> None:
+        previous = self._content.read(state, runbook.id)
+        if content == previous:
+            return
+        if not state.runbookRevisions.get(runbook.id):
+            self._revisions.record(state, runbook.id, None, previous, runbook.updatedAt)
+        self._content.write(state, runbook.id, content)
+        self._revisions.record(state, runbook.id, previous, content, updated_at)
+
+    def _record(self, op: ChangeOperation, runbook_id: str) -> None:
+        if self._changes is not None:
+            self._changes.append("runbook", runbook_id, op)
@@ -0,0 +1,158 @@
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException, Response
+
+from app.api.dependencies import get_incident_service, get_json_cache
+from app.api.serialization import JsonFragmentCache, json_bytes_response
+from app.main import create_app
+from app.models.incident import Incident, IncidentNoteCreate
+from app.services.incidents import IncidentService
+
+INCIDENTS_ENV = "BENCHMARK_INCIDENTS"
+
+
+def build_app() -> FastAPI:
+    app = create_app()
+    incident_service: IncidentService = app.state.incident_service
+    store = incident_service._store
+    state = store.get_state()
+    template = state.incidents[0]
+    for index in range(int(os.getenv(INCIDENTS_ENV, "1000"))):
+        state.incidents.append(template.model_copy(update={"id": f"incident-{index}", "notes": []}))
+    store.save_state(state)
+    incident_service.reindex()
+
+    @app.get("/baseline/incidents/{incident_id}", response_model=Incident)
+    def baseline_get(
+        incident_id: str,
+        incident_service: IncidentService = Depends(get_incident_service),
+        json_cache: JsonFragmentCache = Depends(get_json_cache),
+    ) -> Response:
+        try:
+            incident = incident_service.get_incident(incident_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail="Incident not found") from exc
+        return json_bytes_response(
+            json_cache.entity("incident", incident, incident_service.entity_version(incident))
+        )
+
+    @app.post("/baseline/incidents/{incident_id}/notes", response_model=Incident)
+    def baseline_note(
+        incident_id: str,
+        payload: IncidentNoteCreate,
+        incident_service: IncidentService = Depends(get_incident_service),
+    ) -> Incident:
+        try:
+            return incident_service.add_note(incident_id, payload)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail="Incident not found") from exc
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _spawn_server(state_path: Path, port: int, incidents: int, lifespan: str) -> subprocess.Popen[bytes]:
+    env = {**os.environ, "BACKEND_STATE_PATH": str(state_path), INCIDENTS_ENV: str(incidents)}
+    command = [
+        sys.executable, "-m", "uvicorn", "benchmarks.load:build_app", "--factory",
+        "--port", str(port), "--log-level", "warning", "--no-access-log", "--lifespan", lifespan,
+    ]
+    return subprocess.Popen(command, env=env, cwd=Path(__file__).resolve().parents[1])
+
+
+async def _wait_ready(base_url: str) -> None:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(200):
+            try:
+                if (await client.get("/healthz")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.05)
+    raise RuntimeError("server did not start")
+
+
+async def _drive(
+    base_url: str, prefix: str, incidents: int, concurrency: int, seconds: float, write_ratio: float
+) -> tuple[int, int, list[float]]:
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        deadline = time.perf_counter() + seconds
+
+        async def worker(seed: int) -> None:
+            nonlocal errors
+            rng = random.Random(seed)
+            while time.perf_counter() < deadline:
+                incident_id = f"incident-{rng.randrange(incidents)}"
+                started = time.perf_counter()
+                if rng.random() < write_ratio:
+                    response = await client.post(
+                        f"{prefix}/{incident_id}/notes", json={"author": "load", "text": "checking"}
+                    )
+                else:
+                    response = await client.get(f"{prefix}/{incident_id}")
+                latencies.append(time.perf_counter() - started)
+                if response.status_code >= 400:
+                    errors += 1
+
+        await asyncio.gather(*(worker(seed) for seed in range(concurrency)))
+    return len(latencies), errors, sorted(latencies)
+
+
+def _percentile(latencies: list[float], fraction: float) -> float:
+    if not latencies:
+        return 0.0
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sustained mixed read/write load against a live uvicorn server.")
+    parser.add_argument("--incidents", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    modes = [
+        ("sync", "/baseline/incidents", "off"),
+        ("async", "/api/v1/incidents", "on"),
+    ]
+    print(f"{'mode':<6} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, prefix, lifespan in modes:
+        with tempfile.TemporaryDirectory() as directory:
+            port = _free_port()
+            server = _spawn_server(Path(directory) / "state.json", port, args.incidents, lifespan)
+            try:
+                base_url = f"http://127.0.0.1:{port}"
+                asyncio.run(_wait_ready(base_url))
+                count, errors, latencies = asyncio.run(
+                    _drive(base_url, prefix, args.incidents, args.concurrency, args.seconds, args.write_ratio)
+                )
+            finally:
+                server.terminate()
+                server.wait()
+        print(
+            f"{name:<6} {count:>9} {errors:>7} {count / args.seconds:>9.1f} "
+            f"{_percentile(latencies, 0.5):>8.1f} {_percentile(latencies, 0.99):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
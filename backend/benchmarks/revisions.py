@@ -0,0 +1,93 @@
+import argparse
+import json
+import random
+import time
+
+from app.models.state import AppState
+from app.persistence.content import RunbookContentStore
+from app.persistence.revisions import RunbookRevisionStore
+
+
+def _large_runbook(lines: int, rng: random.Random) -> list[str]:
+    return [
+        f"{index:05d} kubectl -n payments logs deploy/api --since=15m | grep -i error-{rng.randint(0, 9999)}\n"
+        for index in range(lines)
+    ]
+
+
+def _edit(lines: list[str], rng: random.Random, edits: int) -> list[str]:
+    edited = list(lines)
+    for _ in range(edits):
+        position = rng.randrange(len(edited))
+        action = rng.random()
+        if action < 0.6:
+            edited[position] = f"edited line {rng.randint(0, 1_000_000)}\n"
+        elif action < 0.8:
+            edited.insert(position, f"inserted line {rng.randint(0, 1_000_000)}\n")
+        else:
+            del edited[position]
+    return edited
+
+
+def run(lines: int, revisions: int, edits: int, interval: int, codec: str, seed: int) -> dict[str, float]:
+    rng = random.Random(seed)
+    state = AppState(schemaVersion=1, incidents=[], runbooks=[])
+    store = RunbookRevisionStore(RunbookContentStore(codec=codec), checkpoint_interval=interval)
+    current = _large_runbook(lines, rng)
+    previous = None
+    full_copy_bytes = 0
+    record_started = time.perf_counter()
+    for _ in range(revisions):
+        content = "".join(current)
+        store.record(state, "runbook", previous, content, "2024-01-01T00:00:00Z")
+        full_copy_bytes += len(content.encode("utf-8"))
+        previous = content
+        current = _edit(current, rng, edits)
+    record_seconds = time.perf_counter() - record_started
+
+    stored_bytes = len(
+        json.dumps([revision.model_dump(mode="json") for revision in state.runbookRevisions["runbook"]])
+    ) + sum(len(blob.data) for blob in state.contentBlobs.values())
+    reconstruct_times = []
+    for number in range(1, revisions + 1):
+        started = time.perf_counter()
+        store.reconstruct(state, "runbook", number)
+        reconstruct_times.append(time.perf_counter() - started)
+    return {
+        "interval": interval,
+        "content_kb": len(previous.encode("utf-8")) / 1024,
+        "full_copies_kb": full_copy_bytes / 1024,
+        "stored_kb": stored_bytes / 1024,
+        "overhead_pct": 100 * stored_bytes / full_copy_bytes,
+        "record_ms": 1000 * record_seconds / revisions,
+        "reconstruct_avg_ms": 1000 * sum(reconstruct_times) / len(reconstruct_times),
+        "reconstruct_max_ms": 1000 * max(reconstruct_times),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark runbook revision storage and reconstruction.")
+    parser.add_argument("--lines", type=int, default=4000)
+    parser.add_argument("--revisions", type=int, default=100)
+    parser.add_argument("--edits", type=int, default=5, help="line edits between revisions")
+    parser.add_argument("--intervals", type=int, nargs="+", default=[1, 5, 20, 50])
+    parser.add_argument("--codec", default="zlib")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    header = (
+        f"{'interval':>8} {'content KB':>10} {'full KB':>10} {'stored KB':>10} {'stored %':>9} "
+        f"{'record ms':>10} {'rebuild avg ms':>15} {'rebuild max ms':>15}"
+    )
+    print(header)
+    for interval in args.intervals:
+        result = run(args.lines, args.revisions, args.edits, interval, args.codec, args.seed)
+        print(
+            f"{result['interval']:>8} {result['content_kb']:>10.1f} {result['full_copies_kb']:>10.1f} "
+            f"{result['stored_kb']:>10.1f} {result['overhead_pct']:>8.1f}% {result['record_ms']:>10.2f} "
+            f"{result['reconstruct_avg_ms']:>15.2f} {result['reconstruct_max_ms']:>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
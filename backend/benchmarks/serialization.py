@@ -0,0 +1,92 @@
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_incident_service, get_runbook_service
+from app.main import create_app
+from app.models.incident import Incident, IncidentNote
+from app.models.runbook import Runbook, RunbookCreate
+from app.services.incidents import IncidentService
+from app.services.runbooks import RunbookService
+
+
+def _populate(app: FastAPI, incidents: int, notes: int, runbooks: int, runbook_kb: int) -> None:
+    incident_service: IncidentService = app.state.incident_service
+    runbook_service: RunbookService = app.state.runbook_service
+    store = incident_service._store
+    state = store.get_state()
+    for index in range(incidents):
+        timestamp = f"2024-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}Z"
+        state.incidents.append(
+            Incident(
+                id=f"incident-{index}",
+                title=f"Latency spike #{index} in checkout",
+                severity="P2",
+                status="Open" if index % 3 else "Closed",
+                service=f"service-{index % 25}",
+                createdAt=timestamp,
+                updatedAt=timestamp,
+                notes=[
+                    IncidentNote(timestamp=timestamp, author="SRE", text=f"Investigating step {note}")
+                    for note in range(notes)
+                ],
+            )
+        )
+    store.save_state(state)
+    incident_service.reindex()
+    body = "\n".join(f"- check dashboard panel {line}" for line in range(runbook_kb * 1024 // 32))
+    for index in range(runbooks):
+        runbook_service.create_runbook(RunbookCreate(title=f"Runbook {index}", tags=["ops"], content=body))
+
+
+def _mount_baseline(app: FastAPI) -> None:
+    @app.get("/baseline/incidents", response_model=list[Incident])
+    def baseline_incidents(incident_service: IncidentService = Depends(get_incident_service)) -> list[Incident]:
+        return incident_service.list_incidents()
+
+    @app.get("/baseline/runbooks", response_model=list[Runbook])
+    def baseline_runbooks(runbook_service: RunbookService = Depends(get_runbook_service)) -> list[Runbook]:
+        return runbook_service.list_runbooks()
+
+
+def _requests_per_second(client: TestClient, path: str, seconds: float) -> float:
+    client.get(path)
+    count = 0
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter()
+    while time.perf_counter() < deadline:
+        response = client.get(path)
+        response.raise_for_status()
+        count += 1
+    return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare response_model serialization with cached JSON fragments.")
+    parser.add_argument("--incidents", type=int, default=2000)
+    parser.add_argument("--notes", type=int, default=5)
+    parser.add_argument("--runbooks", type=int, default=50)
+    parser.add_argument("--runbook-kb", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_app(state_path=Path(directory) / "state.json")
+        _populate(app, args.incidents, args.notes, args.runbooks, args.runbook_kb)
+        _mount_baseline(app)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        client = TestClient(app)
+        print(f"{'endpoint':<12} {'response_model req/s':>21} {'cached req/s':>13} {'speedup':>8}")
+        for name in ("incidents", "runbooks"):
+            baseline = _requests_per_second(client, f"/baseline/{name}", args.seconds)
+            cached = _requests_per_second(client, f"/api/v1/{name}", args.seconds)
+            print(f"{name:<12} {baseline:>21.1f} {cached:>13.1f} {cached / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
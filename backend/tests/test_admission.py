@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+
+from app.api.admission import AdmissionMiddleware
+from app.core.metrics import MetricsRegistry
+
+
+def _gated_app(gate: asyncio.Event, served: list[str]):
+    async def app(scope, receive, send) -> None:
+        await gate.wait()
+        served.append(f"{scope['method']} {scope['path']}")
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+def _middleware(app, registry: MetricsRegistry | None = None, queue_timeout: float = 5.0) -> AdmissionMiddleware:
+    return AdmissionMiddleware(
+        app,
+        read_limit=1,
+        write_limit=1,
+        read_queue=1,
+        write_queue=2,
+        queue_timeout=queue_timeout,
+        retry_after=3,
+        registry=registry,
+    )
+
+
+def test_full_queue_sheds_with_retry_after() -> None:
+    async def scenario() -> None:
+        gate = asyncio.Event()
+        registry = MetricsRegistry()
+        middleware = _middleware(_gated_app(gate, []), registry)
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.create_task(client.get("/api/v1/incidents"))
+            second = asyncio.create_task(client.get("/api/v1/incidents"))
+            await asyncio.sleep(0.01)
+            assert middleware.lane("read").depth == 1
+
+            shed = await client.get("/api/v1/incidents")
+            assert shed.status_code == 503
+            assert shed.headers["retry-after"] == "3"
+
+            health = asyncio.create_task(client.get("/healthz"))
+            write = asyncio.create_task(client.post("/api/v1/incidents"))
+            gate.set()
+            responses = await asyncio.gather(first, second, health, write)
+            assert [response.status_code for response in responses] == [200, 200, 200, 200]
+        assert 'admission_shed_total{lane="read",reason="queue_full"} 1.0' in registry.render().splitlines()
+
+    asyncio.run(scenario())
+
+
+def test_queued_requests_time_out() -> None:
+    async def scenario() -> None:
+        gate = asyncio.Event()
+        middleware = _middleware(_gated_app(gate, []), queue_timeout=0.01)
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.create_task(client.get("/api/v1/runbooks"))
+            await asyncio.sleep(0.01)
+            assert (await client.get("/api/v1/runbooks")).status_code == 503
+            gate.set()
+            assert (await first).status_code == 200
+            assert middleware.lane("read").active == 0
+
+    asyncio.run(scenario())
+
+
+def test_priority_writes_jump_the_queue() -> None:
+    async def scenario() -> None:
+        gate = asyncio.Event()
+        served: list[str] = []
+        middleware = _middleware(_gated_app(gate, served))
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            blocker = asyncio.create_task(client.put("/api/v1/incidents/a"))
+            await asyncio.sleep(0.01)
+            normal = asyncio.create_task(client.put("/api/v1/incidents/b"))
+            await asyncio.sleep(0.01)
+            note = asyncio.create_task(client.post("/api/v1/incidents/c/notes"))
+            await asyncio.sleep(0.01)
+            gate.set()
+            await asyncio.gather(blocker, normal, note)
+        assert served == ["PUT /api/v1/incidents/a", "POST /api/v1/incidents/c/notes", "PUT /api/v1/incidents/b"]
+
+    asyncio.run(scenario())
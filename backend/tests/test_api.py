@@ -1,8 +1,13 @@
+import gzip
+import json
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 from app.main import create_app
+from app.models.incident import Incident
+from app.persistence.file_store import FileStateStore
 
 
 def _client(tmp_path: Path) -> TestClient:
@@ -74,6 +79,402 @@ def test_runbook_flow_and_filters(tmp_path: Path) -> None:
 
     list_response = client.get("/api/v1/runbooks", params={"q": "rollback"})
     assert list_response.status_code == 200
+    assert list_response.json()[0]["content"] == "Steps"
+
+    revisions = client.get(f"/api/v1/runbooks/{runbook_id}/revisions")
+    assert [revision["number"] for revision in revisions.json()] == [1, 2]
+    assert client.get(f"/api/v1/runbooks/{runbook_id}/revisions/1").json()["content"] == "Rollback steps"
+    assert client.get(f"/api/v1/runbooks/{runbook_id}/revisions/3").status_code == 404
+
+    summaries = client.get("/api/v1/runbooks", params={"include_content": "false"})
+    assert summaries.status_code == 200
+    assert all("content" not in runbook for runbook in summaries.json())
 
     delete = client.delete(f"/api/v1/runbooks/{runbook_id}")
     assert delete.status_code == 204
+
+
+def test_conditional_get_returns_not_modified(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+
+    listing = client.get("/api/v1/incidents", params={"status": "Open"})
+    etag = listing.headers["ETag"]
+    cached = client.get("/api/v1/incidents", params={"status": "Open"}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    other_query = client.get("/api/v1/incidents", params={"status": "Closed"}, headers={"If-None-Match": etag})
+    assert other_query.status_code == 200
+
+    incident_id = listing.json()[0]["id"]
+    detail = client.get(f"/api/v1/incidents/{incident_id}")
+    detail_etag = detail.headers["ETag"]
+    assert client.get(
+        f"/api/v1/incidents/{incident_id}", headers={"If-None-Match": detail_etag}
+    ).status_code == 304
+
+    client.post(f"/api/v1/incidents/{incident_id}/notes", json={"author": "SRE", "text": "Still looking"})
+    assert client.get(
+        "/api/v1/incidents", params={"status": "Open"}, headers={"If-None-Match": etag}
+    ).status_code == 200
+    refreshed = client.get(f"/api/v1/incidents/{incident_id}", headers={"If-None-Match": detail_etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != detail_etag
+
+    runbook_id = client.get("/api/v1/runbooks").json()[0]["id"]
+    runbook = client.get(f"/api/v1/runbooks/{runbook_id}")
+    assert client.get(
+        f"/api/v1/runbooks/{runbook_id}", headers={"If-None-Match": runbook.headers["ETag"]}
+    ).status_code == 304
+
+
+def test_list_responses_reuse_serialized_fragments(tmp_path: Path) -> None:
+    app = create_app(state_path=tmp_path / "state.json")
+    client = TestClient(app)
+
+    first = client.get("/api/v1/incidents")
+    assert first.headers["content-type"] == "application/json"
+    assert [Incident.model_validate(item) for item in first.json()]
+    cached_fragments = len(app.state.json_cache)
+    assert cached_fragments == len(first.json())
+
+    assert client.get("/api/v1/incidents").content == first.content
+    assert len(app.state.json_cache) == cached_fragments
+
+    incident_id = first.json()[0]["id"]
+    client.post(f"/api/v1/incidents/{incident_id}/close")
+    refreshed = client.get("/api/v1/incidents").json()
+    assert next(item for item in refreshed if item["id"] == incident_id)["status"] == "Closed"
+
+
+def test_ndjson_exports(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+
+    incidents = client.get("/api/v1/incidents/export", params={"status": "Open"})
+    assert incidents.status_code == 200
+    assert incidents.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in incidents.text.splitlines()]
+    assert rows and all(row["status"] == "Open" for row in rows)
+
+    compressed = client.get("/api/v1/runbooks/export", params={"gzip": "true"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    runbooks = [json.loads(line) for line in compressed.text.splitlines()]
+    assert len(runbooks) == len(client.get("/api/v1/runbooks").json())
+    assert all(runbook["content"] for runbook in runbooks)
+
+
+def test_bulk_import_streams_ndjson(tmp_path: Path) -> None:
+    app = create_app(state_path=tmp_path / "state.json")
+    client = TestClient(app)
+    version_before = app.state.incident_service.version
+    lines = [
+        {
+            "type": "incident",
+            "id": "legacy-1",
+            "title": "Legacy outage",
+            "severity": "P1",
+            "status": "Closed",
+            "service": "Billing",
+            "createdAt": "2020-01-01T00:00:00Z",
+            "notes": [{"timestamp": "2020-01-01T01:00:00Z", "author": "ops", "text": "Resolved"}],
+        },
+        {"type": "runbook", "title": "Legacy runbook", "tags": ["legacy"], "content": "# Legacy\n\nSteps"},
+        {"type": "incident", "title": "Missing fields"},
+        {"type": "incident", "id": "legacy-1", "title": "Dup", "severity": "P2", "service": "Billing"},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\nnot json\n"
+
+    result = client.post("/api/v1/import", content=body, params={"chunk_size": 2})
+
+    assert result.status_code == 200
+    payload = result.json()
+    assert (payload["lines"], payload["incidents"], payload["runbooks"]) == (5, 1, 1)
+    assert payload["commits"] == 1
+    assert [error["line"] for error in payload["errors"]] == [3, 4, 5]
+    assert app.state.incident_service.version != version_before
+
+    imported = client.get("/api/v1/incidents/legacy-1").json()
+    assert imported["createdAt"] == "2020-01-01T00:00:00Z"
+    assert imported["notes"][0]["text"] == "Resolved"
+    assert client.get("/api/v1/runbooks", params={"tag": "legacy"}).json()[0]["content"] == "# Legacy\n\nSteps"
+
+    export = client.get("/api/v1/runbooks/export", params={"tag": "legacy"}).text
+    reimported = client.post(
+        "/api/v1/import",
+        content=export.replace('"id":', '"legacyId":'),
+        params={"type": "runbook", "commit": "chunk", "chunk_size": 1},
+    ).json()
+    assert (reimported["runbooks"], reimported["commits"], reimported["errors"]) == (1, 1, [])
+
+
+def test_reimport_after_delete_changes_etag_and_body(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    record = {
+        "type": "incident",
+        "id": "legacy-etag",
+        "title": "Before",
+        "severity": "P2",
+        "service": "Billing",
+        "createdAt": "2020-01-01T00:00:00Z",
+        "updatedAt": "2020-01-01T00:00:00Z",
+    }
+    client.post("/api/v1/import", content=json.dumps(record))
+    first = client.get("/api/v1/incidents/legacy-etag")
+    assert client.get("/api/v1/incidents").status_code == 200
+
+    assert client.delete("/api/v1/incidents/legacy-etag").status_code == 204
+    client.post("/api/v1/import", content=json.dumps({**record, "title": "After"}))
+
+    second = client.get("/api/v1/incidents/legacy-etag", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json()["title"] == "After"
+    listed = client.get("/api/v1/incidents", params={"ids": "legacy-etag"}).json()
+    assert listed[0]["title"] == "After"
+
+
+def test_import_rejects_invalid_gzip_body(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    body = gzip.compress(json.dumps({"type": "runbook", "title": "Gzipped", "content": "Steps"}).encode() + b"\n")
+    headers = {"Content-Encoding": "gzip"}
+
+    assert client.post("/api/v1/import", content=body, headers=headers).json()["runbooks"] == 1
+    for invalid in (b"not gzip at all", body[:-6]):
+        response = client.post("/api/v1/import", content=invalid, headers=headers)
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Invalid gzip body")
+
+
+def test_change_feed_reports_mutations(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    cursor = client.get("/api/v1/changes").json()["latest"]
+
+    incident_id = client.post(
+        "/api/v1/incidents", json={"title": "Feed", "severity": "P3", "service": "Gateway"}
+    ).json()["id"]
+    client.post(f"/api/v1/incidents/{incident_id}/close")
+    client.delete(f"/api/v1/incidents/{incident_id}")
+
+    batch = client.get("/api/v1/changes", params={"since": cursor, "wait": 1}).json()
+    assert [(change["id"], change["op"]) for change in batch["changes"]] == [
+        (incident_id, "create"),
+        (incident_id, "update"),
+        (incident_id, "delete"),
+    ]
+    assert client.get("/api/v1/changes", params={"since": batch["latest"] + 10}).json()["reset"]
+
+
+def test_mutations_are_persisted_by_background_writer(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    with TestClient(create_app(state_path=state_path)) as client:
+        incident_id = client.post(
+            "/api/v1/incidents", json={"title": "Writer", "severity": "P3", "service": "Gateway"}
+        ).json()["id"]
+        persisted = json.loads(state_path.read_text(encoding="utf-8"))
+        assert incident_id in {incident["id"] for incident in persisted["incidents"]}
+
+        client.delete(f"/api/v1/incidents/{incident_id}")
+        persisted = json.loads(state_path.read_text(encoding="utf-8"))
+        assert incident_id not in {incident["id"] for incident in persisted["incidents"]}
+
+
+def test_metrics_endpoint_reports_requests_and_store(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    client.get("/api/v1/incidents")
+    client.get("/api/v1/incidents/missing")
+    client.post("/api/v1/incidents", json={"title": "Metrics", "severity": "P3", "service": "Gateway"})
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/incidents/{incident_id}",status="404"} 1.0'
+        in lines
+    )
+    assert 'http_requests_in_flight{method="GET"} 1.0' in lines
+    assert 'state_entities{kind="incident"} 3.0' in lines
+    assert any(line.startswith("state_store_write_bytes_count ") for line in lines)
+    assert any(line.startswith("state_store_file_bytes ") for line in lines)
+
+
+def test_profiling_is_gated_by_token(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client(tmp_path)
+    assert "server-timing" not in client.get("/api/v1/incidents").headers
+    assert client.get("/debug/profiles").status_code == 404
+
+    monkeypatch.setenv("BACKEND_PROFILE_TOKEN", "secret")
+    client = _client(tmp_path)
+    assert client.get("/debug/profiles", headers={"X-Profile-Token": "wrong"}).status_code == 403
+    assert "server-timing" not in client.get("/api/v1/incidents").headers
+
+    headers = {"X-Profile-Token": "secret"}
+    response = client.get("/api/v1/incidents", headers={**headers, "X-Profile": "1"})
+    timing = response.headers["server-timing"]
+    assert "service;dur=" in timing
+    assert "serialization;dur=" in timing
+    assert "total;dur=" in timing
+    profile_id = response.headers["x-profile-id"]
+    assert response.headers["x-profile-scope"] == "event-loop"
+
+    summaries = client.get("/debug/profiles", headers=headers).json()
+    assert [(summary["id"], summary["kind"]) for summary in summaries] == [(profile_id, "request")]
+    report = client.get(f"/debug/profiles/{profile_id}", headers=headers)
+    assert "function calls" in report.text
+    assert report.text.startswith("# scope: event-loop thread; 0 other requests overlapped this one\n")
+
+    sampled = client.post("/debug/profiles", params={"seconds": 0.05, "interval_ms": 5}, headers=headers)
+    assert sampled.status_code == 201
+    assert sampled.json()["kind"] == "sampling"
+    assert client.get("/debug/profiles/missing", headers=headers).status_code == 404
+
+
+def test_server_timing_can_be_enabled_for_all_requests(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BACKEND_SERVER_TIMING", "1")
+    with TestClient(create_app(state_path=tmp_path / "state.json")) as client:
+        response = client.post(
+            "/api/v1/incidents", json={"title": "Timing", "severity": "P3", "service": "Gateway"}
+        )
+        assert "persistence;dur=" in response.headers["server-timing"]
+        assert "x-profile-id" not in response.headers
+
+
+def test_idempotency_key_replays_post_results(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    payload = {"title": "Retry", "severity": "P3", "service": "Gateway"}
+    headers = {"Idempotency-Key": "create-1"}
+
+    first = client.post("/api/v1/incidents", json=payload, headers=headers)
+    retry = client.post("/api/v1/incidents", json=payload, headers=headers)
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+    assert len(client.get("/api/v1/incidents", params={"q": "Retry"}).json()) == 1
+
+    conflict = client.post("/api/v1/incidents", json={**payload, "title": "Other"}, headers=headers)
+    assert conflict.status_code == 422
+
+    incident_id = first.json()["id"]
+    note_headers = {"Idempotency-Key": "note-1"}
+    note = {"author": "SRE", "text": "Retrying"}
+    client.post(f"/api/v1/incidents/{incident_id}/notes", json=note, headers=note_headers)
+    restarted = _client(tmp_path)
+    replayed = restarted.post(f"/api/v1/incidents/{incident_id}/notes", json=note, headers=note_headers)
+    assert replayed.headers["idempotent-replayed"] == "true"
+    assert len(restarted.get(f"/api/v1/incidents/{incident_id}").json()["notes"]) == 1
+
+
+def test_idempotency_key_replays_once_after_failed_flush(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state_path = tmp_path / "state.json"
+    client = TestClient(create_app(state_path=state_path), raise_server_exceptions=False)
+    payload = {"title": "Disk full", "severity": "P3", "service": "Gateway"}
+    headers = {"Idempotency-Key": "create-disk-full"}
+    write_state = FileStateStore._write_state
+
+    def failing_write(self: FileStateStore, state: object) -> None:
+        raise OSError("No space left on device")
+
+    with client:
+        monkeypatch.setattr(FileStateStore, "_write_state", failing_write)
+        first = client.post("/api/v1/incidents", json=payload, headers=headers)
+        monkeypatch.setattr(FileStateStore, "_write_state", write_state)
+        retry = client.post("/api/v1/incidents", json=payload, headers=headers)
+        in_memory = client.get("/api/v1/incidents", params={"q": "Disk full"}).json()
+
+    assert first.status_code == 500
+    assert retry.status_code == 201
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert [incident["id"] for incident in in_memory] == [retry.json()["id"]]
+    persisted = json.loads(state_path.read_text())["incidents"]
+    assert [incident["id"] for incident in persisted if incident["title"] == "Disk full"] == [retry.json()["id"]]
+
+
+def test_incident_context_bundle(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    incident = {"title": "Card declines", "severity": "P1", "service": "Ledger API"}
+    incident_id = client.post("/api/v1/incidents", json=incident).json()["id"]
+    sibling_id = client.post("/api/v1/incidents", json={**incident, "title": "Refund lag"}).json()["id"]
+    closed_id = client.post("/api/v1/incidents", json={**incident, "title": "Old"}).json()["id"]
+    client.post(f"/api/v1/incidents/{closed_id}/close")
+    for text in ("first", "second", "third"):
+        client.post(f"/api/v1/incidents/{incident_id}/notes", json={"author": "SRE", "text": text})
+    runbook = {"title": "Ledger triage", "tags": ["ledger", "Ledger API"], "content": "# Triage"}
+    runbook_id = client.post("/api/v1/runbooks", json=runbook).json()["id"]
+    client.post("/api/v1/runbooks", json={**runbook, "title": "Ledger FAQ", "tags": ["ledger"]})
+
+    response = client.get(f"/api/v1/incidents/{incident_id}/context", params={"notes": 2, "runbooks": 1})
+    assert response.status_code == 200
+    context = response.json()
+    assert context["incident"]["id"] == incident_id
+    assert [note["text"] for note in context["latestNotes"]] == ["third", "second"]
+    assert [item["id"] for item in context["runbooks"]] == [runbook_id]
+    assert "content" not in context["runbooks"][0]
+    assert [item["id"] for item in context["relatedIncidents"]] == [sibling_id]
+
+    cached = client.get(
+        f"/api/v1/incidents/{incident_id}/context",
+        params={"notes": 2, "runbooks": 1},
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert cached.status_code == 304
+    assert client.get("/api/v1/incidents/missing/context").status_code == 404
+
+
+def test_list_endpoints_return_facet_counts(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    for title, severity in (("Ledger drift", "P1"), ("Ledger lag", "P2"), ("Queue lag", "P2")):
+        client.post("/api/v1/incidents", json={"title": title, "severity": severity, "service": "Ledger"})
+
+    plain = client.get("/api/v1/incidents", params={"service": "Ledger"}).json()
+    assert isinstance(plain, list)
+
+    page = client.get("/api/v1/incidents", params={"service": "Ledger", "facets": "true"}).json()
+    assert len(page["items"]) == 3
+    assert page["facets"] == {"status": {"Open": 3}, "severity": {"P1": 1, "P2": 2}, "service": {"Ledger": 3}}
+
+    lagging = client.get("/api/v1/incidents", params={"q": "lag", "facets": "true"}).json()
+    assert lagging["facets"]["severity"] == {"P2": 2}
+
+    everything = client.get("/api/v1/incidents", params={"facets": "true"}).json()
+    assert sum(everything["facets"]["status"].values()) == len(everything["items"])
+
+    runbooks = client.get("/api/v1/runbooks", params={"facets": "true", "include_content": "false"}).json()
+    tag_counts = runbooks["facets"]["tag"]
+    assert tag_counts == {
+        tag: sum(tag in runbook["tags"] for runbook in runbooks["items"]) for tag in tag_counts
+    }
+    filtered = client.get("/api/v1/runbooks", params={"tag": "redis", "facets": "true"}).json()
+    assert filtered["facets"]["tag"] == {"cache": 1, "redis": 1}
+
+
+def test_list_endpoints_support_batch_ids(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    created = [
+        client.post("/api/v1/incidents", json={"title": f"Batch {index}", "severity": "P3", "service": "Batch"}).json()
+        for index in range(3)
+    ]
+    requested = [created[2]["id"], "missing", created[0]["id"], created[2]["id"]]
+
+    batch = client.get("/api/v1/incidents", params={"ids": ",".join(requested)})
+    assert batch.status_code == 200
+    assert [item["id"] for item in batch.json()] == [created[2]["id"], created[0]["id"]]
+
+    closed = client.get("/api/v1/incidents", params={"ids": created[0]["id"], "status": "Closed"}).json()
+    assert closed == []
+
+    runbook_ids = [runbook["id"] for runbook in client.get("/api/v1/runbooks").json()][:2]
+    runbooks = client.get("/api/v1/runbooks", params={"ids": ",".join(reversed(runbook_ids))}).json()
+    assert [runbook["id"] for runbook in runbooks] == list(reversed(runbook_ids))
+    assert "content" in runbooks[0]
+
+    faceted = client.get("/api/v1/incidents", params={"ids": ",".join(requested), "facets": "true"}).json()
+    assert [item["id"] for item in faceted["items"]] == [created[2]["id"], created[0]["id"]]
+    assert faceted["facets"]["service"] == {"Batch": 2}
+    assert sum(faceted["facets"]["status"].values()) == 2
+
+    runbook_facets = client.get("/api/v1/runbooks", params={"ids": runbook_ids[0], "facets": "true"}).json()
+    assert len(runbook_facets["items"]) == 1
+    assert runbook_facets["facets"]["tag"] == {tag: 1 for tag in runbook_facets["items"][0]["tags"]}
+
+    too_many = client.get("/api/v1/incidents", params={"ids": ",".join(f"id-{index}" for index in range(101))})
+    assert too_many.status_code == 422
@@ -0,0 +1,35 @@
+import asyncio
+import threading
+
+from app.services.changes import ChangeLog
+
+
+def test_since_returns_changes_after_cursor() -> None:
+    log = ChangeLog(max_entries=3)
+    for index in range(5):
+        log.append("incident", f"incident-{index}", "create")
+
+    batch = log.since(3)
+    assert [change.seq for change in batch.changes] == [4, 5]
+    assert batch.latest == 5
+    assert not batch.reset
+
+    assert log.since(2).changes[0].seq == 3
+    assert log.since(1).reset
+    assert log.since(9).reset
+    assert log.since(5).changes == []
+
+
+def test_wait_wakes_up_on_append_from_another_thread() -> None:
+    log = ChangeLog()
+
+    async def scenario() -> None:
+        timer = threading.Timer(0.05, log.append, args=("runbook", "runbook-1", "update"))
+        timer.start()
+        batch = await log.wait(0, timeout=5.0)
+        assert [change.id for change in batch.changes] == ["runbook-1"]
+
+        empty = await log.wait(batch.latest, timeout=0.01)
+        assert empty.changes == []
+
+    asyncio.run(scenario())
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import pytest
+
+from app.persistence.file_store import FileStateStore
+from app.seed.data import seed_state
+from app.services.idempotency import IdempotencyConflictError, IdempotencyService
+
+
+def _build_service(tmp_path: Path, max_keys: int = 10, ttl_seconds: int = 60) -> IdempotencyService:
+    store = FileStateStore(tmp_path / "state.json", seed_state)
+    return IdempotencyService(store, max_keys=max_keys, ttl_seconds=ttl_seconds)
+
+
+def test_lookup_returns_remembered_result(tmp_path: Path) -> None:
+    service = _build_service(tmp_path)
+    assert service.lookup("key-1", "abc") is None
+
+    service.remember("key-1", "abc", 201, '{"id":"1"}')
+
+    record = service.lookup("key-1", "abc")
+    assert (record.status, record.body) == (201, '{"id":"1"}')
+    with pytest.raises(IdempotencyConflictError):
+        service.lookup("key-1", "other")
+
+
+def test_records_survive_restart(tmp_path: Path) -> None:
+    _build_service(tmp_path).remember("key-1", "abc", 200, "{}")
+
+    assert _build_service(tmp_path).lookup("key-1", "abc") is not None
+
+
+def test_oldest_and_expired_records_are_evicted(tmp_path: Path) -> None:
+    service = _build_service(tmp_path, max_keys=2)
+    for index in range(3):
+        service.remember(f"key-{index}", "abc", 200, "{}")
+
+    assert service.lookup("key-0", "abc") is None
+    assert service.lookup("key-2", "abc") is not None
+
+    expiring = _build_service(tmp_path / "expiring", ttl_seconds=0)
+    expiring.remember("key-1", "abc", 200, "{}")
+    assert expiring.lookup("key-1", "abc") is None
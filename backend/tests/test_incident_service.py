@@ -61,3 +61,28 @@ def test_list_filters(tmp_path: Path) -> None:
 
     status_filtered = service.list_incidents(status="Closed")
     assert all(incident.status == "Closed" for incident in status_filtered)
+
+
+def test_export_iterates_over_a_snapshot(tmp_path: Path) -> None:
+    service, _ = _build_service(tmp_path)
+    before = {incident.id for incident in service.list_incidents(status="Open")}
+
+    exported = service.export_incidents(status="Open")
+    created = service.create_incident(IncidentCreate(title="New outage", severity="P1", service="Gateway"))
+
+    assert {incident.id for incident in exported} == before
+    assert created.id in {incident.id for incident in service.export_incidents(status="Open")}
+
+
+def test_index_tracks_mutations(tmp_path: Path) -> None:
+    service, _ = _build_service(tmp_path)
+    first = service.create_incident(IncidentCreate(title="A", severity="P2", service="Ledger"))
+    second = service.create_incident(IncidentCreate(title="B", severity="P2", service="Ledger"))
+
+    assert service.related_open_incidents(first) == [second]
+    service.close_incident(second.id)
+    assert service.related_open_incidents(first) == []
+    service.reopen_incident(second.id)
+    service.delete_incident(second.id)
+    assert service.related_open_incidents(first) == []
+    assert service.get_incident(first.id).title == "A"
@@ -0,0 +1,35 @@
+import pytest
+
+from app.core.metrics import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests served.", ("route",))
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    registry.gauge_callback("items", "Items held.", lambda: [(("a",), 2.0)], ("kind",))
+
+    requests.inc(labels=("/x",))
+    requests.inc(2, labels=("/x",))
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5.0)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE requests_total counter" in lines
+    assert 'requests_total{route="/x"} 3.0' in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1.0' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 2.0' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3.0' in lines
+    assert "latency_seconds_count 3.0" in lines
+    assert 'items{kind="a"} 2.0' in lines
+
+
+def test_registry_rejects_bad_labels_and_duplicates() -> None:
+    registry = MetricsRegistry()
+    gauge = registry.gauge("depth", "Depth.", ("lane",))
+
+    with pytest.raises(ValueError):
+        gauge.set(1.0)
+    with pytest.raises(ValueError):
+        registry.counter("depth", "Again.")
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from pathlib import Path
 
@@ -22,3 +23,41 @@ def test_store_resets_when_corrupt(tmp_path: Path) -> None:
     payload = json.loads(state_path.read_text(encoding="utf-8"))
     assert payload["schemaVersion"] == 1
     assert store.get_state().schemaVersion == 1
+
+
+def test_store_migrates_inline_runbook_content(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    legacy = seed_state().model_dump(mode="json")
+    legacy["runbooks"] = [
+        {**runbook, "content": legacy["runbookContent"][runbook["id"]]["data"]}
+        for runbook in legacy["runbooks"]
+    ]
+    del legacy["runbookContent"]
+    state_path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    store = FileStateStore(state_path, seed_state)
+
+    state = store.get_state()
+    assert [runbook.id for runbook in state.runbooks] == [runbook["id"] for runbook in legacy["runbooks"]]
+    assert set(state.runbookContent) == {runbook["id"] for runbook in legacy["runbooks"]}
+
+
+def test_store_background_writer_coalesces_saves(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    store = FileStateStore(state_path, seed_state)
+
+    async def scenario() -> None:
+        await store.start()
+        assert store.writer_running
+        state = store.get_state()
+        for index in range(5):
+            state.incidents.append(state.incidents[0].model_copy(update={"id": f"inc-bulk-{index}"}))
+            store.save_state(state)
+        await store.flush()
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+        assert len(payload["incidents"]) == len(state.incidents)
+        await store.stop()
+
+    asyncio.run(scenario())
+
+    assert not store.writer_running
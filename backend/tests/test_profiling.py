@@ -0,0 +1,39 @@
+import asyncio
+
+import httpx
+
+from app.api.profiling import ProfilingMiddleware
+from app.core.profiling import ProfileStore
+
+
+def _gated_app(gate: asyncio.Event):
+    async def app(scope, receive, send) -> None:
+        await gate.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+def test_overlapping_profile_request_is_marked_skipped() -> None:
+    async def scenario() -> None:
+        gate = asyncio.Event()
+        profiles = ProfileStore()
+        middleware = ProfilingMiddleware(_gated_app(gate), profiles, token="secret", server_timing=False)
+        headers = {"X-Profile-Token": "secret", "X-Profile": "1"}
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.create_task(client.get("/api/v1/incidents", headers=headers))
+            await asyncio.sleep(0.01)
+            second = asyncio.create_task(client.get("/api/v1/incidents", headers=headers))
+            await asyncio.sleep(0.01)
+            gate.set()
+            profiled, skipped = await asyncio.gather(first, second)
+
+        assert profiled.headers["x-profile-scope"] == "event-loop"
+        assert "x-profile-skipped" not in profiled.headers
+        assert skipped.headers["x-profile-skipped"] == "busy"
+        assert "x-profile-id" not in skipped.headers
+        assert [summary.id for summary in profiles.summaries()] == [profiled.headers["x-profile-id"]]
+
+    asyncio.run(scenario())
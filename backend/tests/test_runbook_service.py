@@ -1,7 +1,10 @@
+import json
 from pathlib import Path
 
 from app.models.runbook import RunbookCreate, RunbookUpdate
+from app.persistence.content import RunbookContentStore
 from app.persistence.file_store import FileStateStore
+from app.persistence.revisions import RunbookRevisionStore
 from app.seed.data import seed_state
 from app.services.runbooks import RunbookService
 
@@ -43,3 +46,89 @@ def test_list_filters(tmp_path: Path) -> None:
 
     tag_filtered = service.list_runbooks(tag="redis")
     assert all("redis" in runbook.tags for runbook in tag_filtered)
+
+
+def test_content_is_stored_compressed(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    store = FileStateStore(state_path, seed_state)
+    service = RunbookService(store, RunbookContentStore(codec="lzma"))
+    body = "kubectl rollout restart deployment/api\n" * 2000
+
+    created = service.create_runbook(RunbookCreate(title="Restart API", tags=["k8s"], content=body))
+
+    payload = json.loads(state_path.read_text(encoding="utf-8"))
+    blobs = [payload["contentBlobs"][digest] for digest in payload["runbookContent"][created.id]]
+    assert {blob["codec"] for blob in blobs} == {"lzma"}
+    assert sum(len(blob["data"]) for blob in blobs) < len(body) // 10
+    assert all("content" not in runbook for runbook in payload["runbooks"])
+    assert service.get_runbook(created.id).content == body
+
+    reloaded = RunbookService(FileStateStore(state_path, seed_state), RunbookContentStore(codec="zlib"))
+    assert reloaded.get_runbook(created.id).content == body
+    payload = json.loads(state_path.read_text(encoding="utf-8"))
+    assert {blob["codec"] for blob in payload["contentBlobs"].values()} <= {"zlib", "none"}
+
+
+def test_repeated_sections_are_stored_once(tmp_path: Path) -> None:
+    store = FileStateStore(tmp_path / "state.json", seed_state)
+    service = RunbookService(store)
+    escalation = "## Escalation\n\n| Team | Pager |\n| --- | --- |\n| Payments | pay-oncall |\n"
+    first = service.create_runbook(
+        RunbookCreate(title="Payments", tags=[], content="# Payments\n\nRestart pods.\n\n" + escalation)
+    )
+    blobs_after_first = len(store.get_state().contentBlobs)
+    second = service.create_runbook(
+        RunbookCreate(title="Checkout", tags=[], content="# Checkout\n\nDrain queue.\n\n" + escalation)
+    )
+
+    state = store.get_state()
+    assert len(state.contentBlobs) == blobs_after_first + 1
+    shared = set(state.runbookContent[first.id]) & set(state.runbookContent[second.id])
+    assert len(shared) == 1
+    assert state.contentBlobs[shared.pop()].refs == 4
+
+    service.delete_runbook(first.id)
+    service.delete_runbook(second.id)
+    assert all(blob.refs > 0 for blob in store.get_state().contentBlobs.values())
+    assert len(store.get_state().contentBlobs) == blobs_after_first - 2
+
+
+def test_list_without_content(tmp_path: Path) -> None:
+    service = _build_service(tmp_path)
+    summaries = service.list_runbooks(include_content=False)
+    assert summaries
+    assert all(not hasattr(runbook, "content") for runbook in summaries)
+
+
+def test_revision_history_reconstructs_every_revision(tmp_path: Path) -> None:
+    store = FileStateStore(tmp_path / "state.json", seed_state)
+    service = RunbookService(store, revisions=RunbookRevisionStore(checkpoint_interval=3))
+    lines = [f"step {index}: check dashboard {index}\n" for index in range(200)]
+    versions = ["".join(lines)]
+    created = service.create_runbook(RunbookCreate(title="Big runbook", tags=["ops"], content=versions[0]))
+    for edit in range(7):
+        lines[edit * 10] = f"step {edit * 10}: updated in edit {edit}\n"
+        lines.append(f"appendix {edit}\n")
+        versions.append("".join(lines))
+        service.update_runbook(created.id, RunbookUpdate(content=versions[-1]))
+
+    revisions = service.list_revisions(created.id)
+    assert [revision.number for revision in revisions] == list(range(1, 9))
+    assert [revision.kind for revision in revisions] == [
+        "checkpoint", "delta", "delta", "checkpoint", "delta", "delta", "checkpoint", "delta"
+    ]
+    for number, expected in enumerate(versions, start=1):
+        assert service.get_revision(created.id, number).content == expected
+
+    service.update_runbook(created.id, RunbookUpdate(title="Renamed"))
+    assert len(service.list_revisions(created.id)) == 8
+
+
+def test_first_edit_of_existing_runbook_keeps_original_revision(tmp_path: Path) -> None:
+    service = _build_service(tmp_path)
+    runbook = service.list_runbooks()[0]
+
+    service.update_runbook(runbook.id, RunbookUpdate(content=runbook.content + "\n5. Page owners"))
+
+    assert service.get_revision(runbook.id, 1).content == runbook.content
+    assert service.get_revision(runbook.id, 2).content.endswith("5. Page owners")
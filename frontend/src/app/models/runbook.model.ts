@@ -1,8 +1,11 @@
-export interface Runbook {
+export interface RunbookSummary {
   id: string;
   title: string;
   tags: string[];
-  content: string;
   createdAt: string;
   updatedAt: string;
 }
+
+export interface Runbook extends RunbookSummary {
+  content: string;
+}
@@ -3,7 +3,7 @@ import { CommonModule } from '@angular/common';
 import { FormsModule } from '@angular/forms';
 import { Router, RouterLink } from '@angular/router';
 
-import { Runbook } from '../../models/runbook.model';
+import { RunbookSummary } from '../../models/runbook.model';
 import { RunbooksService } from '../../services/runbooks.service';
 
 interface RunbookFormState {
@@ -19,8 +19,8 @@ interface RunbookFormState {
   templateUrl: './runbooks-list.component.html'
 })
 export class RunbooksListComponent implements OnInit {
-  runbooks: Runbook[] = [];
-  filtered: Runbook[] = [];
+  runbooks: RunbookSummary[] = [];
+  filtered: RunbookSummary[] = [];
 
   searchTerm = '';
 
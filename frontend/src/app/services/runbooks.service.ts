@@ -3,7 +3,7 @@ import { HttpClient } from '@angular/common/http';
 import { Observable } from 'rxjs';
 
 import { API_BASE_URL } from '../config/api.config';
-import { Runbook } from '../models/runbook.model';
+import { Runbook, RunbookSummary } from '../models/runbook.model';
 
 @Injectable({
   providedIn: 'root'
@@ -11,8 +11,10 @@ import { Runbook } from '../models/runbook.model';
 export class RunbooksService {
   constructor(private http: HttpClient) {}
 
-  getRunbooks(): Observable<Runbook[]> {
-    return this.http.get<Runbook[]>(`${API_BASE_URL}/runbooks`);
+  getRunbooks(): Observable<RunbookSummary[]> {
+    return this.http.get<RunbookSummary[]>(`${API_BASE_URL}/runbooks`, {
+      params: { include_content: 'false' }
+    });
   }
 
   getRunbookById(id: string): Observable<Runbook> {
@@ -1,10 +1,59 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Literal, TypeVar
 
 import httpx
+from pydantic import TypeAdapter
 
-from app.core import API_PREFIX, DEFAULT_TIMEOUT_SECONDS, get_backend_base_url
+from app.core import (
+    API_PREFIX,
+    BATCH_MAX_IDS,
+    RETRY_BACKOFF_CAP_SECONDS,
+    RETRY_BACKOFF_SECONDS,
+    get_backend_base_url,
+    get_backend_http2,
+    get_backend_keepalive_expiry,
+    get_backend_max_connections,
+    get_backend_max_keepalive,
+    get_backend_max_retries,
+    get_backend_timeout,
+    get_batch_concurrency,
+    get_breaker_reset,
+    get_breaker_threshold,
+    get_cache_max_entries,
+    get_cache_stale,
+    get_cache_ttl,
+    get_hedge_enabled,
+    get_hedge_percentile,
+    get_retry_budget_min,
+    get_retry_budget_ratio,
+)
+from app.models import (
+    INCIDENT,
+    INCIDENT_LIST,
+    RUNBOOK,
+    RUNBOOK_LIST,
+    RUNBOOK_SUMMARY_LIST,
+    ChangeBatch,
+    ChangeEntity,
+    Incident,
+    Runbook,
+    RunbookSummary,
+)
+from app.resilience import CircuitBreaker, LatencyTracker, RetryBudget, RouteGuard, RouteGuards, backoff_delay
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+CacheState = Literal["fresh", "stale", "expired", "miss"]
+
+T = TypeVar("T")
+E = TypeVar("E", Incident, Runbook)
+
+_RETRYABLE_STATUSES = {502, 503, 504}
 
 
 class BackendUnavailableError(RuntimeError):
@@ -15,40 +64,455 @@ class BackendNotFoundError(RuntimeError):
     pass
 
 
+@dataclass
+class CacheEntry:
+    value: object
+    etag: str | None
+    stored_at: float
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "hits": self.hits,
+            "staleHits": self.stale_hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evictions": self.evictions,
+            "hitRatio": round(self.hit_ratio, 4),
+        }
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        ttl_seconds: float,
+        stale_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: CacheKey) -> tuple[CacheEntry | None, CacheState]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None, "miss"
+        self._entries.move_to_end(key)
+        age = self._clock() - entry.stored_at
+        if age < self.ttl_seconds:
+            self.stats.hits += 1
+            return entry, "fresh"
+        if age < self.ttl_seconds + self.stale_seconds:
+            self.stats.stale_hits += 1
+            return entry, "stale"
+        self.stats.misses += 1
+        return entry, "expired"
+
+    def store(self, key: CacheKey, value: object, etag: str | None) -> None:
+        self._entries[key] = CacheEntry(value=value, etag=etag, stored_at=self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def refresh(self, key: CacheKey, entry: CacheEntry) -> None:
+        self.stats.revalidated += 1
+        entry.stored_at = self._clock()
+        if key in self._entries:
+            self._entries.move_to_end(key)
+
+    def discard(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+
+    def discard_path(self, path: str) -> None:
+        for key in [key for key in self._entries if key[0] == path]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _RetryableStatusError(Exception):
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"backend returned {response.status_code}")
+        self.response = response
+
+
+def _default_cache() -> ResponseCache:
+    return ResponseCache(get_cache_ttl(), get_cache_stale(), get_cache_max_entries())
+
+
+def _default_breaker() -> CircuitBreaker:
+    return CircuitBreaker(get_breaker_threshold(), get_breaker_reset())
+
+
+def _default_retry_budget() -> RetryBudget:
+    return RetryBudget(get_retry_budget_ratio(), get_retry_budget_min())
+
+
+def _default_guards() -> RouteGuards:
+    return RouteGuards(_default_breaker, _default_retry_budget)
+
+
+def _default_latency() -> LatencyTracker:
+    return LatencyTracker(get_hedge_percentile())
+
+
+def _route(path: str) -> str:
+    # Ids sit at every other segment (/incidents/{id}/context), so one failing
+    # entity route cannot trip the breaker for the collection or other routes.
+    segments = path.strip("/").split("/")
+    return "/" + "/".join(segment if index % 2 == 0 else "{id}" for index, segment in enumerate(segments))
+
+
+def _is_load_shed(response: httpx.Response) -> bool:
+    return response.status_code == 503 and "retry-after" in response.headers
+
+
+def _retry_after(response: httpx.Response) -> float:
+    try:
+        return float(response.headers.get("retry-after", 0))
+    except ValueError:
+        return 0.0
+
+
 @dataclass
 class BackendClient:
     base_url: str = field(default_factory=get_backend_base_url)
-    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS
+    timeout_seconds: float = field(default_factory=get_backend_timeout)
+    max_connections: int = field(default_factory=get_backend_max_connections)
+    max_keepalive_connections: int = field(default_factory=get_backend_max_keepalive)
+    keepalive_expiry: float = field(default_factory=get_backend_keepalive_expiry)
+    http2: bool = field(default_factory=get_backend_http2)
+    batch_concurrency: int = field(default_factory=get_batch_concurrency)
+    transport: httpx.AsyncBaseTransport | None = field(default=None, repr=False)
+    cache: ResponseCache = field(default_factory=_default_cache, repr=False)
+    max_retries: int = field(default_factory=get_backend_max_retries)
+    retry_backoff_seconds: float = RETRY_BACKOFF_SECONDS
+    guards: RouteGuards = field(default_factory=_default_guards, repr=False)
+    hedge_reads: bool = field(default_factory=get_hedge_enabled)
+    latency: LatencyTracker = field(default_factory=_default_latency, repr=False)
+    coalesced: int = field(default=0, init=False)
+    retries: int = field(default=0, init=False)
+    hedged: int = field(default=0, init=False)
+    hedge_wins: int = field(default=0, init=False)
+    _http: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+    _inflight: dict[CacheKey, asyncio.Task[object]] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def is_open(self) -> bool:
+        return self._http is not None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def resilience_stats(self) -> dict[str, object]:
+        threshold = self.latency.threshold()
+        routes = {
+            route: {
+                "breaker": guard.breaker.state,
+                "shortCircuited": guard.breaker.short_circuited,
+                "retryBudget": round(guard.budget.balance, 2),
+                "retryBudgetExhausted": guard.budget.exhausted,
+            }
+            for route, guard in self.guards.items()
+        }
+        return {
+            "routes": routes,
+            "retries": self.retries,
+            "hedged": self.hedged,
+            "hedgeWins": self.hedge_wins,
+            "hedgeThresholdMs": None if threshold is None else round(threshold * 1000, 2),
+        }
+
+    async def open(self) -> None:
+        if self._http is not None:
+            return
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        self._http = httpx.AsyncClient(
+            timeout=self.timeout_seconds, limits=limits, http2=self.http2, transport=self.transport
+        )
+
+    async def aclose(self) -> None:
+        inflight = list(self._inflight.values())
+        for task in inflight:
+            task.cancel()
+        for task in inflight:
+            with suppress(asyncio.CancelledError, BackendUnavailableError, BackendNotFoundError, httpx.HTTPError):
+                await task
+        http, self._http = self._http, None
+        if http is not None:
+            await http.aclose()
+
+    @asynccontextmanager
+    async def lifespan(self) -> AsyncIterator[BackendClient]:
+        await self.open()
+        try:
+            yield self
+        finally:
+            await self.aclose()
 
     def _build_url(self, path: str) -> str:
         return f"{self.base_url}{API_PREFIX}{path}"
 
-    async def _get(self, path: str, params: dict[str, str] | None = None) -> object:
+    async def _send_get(
+        self,
+        url: str,
+        params: dict[str, str] | None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        request_timeout = self.timeout_seconds if timeout is None else timeout
+        if self._http is not None:
+            return await self._http.get(url, params=params, headers=headers, timeout=request_timeout)
+        async with httpx.AsyncClient(timeout=request_timeout, transport=self.transport) as client:
+            return await client.get(url, params=params, headers=headers)
+
+    async def _fetch(
+        self, path: str, params: dict[str, str] | None, etag: str | None = None
+    ) -> httpx.Response:
         url = self._build_url(path)
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                response = await client.get(url, params=params)
-        except httpx.RequestError as exc:
-            raise BackendUnavailableError("backend unavailable") from exc
+        headers = {"If-None-Match": etag} if etag else None
+        guard = self.guards[_route(path)]
+        guard.budget.deposit()
+        attempt = 0
+        while True:
+            if not guard.breaker.allow():
+                raise BackendUnavailableError("backend unavailable")
+            try:
+                response = await self._attempt(url, params, headers, guard)
+            except asyncio.CancelledError:
+                guard.breaker.release()
+                raise
+            except (httpx.RequestError, _RetryableStatusError) as exc:
+                if isinstance(exc, _RetryableStatusError) and _is_load_shed(exc.response):
+                    # Admission-control backpressure means the backend is healthy but busy.
+                    guard.breaker.release()
+                else:
+                    guard.breaker.record_failure()
+                if attempt >= self.max_retries or not guard.budget.try_spend():
+                    raise BackendUnavailableError("backend unavailable") from exc
+                delay = backoff_delay(attempt, self.retry_backoff_seconds, RETRY_BACKOFF_CAP_SECONDS)
+                if isinstance(exc, _RetryableStatusError):
+                    delay = max(delay, min(_retry_after(exc.response), RETRY_BACKOFF_CAP_SECONDS))
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            guard.breaker.record_success()
+            break
 
         if response.status_code == 404:
             raise BackendNotFoundError("not found")
+        if response.status_code == 304 and etag:
+            return response
 
         response.raise_for_status()
-        return response.json()
+        return response
+
+    async def _attempt(
+        self, url: str, params: dict[str, str] | None, headers: dict[str, str] | None, guard: RouteGuard
+    ) -> httpx.Response:
+        delay = self.latency.threshold() if self.hedge_reads else None
+        if delay is None:
+            return await self._timed_send(url, params, headers)
+        primary = asyncio.create_task(self._timed_send(url, params, headers))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not guard.budget.try_spend():
+                return await primary
+            self.hedged += 1
+            tasks.append(asyncio.create_task(self._timed_send(url, params, headers)))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _timed_send(
+        self, url: str, params: dict[str, str] | None, headers: dict[str, str] | None
+    ) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self._send_get(url, params, headers)
+        if response.status_code in _RETRYABLE_STATUSES:
+            raise _RetryableStatusError(response)
+        self.latency.record(time.perf_counter() - started)
+        return response
+
+    @staticmethod
+    def _cache_key(path: str, params: dict[str, str] | None = None) -> CacheKey:
+        return (path, tuple(sorted((params or {}).items())))
+
+    async def _get(self, path: str, adapter: TypeAdapter[T], params: dict[str, str] | None = None) -> T:
+        key = self._cache_key(path, params)
+        if not self.cache.enabled:
+            return await self._single_flight(key, lambda: self._fetch_value(path, params, adapter))
+        entry, state = self.cache.lookup(key)
+        if entry is not None and state == "fresh":
+            return entry.value
+        if entry is not None and state == "stale":
+            self._flight(key, lambda: self._revalidate(key, path, params, adapter, entry))
+            return entry.value
+        return await self._single_flight(key, lambda: self._revalidate(key, path, params, adapter, entry))
+
+    async def _fetch_value(self, path: str, params: dict[str, str] | None, adapter: TypeAdapter[T]) -> T:
+        return adapter.validate_json((await self._fetch(path, params)).content)
+
+    async def _revalidate(
+        self,
+        key: CacheKey,
+        path: str,
+        params: dict[str, str] | None,
+        adapter: TypeAdapter[T],
+        entry: CacheEntry | None,
+    ) -> T:
+        try:
+            response = await self._fetch(path, params, entry.etag if entry is not None else None)
+        except BackendNotFoundError:
+            self.cache.discard(key)
+            raise
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, entry)
+            return entry.value
+        value = adapter.validate_json(response.content)
+        self.cache.store(key, value, response.headers.get("etag"))
+        return value
+
+    async def _single_flight(self, key: CacheKey, fetch: Callable[[], Awaitable[object]]) -> object:
+        if key in self._inflight:
+            self.coalesced += 1
+        return await asyncio.shield(self._flight(key, fetch))
+
+    def _flight(self, key: CacheKey, fetch: Callable[[], Awaitable[object]]) -> asyncio.Task[object]:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_flight(key, done))
+        return task
+
+    def _finish_flight(self, key: CacheKey, task: asyncio.Task[object]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _get_many(
+        self, path: str, adapter: TypeAdapter[list[E]], ids: list[str], fetch_one: Callable[[str], Awaitable[E]]
+    ) -> list[E]:
+        unique = list(dict.fromkeys(ids))
+        chunks = [unique[start : start + BATCH_MAX_IDS] for start in range(0, len(unique), BATCH_MAX_IDS)]
+        semaphore = asyncio.Semaphore(max(1, self.batch_concurrency))
+        results = await asyncio.gather(
+            *(self._get_chunk(path, adapter, chunk, fetch_one, semaphore) for chunk in chunks)
+        )
+        found = {item.id: item for items in results for item in items}
+        return [found[item_id] for item_id in unique if item_id in found]
+
+    async def _get_chunk(
+        self,
+        path: str,
+        adapter: TypeAdapter[list[E]],
+        ids: list[str],
+        fetch_one: Callable[[str], Awaitable[E]],
+        semaphore: asyncio.Semaphore,
+    ) -> list[E]:
+        try:
+            async with semaphore:
+                items = list(await self._get(path, adapter, params={"ids": ",".join(ids)}))
+        except httpx.HTTPStatusError:
+            items = None
+        requested = set(ids)
+        if items is not None and all(item.id in requested for item in items):
+            return items
+        return await self._fan_out(ids, fetch_one, semaphore)
+
+    async def _fan_out(
+        self, ids: list[str], fetch_one: Callable[[str], Awaitable[E]], semaphore: asyncio.Semaphore
+    ) -> list[E]:
+        async def fetch(item_id: str) -> E | None:
+            async with semaphore:
+                try:
+                    return await fetch_one(item_id)
+                except BackendNotFoundError:
+                    return None
+
+        results = await asyncio.gather(*(fetch(item_id) for item_id in ids))
+        return [item for item in results if item is not None]
+
+    def invalidate(self, entity: ChangeEntity, entity_id: str) -> None:
+        collection = f"/{entity}s"
+        self.cache.discard(self._cache_key(f"{collection}/{entity_id}"))
+        self.cache.discard_path(collection)
+
+    async def wait_for_changes(self, since: int, wait: float, limit: int = 1000) -> ChangeBatch:
+        # Long-polls bypass retries, hedging and the breaker: an idle wait is
+        # not a slow read, and the watcher applies its own backoff.
+        params = {"since": str(since), "wait": str(wait), "limit": str(limit)}
+        try:
+            response = await self._send_get(self._build_url("/changes"), params, timeout=wait + self.timeout_seconds)
+        except httpx.RequestError as exc:
+            raise BackendUnavailableError("backend unavailable") from exc
+        if response.is_error:
+            raise BackendUnavailableError("backend unavailable")
+        return ChangeBatch.model_validate_json(response.content)
+
+    async def list_incidents(self, params: dict[str, str] | None = None) -> list[Incident]:
+        return list(await self._get("/incidents", INCIDENT_LIST, params=params))
+
+    async def get_incident(self, incident_id: str) -> Incident:
+        return await self._get(f"/incidents/{incident_id}", INCIDENT)
+
+    async def get_incidents(self, incident_ids: list[str]) -> list[Incident]:
+        return await self._get_many("/incidents", INCIDENT_LIST, incident_ids, self.get_incident)
 
-    async def list_incidents(self, params: dict[str, str] | None = None) -> list[dict]:
-        data = await self._get("/incidents", params=params)
-        return list(data)
+    async def list_runbooks(self, params: dict[str, str] | None = None) -> list[Runbook]:
+        return list(await self._get("/runbooks", RUNBOOK_LIST, params=params))
 
-    async def get_incident(self, incident_id: str) -> dict:
-        data = await self._get(f"/incidents/{incident_id}")
-        return dict(data)
+    async def list_runbook_summaries(self, params: dict[str, str] | None = None) -> list[RunbookSummary]:
+        query = {**(params or {}), "include_content": "false"}
+        return list(await self._get("/runbooks", RUNBOOK_SUMMARY_LIST, params=query))
 
-    async def list_runbooks(self, params: dict[str, str] | None = None) -> list[dict]:
-        data = await self._get("/runbooks", params=params)
-        return list(data)
+    async def get_runbook(self, runbook_id: str) -> Runbook:
+        return await self._get(f"/runbooks/{runbook_id}", RUNBOOK)
 
-    async def get_runbook(self, runbook_id: str) -> dict:
-        data = await self._get(f"/runbooks/{runbook_id}")
-        return dict(data)
+    async def get_runbooks(self, runbook_ids: list[str]) -> list[Runbook]:
+        return await self._get_many("/runbooks", RUNBOOK_LIST, runbook_ids, self.get_runbook)
@@ -1,28 +1,182 @@
 import os
+from pathlib import Path
+from typing import Literal
 
 API_PREFIX = "/api/v1"
 DEFAULT_BACKEND_BASE_URL = "http://localhost:8000"
 DEFAULT_TIMEOUT_SECONDS = 5.0
 BACKEND_BASE_URL_ENV = "BACKEND_BASE_URL"
+BACKEND_TIMEOUT_ENV = "BACKEND_TIMEOUT_SECONDS"
+BACKEND_MODE_ENV = "MCP_BACKEND_MODE"
+BACKEND_DIR_ENV = "MCP_BACKEND_DIR"
+DEFAULT_BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+EMBEDDED_BASE_URL = "http://backend.embedded"
 MCP_HOST_ENV = "MCP_HOST"
 MCP_PORT_ENV = "MCP_PORT"
 DEFAULT_MCP_HOST = "127.0.0.1"
 DEFAULT_MCP_PORT = 8090
+BACKEND_MAX_CONNECTIONS_ENV = "BACKEND_MAX_CONNECTIONS"
+DEFAULT_BACKEND_MAX_CONNECTIONS = 20
+BACKEND_MAX_KEEPALIVE_ENV = "BACKEND_MAX_KEEPALIVE_CONNECTIONS"
+DEFAULT_BACKEND_MAX_KEEPALIVE = 10
+BACKEND_KEEPALIVE_EXPIRY_ENV = "BACKEND_KEEPALIVE_EXPIRY_SECONDS"
+DEFAULT_BACKEND_KEEPALIVE_EXPIRY = 30.0
+BACKEND_HTTP2_ENV = "BACKEND_HTTP2"
+BACKEND_MAX_RETRIES_ENV = "BACKEND_MAX_RETRIES"
+DEFAULT_BACKEND_MAX_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 0.05
+RETRY_BACKOFF_CAP_SECONDS = 1.0
+RETRY_BUDGET_RATIO_ENV = "BACKEND_RETRY_BUDGET_RATIO"
+DEFAULT_RETRY_BUDGET_RATIO = 0.2
+RETRY_BUDGET_MIN_ENV = "BACKEND_RETRY_BUDGET_MIN"
+DEFAULT_RETRY_BUDGET_MIN = 10
+BREAKER_THRESHOLD_ENV = "BACKEND_BREAKER_THRESHOLD"
+DEFAULT_BREAKER_THRESHOLD = 5
+BREAKER_RESET_ENV = "BACKEND_BREAKER_RESET_SECONDS"
+DEFAULT_BREAKER_RESET = 10.0
+HEDGE_ENV = "BACKEND_HEDGE"
+HEDGE_PERCENTILE_ENV = "BACKEND_HEDGE_PERCENTILE"
+DEFAULT_HEDGE_PERCENTILE = 0.95
+BATCH_MAX_IDS = 100
+WIDGET_PAGE_SIZE = 20
+WIDGET_PAGE_MAX = 100
+WIDGET_MAX_BYTES = 16_000
+RESOURCE_PAGE_SIZE = 50
+RESOURCE_PAGE_MAX = 200
+RESOURCE_MAX_BYTES = 64_000
+BATCH_CONCURRENCY_ENV = "BACKEND_BATCH_CONCURRENCY"
+DEFAULT_BATCH_CONCURRENCY = 8
+CACHE_TTL_ENV = "MCP_CACHE_TTL_SECONDS"
+DEFAULT_CACHE_TTL = 5.0
+CACHE_STALE_ENV = "MCP_CACHE_STALE_SECONDS"
+DEFAULT_CACHE_STALE = 30.0
+CACHE_MAX_ENTRIES_ENV = "MCP_CACHE_MAX_ENTRIES"
+DEFAULT_CACHE_MAX_ENTRIES = 256
+WATCH_WAIT_ENV = "MCP_WATCH_WAIT_SECONDS"
+DEFAULT_WATCH_WAIT = 25.0
+WATCH_BACKOFF_SECONDS = 0.5
+WATCH_BACKOFF_CAP_SECONDS = 30.0
 
 
 def get_backend_base_url() -> str:
     return os.getenv(BACKEND_BASE_URL_ENV, DEFAULT_BACKEND_BASE_URL).rstrip("/")
 
 
+def get_backend_mode() -> Literal["http", "embedded"]:
+    value = os.getenv(BACKEND_MODE_ENV, "http").strip().lower()
+    if value not in {"http", "embedded"}:
+        raise ValueError(f"Invalid {BACKEND_MODE_ENV}: {value}")
+    return value
+
+
+def get_backend_dir() -> Path:
+    value = os.getenv(BACKEND_DIR_ENV)
+    return Path(value).resolve() if value else DEFAULT_BACKEND_DIR
+
+
+def get_backend_timeout() -> float:
+    return _get_float_env(BACKEND_TIMEOUT_ENV, DEFAULT_TIMEOUT_SECONDS)
+
+
 def get_mcp_host() -> str:
     return os.getenv(MCP_HOST_ENV, DEFAULT_MCP_HOST)
 
 
 def get_mcp_port() -> int:
-    value = os.getenv(MCP_PORT_ENV)
+    return _get_int_env(MCP_PORT_ENV, DEFAULT_MCP_PORT)
+
+
+def get_backend_max_connections() -> int:
+    return _get_int_env(BACKEND_MAX_CONNECTIONS_ENV, DEFAULT_BACKEND_MAX_CONNECTIONS)
+
+
+def get_backend_max_keepalive() -> int:
+    return _get_int_env(BACKEND_MAX_KEEPALIVE_ENV, DEFAULT_BACKEND_MAX_KEEPALIVE)
+
+
+def get_backend_keepalive_expiry() -> float:
+    return _get_float_env(BACKEND_KEEPALIVE_EXPIRY_ENV, DEFAULT_BACKEND_KEEPALIVE_EXPIRY)
+
+
+def get_backend_http2() -> bool:
+    return _get_bool_env(BACKEND_HTTP2_ENV, False)
+
+
+def get_backend_max_retries() -> int:
+    return _get_int_env(BACKEND_MAX_RETRIES_ENV, DEFAULT_BACKEND_MAX_RETRIES)
+
+
+def get_retry_budget_ratio() -> float:
+    return _get_float_env(RETRY_BUDGET_RATIO_ENV, DEFAULT_RETRY_BUDGET_RATIO)
+
+
+def get_retry_budget_min() -> int:
+    return _get_int_env(RETRY_BUDGET_MIN_ENV, DEFAULT_RETRY_BUDGET_MIN)
+
+
+def get_breaker_threshold() -> int:
+    return _get_int_env(BREAKER_THRESHOLD_ENV, DEFAULT_BREAKER_THRESHOLD)
+
+
+def get_breaker_reset() -> float:
+    return _get_float_env(BREAKER_RESET_ENV, DEFAULT_BREAKER_RESET)
+
+
+def get_hedge_enabled() -> bool:
+    return _get_bool_env(HEDGE_ENV, False)
+
+
+def get_hedge_percentile() -> float:
+    return _get_float_env(HEDGE_PERCENTILE_ENV, DEFAULT_HEDGE_PERCENTILE)
+
+
+def get_batch_concurrency() -> int:
+    return _get_int_env(BATCH_CONCURRENCY_ENV, DEFAULT_BATCH_CONCURRENCY)
+
+
+def get_cache_ttl() -> float:
+    return _get_float_env(CACHE_TTL_ENV, DEFAULT_CACHE_TTL)
+
+
+def get_cache_stale() -> float:
+    return _get_float_env(CACHE_STALE_ENV, DEFAULT_CACHE_STALE)
+
+
+def get_cache_max_entries() -> int:
+    return _get_int_env(CACHE_MAX_ENTRIES_ENV, DEFAULT_CACHE_MAX_ENTRIES)
+
+
+def get_watch_wait() -> float:
+    return _get_float_env(WATCH_WAIT_ENV, DEFAULT_WATCH_WAIT)
+
+
+def _get_int_env(name: str, default: int) -> int:
+    value = os.getenv(name)
     if not value:
-        return DEFAULT_MCP_PORT
+        return default
     try:
         return int(value)
     except ValueError as exc:
-        raise ValueError(f"Invalid {MCP_PORT_ENV}: {value}") from exc
+        raise ValueError(f"Invalid {name}: {value}") from exc
+
+
+def _get_float_env(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError as exc:
+        raise ValueError(f"Invalid {name}: {value}") from exc
+
+
+def _get_bool_env(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if not value:
+        return default
+    normalized = value.strip().lower()
+    if normalized in {"1", "true", "yes", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "off"}:
+        return False
+    raise ValueError(f"Invalid {name}: {value}")
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from contextlib import AbstractAsyncContextManager
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+BACKEND_PACKAGE = "app"
+EMBEDDED_PREFIX = "embedded_backend"
+
+
+def _package_modules(package: str) -> dict[str, Any]:
+    return {name: module for name, module in sys.modules.items() if name == package or name.startswith(f"{package}.")}
+
+
+def load_backend_app(backend_dir: Path) -> Any:
+    if not (backend_dir / BACKEND_PACKAGE / "main.py").is_file():
+        raise RuntimeError(f"backend package not found in {backend_dir}")
+    embedded = sys.modules.get(f"{EMBEDDED_PREFIX}.{BACKEND_PACKAGE}.main")
+    if embedded is not None:
+        return embedded.app
+
+    own_modules = _package_modules(BACKEND_PACKAGE)
+    for name in own_modules:
+        del sys.modules[name]
+    sys.path.insert(0, str(backend_dir))
+    try:
+        backend_main = importlib.import_module(f"{BACKEND_PACKAGE}.main")
+    finally:
+        sys.path.remove(str(backend_dir))
+        for name, module in _package_modules(BACKEND_PACKAGE).items():
+            del sys.modules[name]
+            sys.modules[f"{EMBEDDED_PREFIX}.{name}"] = module
+        sys.modules.update(own_modules)
+    return backend_main.app
+
+
+def embedded_transport(backend_app: Any) -> httpx.ASGITransport:
+    return httpx.ASGITransport(app=backend_app)
+
+
+def backend_lifespan(backend_app: Any) -> AbstractAsyncContextManager[object]:
+    return backend_app.router.lifespan_context(backend_app)
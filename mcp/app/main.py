@@ -1,7 +1,10 @@
 from app.client import BackendClient
-from app.core import get_mcp_host, get_mcp_port
+from app.core import EMBEDDED_BASE_URL, get_backend_dir, get_backend_mode, get_mcp_host, get_mcp_port
+from app.embedded import backend_lifespan, embedded_transport, load_backend_app
 from app.resources import register_resources
+from app.routes import register_routes
 from app.server import ChatGPTFastMCP
+from app.subscriptions import ChangeWatcher
 from app.tools import register_tools
 
 
@@ -9,9 +12,18 @@ def create_server() -> ChatGPTFastMCP:
     mcp = ChatGPTFastMCP("incidents-runbooks-mcp")
     mcp.settings.host = get_mcp_host()
     mcp.settings.port = get_mcp_port()
-    client = BackendClient()
+    if get_backend_mode() == "embedded":
+        backend_app = load_backend_app(get_backend_dir())
+        mcp.add_lifespan_hook(lambda: backend_lifespan(backend_app))
+        client = BackendClient(base_url=EMBEDDED_BASE_URL, transport=embedded_transport(backend_app))
+    else:
+        client = BackendClient()
+    watcher = ChangeWatcher(client, mcp.subscriptions)
+    mcp.add_lifespan_hook(client.lifespan)
+    mcp.add_lifespan_hook(watcher.lifespan)
     register_tools(mcp, client)
     register_resources(mcp, client)
+    register_routes(mcp, client, watcher)
     return mcp
 
 
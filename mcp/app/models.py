@@ -1,9 +1,11 @@
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 IncidentSeverity = Literal["P1", "P2", "P3", "P4"]
 IncidentStatus = Literal["Open", "Closed"]
+ChangeEntity = Literal["incident", "runbook"]
+ChangeOperation = Literal["create", "update", "delete"]
 
 
 class IncidentNote(BaseModel):
@@ -30,3 +32,70 @@ class Runbook(BaseModel):
     content: str
     createdAt: str
     updatedAt: str
+
+
+class IncidentSummary(BaseModel):
+    id: str
+    title: str
+    severity: IncidentSeverity
+    status: IncidentStatus
+    service: str
+    updatedAt: str
+    noteCount: int
+
+
+class RunbookSummary(BaseModel):
+    id: str
+    title: str
+    tags: list[str]
+    updatedAt: str
+
+
+class RunbookSection(BaseModel):
+    runbookId: str
+    title: str
+    section: int
+    total: int
+    heading: str | None
+    content: str
+    next: str | None = None
+
+
+class Page(BaseModel):
+    total: int
+    offset: int
+    returned: int
+    bytes: int
+    truncated: bool
+    nextCursor: str | None = None
+
+
+class Change(BaseModel):
+    seq: int
+    entity: ChangeEntity
+    id: str
+    op: ChangeOperation
+    at: str
+
+
+class ChangeBatch(BaseModel):
+    changes: list[Change]
+    latest: int
+    reset: bool
+
+
+INCIDENT = TypeAdapter(Incident)
+INCIDENT_LIST = TypeAdapter(list[Incident])
+RUNBOOK = TypeAdapter(Runbook)
+RUNBOOK_LIST = TypeAdapter(list[Runbook])
+RUNBOOK_SUMMARY_LIST = TypeAdapter(list[RunbookSummary])
+
+
+class IncidentBatch(BaseModel):
+    items: list[Incident]
+    missing: list[str]
+
+
+class RunbookBatch(BaseModel):
+    items: list[Runbook]
+    missing: list[str]
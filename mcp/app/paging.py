@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import re
+from typing import Callable, Mapping, Sequence, TypeVar
+
+import pydantic_core
+
+from app.models import Page
+
+T = TypeVar("T")
+
+_HEADING = re.compile(r"^#{1,6}\s+(.*)$")
+_FENCES = ("```", "~~~")
+
+
+class CursorError(ValueError):
+    pass
+
+
+def _fingerprint(filters: Mapping[str, str]) -> str:
+    canonical = json.dumps(sorted(filters.items()), separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_cursor(offset: int, filters: Mapping[str, str]) -> str:
+    payload = json.dumps({"o": offset, "f": _fingerprint(filters)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str | None, filters: Mapping[str, str]) -> int:
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        offset = int(payload["o"])
+        fingerprint = payload["f"]
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as exc:
+        raise CursorError("invalid cursor") from exc
+    if offset < 0 or fingerprint != _fingerprint(filters):
+        raise CursorError("invalid cursor")
+    return offset
+
+
+def budget_page(
+    items: Sequence[T],
+    offset: int,
+    limit: int,
+    max_bytes: int,
+    project: Callable[[T], object] | None = None,
+) -> tuple[list[object], int]:
+    page: list[object] = []
+    used = 2
+    for item in items[offset : offset + limit]:
+        value = item if project is None else project(item)
+        size = len(pydantic_core.to_json(value)) + 1
+        if page and used + size > max_bytes:
+            break
+        page.append(value)
+        used += size
+    return page, used
+
+
+def paginate(
+    items: Sequence[T],
+    filters: Mapping[str, str],
+    offset: int,
+    limit: int,
+    max_bytes: int,
+    project: Callable[[T], object] | None = None,
+) -> tuple[list[object], Page]:
+    page, used = budget_page(items, offset, limit, max_bytes, project)
+    next_offset = offset + len(page)
+    truncated = next_offset < len(items)
+    info = Page(
+        total=len(items),
+        offset=offset,
+        returned=len(page),
+        bytes=used,
+        truncated=truncated,
+        nextCursor=encode_cursor(next_offset, filters) if truncated else None,
+    )
+    return page, info
+
+
+def _fence_states(lines: list[str]) -> list[bool]:
+    fenced: list[bool] = []
+    in_fence = False
+    for line in lines:
+        if line.lstrip().startswith(_FENCES):
+            in_fence = not in_fence
+            fenced.append(True)
+        else:
+            fenced.append(in_fence)
+    return fenced
+
+
+def split_sections(content: str) -> list[tuple[str | None, str]]:
+    # Headings and blank lines inside ``` / ~~~ fences are code, not structure.
+    lines = content.splitlines()
+    fenced = _fence_states(lines)
+    headings = [None if inside else _HEADING.match(line) for line, inside in zip(lines, fenced)]
+    if any(headings):
+        sections: list[tuple[str | None, list[str]]] = [(None, [])]
+        for line, heading in zip(lines, headings):
+            if heading:
+                sections.append((heading.group(1).strip(), []))
+            else:
+                sections[-1][1].append(line)
+        parts = [(heading, "\n".join(body).strip()) for heading, body in sections]
+        return [(heading, body) for heading, body in parts if heading is not None or body]
+    blocks: list[list[str]] = [[]]
+    for line, inside in zip(lines, fenced):
+        if not inside and not line.strip():
+            if blocks[-1]:
+                blocks.append([])
+        else:
+            blocks[-1].append(line)
+    paragraphs = ["\n".join(block).strip() for block in blocks if block]
+    return [(None, paragraph) for paragraph in paragraphs if paragraph] or [(None, "")]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from typing import Callable, Literal
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.short_circuited = 0
+        self._clock = clock
+        self._state: BreakerState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> BreakerState:
+        if self._state == "open" and self._clock() - self._opened_at >= self.reset_seconds:
+            return "half_open"
+        return self._state
+
+    def allow(self) -> bool:
+        if self.failure_threshold <= 0 or self._state == "closed":
+            return True
+        if self.state == "open":
+            self.short_circuited += 1
+            return False
+        self._state = "half_open"
+        if self._probing:
+            self.short_circuited += 1
+            return False
+        self._probing = True
+        return True
+
+    def release(self) -> None:
+        self._probing = False
+
+    def record_success(self) -> None:
+        self._state = "closed"
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == "half_open" or (0 < self.failure_threshold <= self._failures):
+            self._state = "open"
+            self._opened_at = self._clock()
+            self._probing = False
+
+
+class RetryBudget:
+    def __init__(self, ratio: float, min_tokens: float):
+        self.ratio = ratio
+        self.min_tokens = min_tokens
+        self.max_tokens = max(min_tokens, 1.0) * 10
+        self.balance = float(min_tokens)
+        self.spent = 0
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        self.balance = min(self.max_tokens, self.balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.balance < 1.0:
+            self.exhausted += 1
+            return False
+        self.balance -= 1.0
+        self.spent += 1
+        return True
+
+
+class RouteGuard:
+    def __init__(self, breaker: CircuitBreaker, budget: RetryBudget):
+        self.breaker = breaker
+        self.budget = budget
+
+
+class RouteGuards:
+    def __init__(
+        self,
+        breaker_factory: Callable[[], CircuitBreaker],
+        budget_factory: Callable[[], RetryBudget],
+    ):
+        self._breaker_factory = breaker_factory
+        self._budget_factory = budget_factory
+        self._routes: dict[str, RouteGuard] = {}
+
+    def __getitem__(self, route: str) -> RouteGuard:
+        guard = self._routes.get(route)
+        if guard is None:
+            guard = self._routes[route] = RouteGuard(self._breaker_factory(), self._budget_factory())
+        return guard
+
+    def items(self) -> list[tuple[str, RouteGuard]]:
+        return sorted(self._routes.items())
+
+
+class LatencyTracker:
+    def __init__(self, percentile: float, window: int = 256, min_samples: int = 20):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def threshold(self) -> float | None:
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+
+
+def backoff_delay(attempt: int, base_seconds: float, cap_seconds: float) -> float:
+    return random.uniform(0, min(cap_seconds, base_seconds * 2**attempt))
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Sequence
 from urllib.parse import parse_qs
 
 from mcp.server.fastmcp import FastMCP
+from pydantic import BaseModel
 
 from app.client import BackendClient, BackendNotFoundError, BackendUnavailableError
-from app.models import Incident, Runbook
+from app.core import RESOURCE_MAX_BYTES, RESOURCE_PAGE_MAX, RESOURCE_PAGE_SIZE
+from app.models import Incident, Runbook, RunbookSection, RunbookSummary
+from app.paging import CursorError, decode_cursor, paginate, split_sections
 from app.widgets import WIDGETS, WidgetResource, widget_meta
 
+_PAGING_KEYS = {"limit", "cursor", "fields"}
+
 
 def _clean_params(**kwargs: str | None) -> dict[str, str]:
     return {key: value for key, value in kwargs.items() if value is not None}
@@ -20,12 +25,55 @@ def _parse_query(query: str) -> dict[str, str]:
     return {key: values[0] for key, values in parsed.items() if values}
 
 
-def _map_list(items: Iterable[dict], model):
-    return [model.model_validate(item).model_dump() for item in items]
-
-
-def _map_item(item: dict, model) -> dict:
-    return model.model_validate(item).model_dump()
+def _parse_limit(value: str | None) -> int:
+    if value is None:
+        return RESOURCE_PAGE_SIZE
+    try:
+        limit = int(value)
+    except ValueError as exc:
+        raise RuntimeError("invalid limit") from exc
+    if not 1 <= limit <= RESOURCE_PAGE_MAX:
+        raise RuntimeError("invalid limit")
+    return limit
+
+
+def _parse_fields(value: str | None, model: type[BaseModel]) -> set[str] | None:
+    if value is None:
+        return None
+    fields = {name.strip() for name in value.split(",") if name.strip()}
+    if not fields or not fields <= model.model_fields.keys():
+        raise RuntimeError("invalid fields")
+    return fields | {"id"}
+
+
+def _resource_page(
+    items: Sequence[BaseModel], params: dict[str, str], parsed: dict[str, str], fields: set[str] | None
+) -> dict:
+    limit = _parse_limit(parsed.get("limit"))
+    try:
+        offset = decode_cursor(parsed.get("cursor"), params)
+    except CursorError as exc:
+        raise RuntimeError("invalid cursor") from exc
+    project = None if fields is None else (lambda item: item.model_dump(include=fields))
+    page, info = paginate(items, params, offset, limit, RESOURCE_MAX_BYTES, project)
+    return {"items": page, "filters": params, "page": info}
+
+
+def _section(runbook: Runbook, section: str) -> RunbookSection:
+    sections = split_sections(runbook.content)
+    if not section.isdigit() or not 1 <= int(section) <= len(sections):
+        raise RuntimeError("not found")
+    index = int(section)
+    heading, content = sections[index - 1]
+    return RunbookSection(
+        runbookId=runbook.id,
+        title=runbook.title,
+        section=index,
+        total=len(sections),
+        heading=heading,
+        content=content,
+        next=f"runbooks://{runbook.id}/sections/{index + 1}" if index < len(sections) else None,
+    )
 
 
 def register_resources(mcp: FastMCP, client: BackendClient) -> None:
@@ -36,12 +84,12 @@ def register_resources(mcp: FastMCP, client: BackendClient) -> None:
         description="List incidents from the backend.",
         mime_type="application/json",
     )
-    async def incidents_collection() -> list[dict]:
+    async def incidents_collection() -> list[Incident]:
         try:
             data = await client.list_incidents()
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return _map_list(data, Incident)
+        return data
 
     @mcp.resource(
         "incidents://?{query}",
@@ -50,7 +98,7 @@ def register_resources(mcp: FastMCP, client: BackendClient) -> None:
         description="List incidents using query filters.",
         mime_type="application/json",
     )
-    async def incidents_collection_filtered(query: str) -> list[dict] | dict:
+    async def incidents_collection_filtered(query: str) -> list[Incident] | Incident | dict:
         if "=" not in query and not query.startswith("?"):
             try:
                 data = await client.get_incident(query)
@@ -58,7 +106,7 @@ def register_resources(mcp: FastMCP, client: BackendClient) -> None:
                 raise RuntimeError("not found") from exc
             except BackendUnavailableError as exc:
                 raise RuntimeError("backend unavailable") from exc
-            return _map_item(data, Incident)
+            return data
         parsed = _parse_query(query)
         params = _clean_params(
             q=parsed.get("q"),
@@ -66,11 +114,14 @@ def register_resources(mcp: FastMCP, client: BackendClient) -> None:
             severity=parsed.get("severity"),
             service=parsed.get("service"),
         )
+        fields = _parse_fields(parsed.get("fields"), Incident)
         try:
             data = await client.list_incidents(params=params or None)
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return _map_list(data, Incident)
+        if _PAGING_KEYS & parsed.keys():
+            return _resource_page(data, params, parsed, fields)
+        return data
 
     @mcp.resource(
         "incidents://{incident_id}",
@@ -79,14 +130,14 @@ def register_resources(mcp: FastMCP, client: BackendClient) -> None:
         description="Incident details by id.",
         mime_type="application/json",
     )
-    async def incident_item(incident_id: str) -> dict:
+    async def incident_item(incident_id: str) -> Incident:
         try:
             data = await client.get_incident(incident_id)
         except BackendNotFoundError as exc:
             raise RuntimeError("not found") from exc
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return _map_item(data, Incident)
+        return data
 
     @mcp.resource(
         "runbooks://",
@@ -95,12 +146,12 @@ def register_resources(mcp: FastMCP, client: BackendClient) -> None:
         description="List runbooks from the backend.",
         mime_type="application/json",
     )
-    async def runbooks_collection() -> list[dict]:
+    async def runbooks_collection() -> list[Runbook]:
         try:
             data = await client.list_runbooks()
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return _map_list(data, Runbook)
+        return data
 
     @mcp.resource(
         "runbooks://?{query}",
@@ -109,7 +160,7 @@ def register_resources(mcp: FastMCP, client: BackendClient) -> None:
         description="List runbooks using query filters.",
         mime_type="application/json",
     )
-    async def runbooks_collection_filtered(query: str) -> list[dict] | dict:
+    async def runbooks_collection_filtered(query: str) -> list[Runbook] | Runbook | dict:
         if "=" not in query and not query.startswith("?"):
             try:
                 data = await client.get_runbook(query)
@@ -117,14 +168,20 @@ def register_resources(mcp: FastMCP, client: BackendClient) -> None:
                 raise RuntimeError("not found") from exc
             except BackendUnavailableError as exc:
                 raise RuntimeError("backend unavailable") from exc
-            return _map_item(data, Runbook)
+            return data
         parsed = _parse_query(query)
         params = _clean_params(q=parsed.get("q"), tag=parsed.get("tag"))
+        fields = _parse_fields(parsed.get("fields"), Runbook)
         try:
-            data = await client.list_runbooks(params=params or None)
+            if fields is not None and fields <= RunbookSummary.model_fields.keys():
+                data = await client.list_runbook_summaries(params=params or None)
+            else:
+                data = await client.list_runbooks(params=params or None)
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return _map_list(data, Runbook)
+        if _PAGING_KEYS & parsed.keys():
+            return _resource_page(data, params, parsed, fields)
+        return data
 
     @mcp.resource(
         "runbooks://{runbook_id}",
@@ -133,14 +190,30 @@ def register_resources(mcp: FastMCP, client: BackendClient) -> None:
         description="Runbook details by id.",
         mime_type="application/json",
     )
-    async def runbook_item(runbook_id: str) -> dict:
+    async def runbook_item(runbook_id: str) -> Runbook:
         try:
             data = await client.get_runbook(runbook_id)
         except BackendNotFoundError as exc:
             raise RuntimeError("not found") from exc
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return _map_item(data, Runbook)
+        return data
+
+    @mcp.resource(
+        "runbooks://{runbook_id}/sections/{section}",
+        name="runbook-section",
+        title="Runbook section",
+        description="One section of a runbook, numbered from 1.",
+        mime_type="application/json",
+    )
+    async def runbook_section(runbook_id: str, section: str) -> RunbookSection:
+        try:
+            runbook = await client.get_runbook(runbook_id)
+        except BackendNotFoundError as exc:
+            raise RuntimeError("not found") from exc
+        except BackendUnavailableError as exc:
+            raise RuntimeError("backend unavailable") from exc
+        return _section(runbook, section)
 
     for widget in WIDGETS:
         resource = WidgetResource(
@@ -0,0 +1,21 @@
+from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from app.client import BackendClient
+from app.subscriptions import ChangeWatcher
+
+
+def register_routes(mcp: FastMCP, client: BackendClient, watcher: ChangeWatcher) -> None:
+    @mcp.custom_route("/stats", methods=["GET"])
+    async def stats(request: Request) -> JSONResponse:
+        cache = {**client.cache.stats.as_dict(), "entries": len(client.cache)}
+        single_flight = {"inFlight": client.in_flight, "coalesced": client.coalesced}
+        return JSONResponse(
+            {
+                "cache": cache,
+                "singleFlight": single_flight,
+                "resilience": client.resilience_stats(),
+                "subscriptions": watcher.stats(),
+            }
+        )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import base64
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Callable, Iterable
 
 from mcp import types
 from mcp.server.fastmcp import FastMCP
@@ -11,6 +12,8 @@ from mcp.types import Resource as MCPResource
 from mcp.types import ResourceTemplate as MCPResourceTemplate
 from starlette.routing import Route
 
+from app.subscriptions import SubscriptionRegistry
+
 
 @dataclass
 class ReadResourceContentsWithMeta:
@@ -22,6 +25,21 @@ class ReadResourceContentsWithMeta:
 class ChatGPTFastMCP(FastMCP):
     _messages_route_added: bool = False
 
+    def __init__(self, *args, **kwargs) -> None:
+        self.subscriptions = SubscriptionRegistry()
+        super().__init__(*args, **kwargs)
+        self._lifespan_hooks: list[Callable[[], AbstractAsyncContextManager[object]]] = []
+
+    def add_lifespan_hook(self, hook: Callable[[], AbstractAsyncContextManager[object]]) -> None:
+        self._lifespan_hooks.append(hook)
+
+    @asynccontextmanager
+    async def run_lifespan_hooks(self):
+        async with AsyncExitStack() as stack:
+            for hook in self._lifespan_hooks:
+                await stack.enter_async_context(hook())
+            yield
+
     async def list_resources(self) -> list[MCPResource]:
         resources = self._resource_manager.list_resources()
         return [
@@ -103,8 +121,35 @@ class ChatGPTFastMCP(FastMCP):
 
         self._mcp_server.request_handlers[types.ReadResourceRequest] = handler
 
+        @self._mcp_server.subscribe_resource()
+        async def subscribe(uri) -> None:
+            self.subscriptions.subscribe(str(uri), self._mcp_server.request_context.session)
+
+        @self._mcp_server.unsubscribe_resource()
+        async def unsubscribe(uri) -> None:
+            self.subscriptions.unsubscribe(str(uri), self._mcp_server.request_context.session)
+
+        get_capabilities = self._mcp_server.get_capabilities
+
+        def capabilities(*args, **kwargs) -> types.ServerCapabilities:
+            result = get_capabilities(*args, **kwargs)
+            if result.resources is not None:
+                result.resources.subscribe = True
+            return result
+
+        self._mcp_server.get_capabilities = capabilities
+
     def streamable_http_app(self):
         app = super().streamable_http_app()
+        session_lifespan = app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan(starlette_app):
+            async with self.run_lifespan_hooks():
+                async with session_lifespan(starlette_app):
+                    yield
+
+        app.router.lifespan_context = lifespan
         if self._messages_route_added:
             return app
         endpoint = None
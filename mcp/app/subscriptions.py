@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Iterable
+
+import anyio
+from mcp.server.session import ServerSession
+from pydantic import AnyUrl
+
+from app.client import BackendClient, BackendUnavailableError
+from app.core import WATCH_BACKOFF_CAP_SECONDS, WATCH_BACKOFF_SECONDS, get_watch_wait
+from app.models import Change, ChangeBatch
+from app.resilience import backoff_delay
+
+logger = logging.getLogger(__name__)
+
+
+def affects(uri: str, change: Change) -> bool:
+    scheme = f"{change.entity}s://"
+    if not uri.startswith(scheme):
+        return False
+    rest = uri[len(scheme) :]
+    if rest.startswith("?"):
+        query = rest[1:]
+        # incidents://?{query} doubles as an id lookup when the query has no filters.
+        return "=" in query or not query or query == change.id
+    return not rest or rest == change.id or rest.startswith(f"{change.id}/")
+
+
+class SubscriptionRegistry:
+    def __init__(self) -> None:
+        self._sessions: dict[str, weakref.WeakSet[ServerSession]] = {}
+        self._subscribed = asyncio.Event()
+        self.notified = 0
+
+    def __len__(self) -> int:
+        return len(self.uris())
+
+    def subscribe(self, uri: str, session: ServerSession) -> None:
+        self._sessions.setdefault(uri, weakref.WeakSet()).add(session)
+        self._subscribed.set()
+
+    def unsubscribe(self, uri: str, session: ServerSession) -> None:
+        sessions = self._sessions.get(uri)
+        if sessions is None:
+            return
+        sessions.discard(session)
+        if not sessions:
+            del self._sessions[uri]
+        if not self._sessions:
+            self._subscribed.clear()
+
+    def uris(self) -> list[str]:
+        return [uri for uri, sessions in self._sessions.items() if sessions]
+
+    async def wait_for_subscribers(self) -> bool:
+        if self.uris():
+            return False
+        self._subscribed.clear()
+        await self._subscribed.wait()
+        return True
+
+    async def notify(self, uris: Iterable[str]) -> None:
+        for uri in uris:
+            for session in list(self._sessions.get(uri, ())):
+                try:
+                    await session.send_resource_updated(AnyUrl(uri))
+                except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                    self.unsubscribe(uri, session)
+                    continue
+                self.notified += 1
+
+
+class ChangeWatcher:
+    def __init__(
+        self,
+        client: BackendClient,
+        registry: SubscriptionRegistry,
+        wait_seconds: float | None = None,
+        backoff_seconds: float = WATCH_BACKOFF_SECONDS,
+    ):
+        self.client = client
+        self.registry = registry
+        self.wait_seconds = get_watch_wait() if wait_seconds is None else wait_seconds
+        self.backoff_seconds = backoff_seconds
+        self.cursor: int | None = None
+        self.polls = 0
+        self.resets = 0
+        self.errors = 0
+
+    @asynccontextmanager
+    async def lifespan(self) -> AsyncIterator[ChangeWatcher]:
+        task = asyncio.create_task(self.run())
+        try:
+            yield self
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def run(self) -> None:
+        failures = 0
+        while True:
+            if await self.registry.wait_for_subscribers():
+                # Changes made while nobody was subscribed are not worth replaying.
+                self.cursor = None
+            try:
+                await self.poll()
+            except BackendUnavailableError:
+                self.errors += 1
+            except Exception:
+                # A bad batch or a failed notification must not end the watcher for every subscriber.
+                self.errors += 1
+                logger.exception("Change watcher poll failed")
+            else:
+                failures = 0
+                continue
+            await asyncio.sleep(backoff_delay(failures, self.backoff_seconds, WATCH_BACKOFF_CAP_SECONDS))
+            failures += 1
+
+    async def poll(self) -> None:
+        if self.cursor is None:
+            self.cursor = (await self.client.wait_for_changes(0, 0, limit=1)).latest
+            return
+        batch = await self.client.wait_for_changes(self.cursor, self.wait_seconds)
+        self.polls += 1
+        await self.apply(batch)
+
+    async def apply(self, batch: ChangeBatch) -> None:
+        if batch.reset:
+            self.resets += 1
+            self.client.cache.clear()
+            self.cursor = batch.latest
+            await self.registry.notify(self.registry.uris())
+            return
+        if not batch.changes:
+            return
+        for change in batch.changes:
+            self.client.invalidate(change.entity, change.id)
+        self.cursor = batch.changes[-1].seq
+        uris = [uri for uri in self.registry.uris() if any(affects(uri, change) for change in batch.changes)]
+        await self.registry.notify(uris)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "uris": len(self.registry),
+            "cursor": self.cursor,
+            "polls": self.polls,
+            "resets": self.resets,
+            "errors": self.errors,
+            "notified": self.registry.notified,
+        }
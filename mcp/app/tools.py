@@ -1,10 +1,21 @@
-from typing import Iterable
+from typing import Annotated, Iterable, Sequence
 
 from mcp.server.fastmcp import FastMCP
 from mcp.types import CallToolResult, TextContent
+from pydantic import BaseModel, Field
 
 from app.client import BackendClient, BackendNotFoundError, BackendUnavailableError
-from app.models import Incident, IncidentSeverity, IncidentStatus, Runbook
+from app.core import WIDGET_MAX_BYTES, WIDGET_PAGE_MAX, WIDGET_PAGE_SIZE
+from app.models import (
+    Incident,
+    IncidentBatch,
+    IncidentSeverity,
+    IncidentStatus,
+    IncidentSummary,
+    Runbook,
+    RunbookBatch,
+)
+from app.paging import CursorError, decode_cursor, paginate
 from app.widgets import Widget, widgets_by_id, widget_meta
 
 
@@ -12,16 +23,52 @@ def _clean_params(**kwargs: str | None) -> dict[str, str]:
     return {key: value for key, value in kwargs.items() if value is not None}
 
 
-def _map_list(items: Iterable[dict], model):
-    return [model.model_validate(item) for item in items]
+def _missing_ids(requested: list[str], items: Iterable[Incident | Runbook]) -> list[str]:
+    found = {item.id for item in items}
+    return [item_id for item_id in dict.fromkeys(requested) if item_id not in found]
 
 
-def _map_list_dump(items: Iterable[dict], model) -> list[dict]:
-    return [model.model_validate(item).model_dump() for item in items]
+PageSize = Annotated[int, Field(ge=1, le=WIDGET_PAGE_MAX, description="Maximum items to return.")]
+MaxBytes = Annotated[
+    int, Field(ge=1024, description="Approximate JSON size budget for items (about 4 bytes per token).")
+]
+Cursor = Annotated[str | None, Field(description="nextCursor from a previous truncated response.")]
 
 
-def _map_item_dump(item: dict, model) -> dict:
-    return model.model_validate(item).model_dump()
+def _incident_summary(incident: Incident) -> IncidentSummary:
+    return IncidentSummary.model_construct(
+        id=incident.id,
+        title=incident.title,
+        severity=incident.severity,
+        status=incident.status,
+        service=incident.service,
+        updatedAt=incident.updatedAt,
+        noteCount=len(incident.notes),
+    )
+
+
+def _decode_cursor(cursor: str | None, params: dict[str, str]) -> int:
+    try:
+        return decode_cursor(cursor, params)
+    except CursorError as exc:
+        raise RuntimeError("invalid cursor") from exc
+
+
+def _paged_structured(
+    summaries: Sequence[BaseModel], params: dict[str, str], offset: int, limit: int, max_bytes: int
+) -> dict:
+    page, info = paginate(summaries, params, offset, limit, max_bytes, project=BaseModel.model_dump)
+    return {"items": page, "filters": params, "page": info.model_dump()}
+
+
+def _paged_text(text: str, structured: dict) -> str:
+    page = structured["page"]
+    if not page["truncated"]:
+        return text
+    return (
+        f"{text} {page['offset'] + page['returned']} of {page['total']} shown; "
+        f"call again with cursor=\"{page['nextCursor']}\" for more."
+    )
 
 
 def _widget_response_text(widget: Widget, **kwargs: str) -> str:
@@ -47,42 +94,56 @@ def register_tools(mcp: FastMCP, client: BackendClient) -> None:
         """List incidents from the backend."""
         params = _clean_params(q=q, status=status, severity=severity, service=service)
         try:
-            data = await client.list_incidents(params=params or None)
+            return await client.list_incidents(params=params or None)
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return _map_list(data, Incident)
 
     @mcp.tool()
     async def get_incident(incident_id: str) -> Incident:
         """Fetch a single incident by id."""
         try:
-            data = await client.get_incident(incident_id)
+            return await client.get_incident(incident_id)
         except BackendNotFoundError as exc:
             raise RuntimeError("Incident not found") from exc
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return Incident.model_validate(data)
+
+    @mcp.tool()
+    async def get_incidents(incident_ids: list[str]) -> IncidentBatch:
+        """Fetch several incidents by id in one call; unknown ids are listed under missing."""
+        try:
+            data = await client.get_incidents(incident_ids)
+        except BackendUnavailableError as exc:
+            raise RuntimeError("backend unavailable") from exc
+        return IncidentBatch(items=data, missing=_missing_ids(incident_ids, data))
 
     @mcp.tool()
     async def list_runbooks(q: str | None = None, tag: str | None = None) -> list[Runbook]:
         """List runbooks from the backend."""
         params = _clean_params(q=q, tag=tag)
         try:
-            data = await client.list_runbooks(params=params or None)
+            return await client.list_runbooks(params=params or None)
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return _map_list(data, Runbook)
 
     @mcp.tool()
     async def get_runbook(runbook_id: str) -> Runbook:
         """Fetch a single runbook by id."""
         try:
-            data = await client.get_runbook(runbook_id)
+            return await client.get_runbook(runbook_id)
         except BackendNotFoundError as exc:
             raise RuntimeError("Runbook not found") from exc
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        return Runbook.model_validate(data)
+
+    @mcp.tool()
+    async def get_runbooks(runbook_ids: list[str]) -> RunbookBatch:
+        """Fetch several runbooks by id in one call; unknown ids are listed under missing."""
+        try:
+            data = await client.get_runbooks(runbook_ids)
+        except BackendUnavailableError as exc:
+            raise RuntimeError("backend unavailable") from exc
+        return RunbookBatch(items=data, missing=_missing_ids(runbook_ids, data))
 
     incident_list_widget = widgets_by_id["incident_list_widget"]
 
@@ -97,15 +158,19 @@ def register_tools(mcp: FastMCP, client: BackendClient) -> None:
         status: IncidentStatus | None = None,
         severity: IncidentSeverity | None = None,
         service: str | None = None,
+        limit: PageSize = WIDGET_PAGE_SIZE,
+        cursor: Cursor = None,
+        max_bytes: MaxBytes = WIDGET_MAX_BYTES,
     ) -> CallToolResult:
         params = _clean_params(q=q, status=status, severity=severity, service=service)
+        offset = _decode_cursor(cursor, params)
         try:
             data = await client.list_incidents(params=params or None)
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        incidents = _map_list_dump(data, Incident)
-        structured = {"items": incidents, "filters": params}
-        text = _widget_response_text(incident_list_widget)
+        summaries = [_incident_summary(incident) for incident in data]
+        structured = _paged_structured(summaries, params, offset, limit, max_bytes)
+        text = _paged_text(_widget_response_text(incident_list_widget), structured)
         return _widget_result(incident_list_widget, text=text, structured=structured)
 
     incident_detail_widget = widgets_by_id["incident_detail_widget"]
@@ -123,7 +188,7 @@ def register_tools(mcp: FastMCP, client: BackendClient) -> None:
             raise RuntimeError("Incident not found") from exc
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        incident = _map_item_dump(data, Incident)
+        incident = data.model_dump()
         structured = {"incidentId": incident_id, "item": incident}
         text = _widget_response_text(incident_detail_widget, incident_id=incident_id)
         return _widget_result(incident_detail_widget, text=text, structured=structured)
@@ -136,15 +201,21 @@ def register_tools(mcp: FastMCP, client: BackendClient) -> None:
         description="Show runbooks in a widget.",
         meta=widget_meta(runbook_list_widget),
     )
-    async def show_runbook_list_widget(q: str | None = None, tag: str | None = None) -> CallToolResult:
+    async def show_runbook_list_widget(
+        q: str | None = None,
+        tag: str | None = None,
+        limit: PageSize = WIDGET_PAGE_SIZE,
+        cursor: Cursor = None,
+        max_bytes: MaxBytes = WIDGET_MAX_BYTES,
+    ) -> CallToolResult:
         params = _clean_params(q=q, tag=tag)
+        offset = _decode_cursor(cursor, params)
         try:
-            data = await client.list_runbooks(params=params or None)
+            summaries = await client.list_runbook_summaries(params=params or None)
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        runbooks = _map_list_dump(data, Runbook)
-        structured = {"items": runbooks, "filters": params}
-        text = _widget_response_text(runbook_list_widget)
+        structured = _paged_structured(summaries, params, offset, limit, max_bytes)
+        text = _paged_text(_widget_response_text(runbook_list_widget), structured)
         return _widget_result(runbook_list_widget, text=text, structured=structured)
 
     runbook_detail_widget = widgets_by_id["runbook_detail_widget"]
@@ -162,7 +233,7 @@ def register_tools(mcp: FastMCP, client: BackendClient) -> None:
             raise RuntimeError("Runbook not found") from exc
         except BackendUnavailableError as exc:
             raise RuntimeError("backend unavailable") from exc
-        runbook = _map_item_dump(data, Runbook)
+        runbook = data.model_dump()
         structured = {"runbookId": runbook_id, "item": runbook}
         text = _widget_response_text(runbook_detail_widget, runbook_id=runbook_id)
         return _widget_result(runbook_detail_widget, text=text, structured=structured)
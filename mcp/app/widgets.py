@@ -43,6 +43,7 @@ def _build_list_html(root_id: str, title: str, item_label: str) -> str:
   .widget-root h3 {{ margin: 0 0 8px 0; }}
   .widget-list {{ margin: 0; padding-left: 16px; }}
   .widget-list li {{ margin: 4px 0; }}
+  .widget-more {{ margin: 8px 0 0 0; color: #666; font-size: 0.9em; }}
 </style>
 <script>
   (function () {{
@@ -66,6 +67,13 @@ def _build_list_html(root_id: str, title: str, item_label: str) -> str:
       list.appendChild(li);
     }});
     target.appendChild(list);
+    const page = data.page;
+    if (page && page.truncated) {{
+      const more = document.createElement('p');
+      more.className = 'widget-more';
+      more.textContent = "Showing " + (page.offset + page.returned) + " of " + page.total + " {item_label}.";
+      target.appendChild(more);
+    }}
   }})();
 </script>
 """.strip()
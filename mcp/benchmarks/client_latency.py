@@ -0,0 +1,109 @@
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from app.client import BackendClient, ResponseCache
+from app.core import EMBEDDED_BASE_URL
+from app.embedded import backend_lifespan, embedded_transport, load_backend_app
+
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _spawn_backend(state_path: Path, port: int) -> subprocess.Popen[bytes]:
+    env = {**os.environ, "BACKEND_STATE_PATH": str(state_path)}
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--port", str(port), "--log-level", "warning", "--no-access-log",
+    ]
+    return subprocess.Popen(command, env=env, cwd=BACKEND_DIR)
+
+
+async def _wait_ready(base_url: str) -> None:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(200):
+            try:
+                if (await client.get("/healthz")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.05)
+    raise RuntimeError("backend did not start")
+
+
+def _no_cache() -> ResponseCache:
+    return ResponseCache(ttl_seconds=0, stale_seconds=0, max_entries=0)
+
+
+async def _measure(client: BackendClient, calls: int) -> dict[str, list[float]]:
+    incidents = await client.list_incidents()
+    incident_id = incidents[0].id
+    latencies: dict[str, list[float]] = {"list_incidents": [], "get_incident": []}
+    for _ in range(calls):
+        started = time.perf_counter()
+        await client.list_incidents()
+        latencies["list_incidents"].append(time.perf_counter() - started)
+        started = time.perf_counter()
+        await client.get_incident(incident_id)
+        latencies["get_incident"].append(time.perf_counter() - started)
+    return {name: sorted(values) for name, values in latencies.items()}
+
+
+async def _run(base_url: str, calls: int, state_path: Path) -> list[tuple[str, dict[str, list[float]]]]:
+    per_call = BackendClient(base_url=base_url, cache=_no_cache())
+    results = [("per-call", await _measure(per_call, calls))]
+    async with BackendClient(base_url=base_url, cache=_no_cache()).lifespan() as pooled:
+        results.append(("pooled", await _measure(pooled, calls)))
+    os.environ["BACKEND_STATE_PATH"] = str(state_path)
+    backend_app = load_backend_app(BACKEND_DIR)
+    embedded = BackendClient(base_url=EMBEDDED_BASE_URL, transport=embedded_transport(backend_app), cache=_no_cache())
+    async with backend_lifespan(backend_app), embedded.lifespan():
+        results.append(("embedded", await _measure(embedded, calls)))
+    return results
+
+
+def _percentile(latencies: list[float], fraction: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-call BackendClient latency with and without a pooled client.")
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        port = _free_port()
+        backend = _spawn_backend(Path(directory) / "state.json", port)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            asyncio.run(_wait_ready(base_url))
+            results = asyncio.run(_run(base_url, args.calls, Path(directory) / "embedded.json"))
+        finally:
+            backend.terminate()
+            backend.wait()
+
+    print(f"{'client':<9} {'call':<15} {'mean ms':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for mode, latencies in results:
+        for call, values in latencies.items():
+            mean = sum(values) / len(values) * 1000
+            print(
+                f"{mode:<9} {call:<15} {mean:>8.2f} "
+                f"{_percentile(values, 0.5):>8.2f} {_percentile(values, 0.99):>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
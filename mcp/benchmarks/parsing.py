@@ -0,0 +1,88 @@
+import argparse
+import json
+import time
+from typing import Callable
+
+import pydantic_core
+
+from app.models import INCIDENT_LIST, Incident
+
+
+def _payload(incidents: int, notes: int) -> bytes:
+    records = [
+        {
+            "id": f"incident-{index}",
+            "title": f"Checkout latency regression {index}",
+            "severity": "P2",
+            "status": "Open",
+            "service": "Checkout",
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-01-01T00:00:00Z",
+            "notes": [
+                {"timestamp": "2024-01-01T00:00:00Z", "author": "oncall", "text": f"Investigating step {note}"}
+                for note in range(notes)
+            ],
+        }
+        for index in range(incidents)
+    ]
+    return json.dumps(records).encode("utf-8")
+
+
+def _before_tool(body: bytes) -> object:
+    return [Incident.model_validate(item) for item in list(json.loads(body))]
+
+
+def _after_tool(body: bytes) -> object:
+    return INCIDENT_LIST.validate_json(body)
+
+
+def _before_widget(body: bytes) -> object:
+    return [Incident.model_validate(item).model_dump() for item in list(json.loads(body))]
+
+
+def _after_widget(body: bytes) -> object:
+    return INCIDENT_LIST.dump_python(INCIDENT_LIST.validate_json(body))
+
+
+def _before_resource(body: bytes) -> object:
+    items = [Incident.model_validate(item).model_dump() for item in list(json.loads(body))]
+    return pydantic_core.to_json(items, fallback=str, indent=2)
+
+
+def _after_resource(body: bytes) -> object:
+    return pydantic_core.to_json(INCIDENT_LIST.validate_json(body), fallback=str, indent=2)
+
+
+def _measure(fn: Callable[[bytes], object], body: bytes, rounds: int, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.process_time()
+        for _ in range(rounds):
+            fn(body)
+        best = min(best, (time.process_time() - started) / rounds)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CPU per tool call for decoding a large incident list.")
+    parser.add_argument("--incidents", type=int, default=2000)
+    parser.add_argument("--notes", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    body = _payload(args.incidents, args.notes)
+    print(f"payload: {args.incidents} incidents, {len(body) / 1024:.0f} KiB")
+    print(f"{'path':<9} {'before ms':>10} {'after ms':>9} {'saved':>7}")
+    for name, before, after in (
+        ("tool", _before_tool, _after_tool),
+        ("widget", _before_widget, _after_widget),
+        ("resource", _before_resource, _after_resource),
+    ):
+        before_ms = _measure(before, body, args.rounds)
+        after_ms = _measure(after, body, args.rounds)
+        print(f"{name:<9} {before_ms:>10.2f} {after_ms:>9.2f} {1 - after_ms / before_ms:>7.0%}")
+    print("cache hits now return the validated models without decoding (0 ms).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+MCP_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(MCP_DIR))
+
+from app.client import BackendClient, BackendNotFoundError, BackendUnavailableError, ResponseCache  # noqa: E402
+from app.resilience import CircuitBreaker, LatencyTracker, RetryBudget, RouteGuards  # noqa: E402
+
+
+def _incident(incident_id: str) -> dict:
+    return {
+        "id": incident_id,
+        "title": "Checkout latency",
+        "severity": "P2",
+        "status": "Open",
+        "service": "Checkout",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+        "notes": [],
+    }
+
+
+def _transport(calls: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path == "/api/v1/incidents/missing":
+            return httpx.Response(404, json={"detail": "Incident not found"})
+        if request.url.path == "/api/v1/incidents":
+            return httpx.Response(200, json=[_incident("inc-1")])
+        return httpx.Response(200, json=_incident(request.url.path.rsplit("/", 1)[-1]))
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_reuses_one_http_client_until_closed() -> None:
+    calls: list[httpx.Request] = []
+    client = BackendClient(base_url="http://backend", transport=_transport(calls))
+
+    async with client.lifespan():
+        assert client.is_open
+        pool = client._http
+        assert (await client.get_incident("inc-7")).id == "inc-7"
+        assert await client.list_incidents({"status": "Open"})
+        assert client._http is pool
+        with pytest.raises(BackendNotFoundError):
+            await client.get_incident("missing")
+
+    assert not client.is_open
+    assert [request.url.path for request in calls] == [
+        "/api/v1/incidents/inc-7",
+        "/api/v1/incidents",
+        "/api/v1/incidents/missing",
+    ]
+    assert calls[1].url.params["status"] == "Open"
+
+
+@pytest.mark.asyncio
+async def test_unopened_client_still_serves_requests() -> None:
+    calls: list[httpx.Request] = []
+    client = BackendClient(base_url="http://backend", transport=_transport(calls))
+
+    assert (await client.get_incident("inc-3")).id == "inc-3"
+    assert not client.is_open
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_map_to_backend_unavailable() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    client = BackendClient(base_url="http://backend", transport=httpx.MockTransport(handler))
+    async with client.lifespan():
+        with pytest.raises(BackendUnavailableError):
+            await client.list_incidents()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _etag_transport(calls: list[httpx.Request], versions: dict[str, int]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        incident_id = request.url.path.rsplit("/", 1)[-1]
+        etag = f'"{incident_id}-{versions.get(incident_id, 1)}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        body = {**_incident(incident_id), "updatedAt": str(versions.get(incident_id, 1))}
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+    return httpx.MockTransport(handler)
+
+
+def _cached_client(calls: list[httpx.Request], versions: dict[str, int], clock: _Clock, **cache) -> BackendClient:
+    options = {"ttl_seconds": 5.0, "stale_seconds": 30.0, "max_entries": 16, **cache}
+    return BackendClient(
+        base_url="http://backend",
+        transport=_etag_transport(calls, versions),
+        cache=ResponseCache(clock=clock, **options),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fresh_entries_are_served_from_cache() -> None:
+    calls: list[httpx.Request] = []
+    clock = _Clock()
+    client = _cached_client(calls, {}, clock)
+
+    await client.get_incident("inc-1")
+    clock.now = 4.0
+    await client.get_incident("inc-1")
+
+    assert len(calls) == 1
+    assert client.cache.stats.hits == 1
+    assert client.cache.stats.misses == 1
+    assert client.cache.stats.hit_ratio == 0.5
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_served_while_refreshing_in_background() -> None:
+    calls: list[httpx.Request] = []
+    versions = {"inc-1": 1}
+    clock = _Clock()
+    client = _cached_client(calls, versions, clock)
+
+    async with client.lifespan():
+        await client.get_incident("inc-1")
+        versions["inc-1"] = 2
+        clock.now = 10.0
+        stale = await client.get_incident("inc-1")
+        await asyncio.gather(*client._inflight.values())
+        refreshed = await client.get_incident("inc-1")
+
+    assert stale.updatedAt == "1"
+    assert refreshed.updatedAt == "2"
+    assert calls[1].headers["if-none-match"] == '"inc-1-1"'
+    assert client.cache.stats.stale_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_revalidate_with_etag() -> None:
+    calls: list[httpx.Request] = []
+    clock = _Clock()
+    client = _cached_client(calls, {}, clock)
+
+    await client.get_incident("inc-1")
+    clock.now = 100.0
+    await client.get_incident("inc-1")
+    clock.now = 101.0
+    await client.get_incident("inc-1")
+
+    assert len(calls) == 2
+    assert calls[1].headers["if-none-match"] == '"inc-1-1"'
+    assert client.cache.stats.revalidated == 1
+    assert client.cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_entries() -> None:
+    calls: list[httpx.Request] = []
+    client = _cached_client(calls, {}, _Clock(), max_entries=2)
+
+    await client.get_incident("inc-1")
+    await client.get_incident("inc-2")
+    await client.get_incident("inc-1")
+    await client.get_incident("inc-3")
+    await client.get_incident("inc-1")
+    await client.get_incident("inc-2")
+
+    assert [request.url.path.rsplit("/", 1)[-1] for request in calls] == ["inc-1", "inc-2", "inc-3", "inc-2"]
+    assert client.cache.stats.evictions == 2
+    assert len(client.cache) == 2
+
+
+def _gated_transport(calls: list[httpx.Request], gate: asyncio.Event, status: int = 200) -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await gate.wait()
+        if status != 200:
+            return httpx.Response(status, json={"detail": "Incident not found"})
+        return httpx.Response(200, json=[_incident("inc-1")])
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ttl_seconds", [0.0, 5.0])
+async def test_concurrent_identical_requests_share_one_backend_call(ttl_seconds: float) -> None:
+    calls: list[httpx.Request] = []
+    gate = asyncio.Event()
+    client = BackendClient(
+        base_url="http://backend",
+        transport=_gated_transport(calls, gate),
+        cache=ResponseCache(ttl_seconds=ttl_seconds, stale_seconds=0, max_entries=16),
+    )
+
+    async with client.lifespan():
+        waiters = [asyncio.create_task(client.list_incidents({"status": "Open"})) for _ in range(5)]
+        other = asyncio.create_task(client.list_incidents({"status": "Closed"}))
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*waiters, other)
+
+    assert len(calls) == 2
+    assert all(result[0].id == "inc-1" for result in results)
+    assert client.coalesced == 4
+    assert client.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_share_errors_and_survive_cancellation() -> None:
+    calls: list[httpx.Request] = []
+    gate = asyncio.Event()
+    client = BackendClient(
+        base_url="http://backend",
+        transport=_gated_transport(calls, gate, status=404),
+        cache=ResponseCache(ttl_seconds=0, stale_seconds=0, max_entries=0),
+    )
+
+    first = asyncio.create_task(client.get_incident("missing"))
+    second = asyncio.create_task(client.get_incident("missing"))
+    await asyncio.sleep(0)
+    first.cancel()
+    gate.set()
+
+    with pytest.raises(BackendNotFoundError):
+        await second
+    assert first.cancelled()
+    assert len(calls) == 1
+
+
+def _batch_transport(calls: list[httpx.Request], known: set[str], supports_ids: bool) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path == "/api/v1/incidents":
+            if not supports_ids:
+                return httpx.Response(200, json=[_incident(item_id) for item_id in sorted(known)])
+            ids = request.url.params["ids"].split(",")
+            return httpx.Response(200, json=[_incident(item_id) for item_id in ids if item_id in known])
+        incident_id = request.url.path.rsplit("/", 1)[-1]
+        if incident_id not in known:
+            return httpx.Response(404, json={"detail": "Incident not found"})
+        return httpx.Response(200, json=_incident(incident_id))
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_batch_get_uses_ids_lookup_in_chunks() -> None:
+    calls: list[httpx.Request] = []
+    known = {f"inc-{index}" for index in range(150)}
+    client = BackendClient(base_url="http://backend", transport=_batch_transport(calls, known, supports_ids=True))
+    requested = [f"inc-{index}" for index in reversed(range(160))] + ["inc-3"]
+
+    items = await client.get_incidents(requested)
+
+    assert [item.id for item in items] == [f"inc-{index}" for index in reversed(range(150))]
+    assert len(calls) == 2
+    assert all(request.url.path == "/api/v1/incidents" for request in calls)
+
+
+@pytest.mark.asyncio
+async def test_batch_get_falls_back_to_fan_out_when_ids_are_ignored() -> None:
+    calls: list[httpx.Request] = []
+    client = BackendClient(
+        base_url="http://backend",
+        transport=_batch_transport(calls, {"inc-1", "inc-2", "inc-3"}, supports_ids=False),
+        batch_concurrency=2,
+    )
+
+    items = await client.get_incidents(["inc-3", "missing", "inc-1"])
+
+    assert [item.id for item in items] == ["inc-3", "inc-1"]
+    assert sorted(request.url.path for request in calls[1:]) == [
+        "/api/v1/incidents/inc-1",
+        "/api/v1/incidents/inc-3",
+        "/api/v1/incidents/missing",
+    ]
+
+
+
+def _no_cache() -> ResponseCache:
+    return ResponseCache(ttl_seconds=0, stale_seconds=0, max_entries=0)
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried_within_budget() -> None:
+    statuses = [503, 502, 200, 503, 503, 503]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        return httpx.Response(status, json=_incident("inc-1") if status == 200 else {"detail": "busy"})
+
+    client = BackendClient(
+        base_url="http://backend",
+        transport=httpx.MockTransport(handler),
+        cache=_no_cache(),
+        retry_backoff_seconds=0,
+        guards=RouteGuards(lambda: CircuitBreaker(5, 10), lambda: RetryBudget(ratio=0.1, min_tokens=3)),
+    )
+
+    assert (await client.get_incident("inc-1")).id == "inc-1"
+    with pytest.raises(BackendUnavailableError):
+        await client.get_incident("inc-1")
+    assert client.retries == 3
+    assert client.guards["/incidents/{id}"].budget.exhausted == 1
+    assert statuses == [503]
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_and_recovers_after_probe() -> None:
+    clock = _Clock()
+    calls: list[httpx.Request] = []
+    healthy = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if not healthy:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json=_incident("inc-1"))
+
+    client = BackendClient(
+        base_url="http://backend",
+        transport=httpx.MockTransport(handler),
+        cache=_no_cache(),
+        max_retries=0,
+        guards=RouteGuards(
+            lambda: CircuitBreaker(failure_threshold=2, reset_seconds=10, clock=clock), lambda: RetryBudget(0.2, 10)
+        ),
+    )
+    breaker = client.guards["/incidents/{id}"].breaker
+
+    for _ in range(4):
+        with pytest.raises(BackendUnavailableError):
+            await client.get_incident("inc-1")
+    assert len(calls) == 2
+    assert breaker.state == "open"
+    assert breaker.short_circuited == 2
+
+    healthy = True
+    clock.now = 11.0
+    assert breaker.state == "half_open"
+    assert (await client.get_incident("inc-1")).id == "inc-1"
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_breaker_is_scoped_per_route() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/incidents/broken":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json=[_incident("inc-1")])
+
+    client = BackendClient(
+        base_url="http://backend",
+        transport=httpx.MockTransport(handler),
+        cache=_no_cache(),
+        max_retries=0,
+        guards=RouteGuards(lambda: CircuitBreaker(failure_threshold=1, reset_seconds=10), lambda: RetryBudget(0.2, 10)),
+    )
+
+    with pytest.raises(BackendUnavailableError):
+        await client.get_incident("broken")
+    assert client.guards["/incidents/{id}"].breaker.state == "open"
+    assert [incident.id for incident in await client.list_incidents()] == ["inc-1"]
+    assert client.guards["/incidents"].breaker.state == "closed"
+    assert set(client.resilience_stats()["routes"]) == {"/incidents", "/incidents/{id}"}
+
+
+@pytest.mark.asyncio
+async def test_load_shedding_503_does_not_trip_the_breaker() -> None:
+    statuses = [503, 503, 503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        if status == 503:
+            return httpx.Response(503, headers={"Retry-After": "0"}, json={"detail": "Server overloaded"})
+        return httpx.Response(200, json=_incident("inc-1"))
+
+    client = BackendClient(
+        base_url="http://backend",
+        transport=httpx.MockTransport(handler),
+        cache=_no_cache(),
+        retry_backoff_seconds=0,
+        max_retries=3,
+        guards=RouteGuards(lambda: CircuitBreaker(failure_threshold=2, reset_seconds=10), lambda: RetryBudget(0.2, 10)),
+    )
+
+    assert (await client.get_incident("inc-1")).id == "inc-1"
+    assert client.retries == 3
+    assert client.guards["/incidents/{id}"].breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_slow_reads_are_hedged_after_latency_threshold() -> None:
+    attempts = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json=_incident("inc-1"))
+
+    latency = LatencyTracker(percentile=0.95, min_samples=1)
+    latency.record(0.01)
+    client = BackendClient(
+        base_url="http://backend",
+        transport=httpx.MockTransport(handler),
+        cache=_no_cache(),
+        hedge_reads=True,
+        latency=latency,
+    )
+
+    result = await asyncio.wait_for(client.get_incident("inc-1"), timeout=1)
+
+    assert result.id == "inc-1"
+    assert attempts == 2
+    assert client.hedged == 1
+    assert client.hedge_wins == 1
@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+MCP_DIR = Path(__file__).resolve().parents[1]
+BACKEND_DIR = MCP_DIR.parent / "backend"
+sys.path.insert(0, str(MCP_DIR))
+
+import app  # noqa: E402
+from app.client import BackendClient, BackendNotFoundError  # noqa: E402
+from app.core import EMBEDDED_BASE_URL  # noqa: E402
+from app.embedded import backend_lifespan, embedded_transport, load_backend_app  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_embedded_backend_serves_client_in_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("fastapi")
+    monkeypatch.setenv("BACKEND_STATE_PATH", str(tmp_path / "state.json"))
+
+    backend_app = load_backend_app(BACKEND_DIR)
+
+    assert sys.modules["app"] is app
+    assert "embedded_backend.app.main" in sys.modules
+    client = BackendClient(base_url=EMBEDDED_BASE_URL, transport=embedded_transport(backend_app))
+    async with backend_lifespan(backend_app), client.lifespan():
+        incidents = await client.list_incidents()
+        assert incidents
+        assert (await client.get_incident(incidents[0].id)).id == incidents[0].id
+        assert await client.list_runbook_summaries()
+        with pytest.raises(BackendNotFoundError):
+            await client.get_incident("missing-id")
+    assert load_backend_app(BACKEND_DIR) is backend_app
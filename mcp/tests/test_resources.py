@@ -0,0 +1,117 @@
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+MCP_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(MCP_DIR))
+
+from app.client import BackendClient  # noqa: E402
+from app.paging import split_sections  # noqa: E402
+from app.resources import register_resources  # noqa: E402
+
+
+def _incident(index: int) -> dict:
+    return {
+        "id": f"inc-{index}",
+        "title": f"Incident {index}",
+        "severity": "P2",
+        "status": "Open",
+        "service": "Checkout",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+        "notes": [],
+    }
+
+
+def _runbook(index: int) -> dict:
+    return {
+        "id": f"rb-{index}",
+        "title": f"Runbook {index}",
+        "tags": ["cache"],
+        "content": "# Detect\nCheck eviction rate.\n\n# Mitigate\nRaise memory.\n\n# Verify\nWatch p99.",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+    }
+
+
+def _server(calls: list[httpx.Request]) -> FastMCP:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path == "/api/v1/runbooks":
+            return httpx.Response(200, json=[_runbook(index) for index in range(3)])
+        if request.url.path.startswith("/api/v1/runbooks/"):
+            return httpx.Response(200, json=_runbook(0))
+        return httpx.Response(200, json=[_incident(index) for index in range(30)])
+
+    mcp = FastMCP("test")
+    register_resources(mcp, BackendClient(base_url="http://backend", transport=httpx.MockTransport(handler)))
+    return mcp
+
+
+async def _read(mcp: FastMCP, uri: str) -> object:
+    contents = list(await mcp.read_resource(uri))
+    return json.loads(contents[0].content)
+
+
+@pytest.mark.asyncio
+async def test_query_template_pages_and_projects_incidents() -> None:
+    mcp = _server([])
+
+    first = await _read(mcp, "incidents://?status=Open&limit=10&fields=title,severity")
+    assert first["page"]["returned"] == 10
+    assert first["page"]["total"] == 30
+    assert first["filters"] == {"status": "Open"}
+    assert first["items"][0] == {"id": "inc-0", "title": "Incident 0", "severity": "P2"}
+
+    cursor = first["page"]["nextCursor"]
+    second = await _read(mcp, f"incidents://?status=Open&limit=10&cursor={cursor}")
+    assert second["items"][0]["id"] == "inc-10"
+    assert second["page"]["offset"] == 10
+
+    legacy = await _read(mcp, "incidents://?status=Open")
+    assert isinstance(legacy, list) and len(legacy) == 30
+
+    with pytest.raises(Exception, match="invalid cursor"):
+        await _read(mcp, f"incidents://?status=Closed&cursor={cursor}")
+    with pytest.raises(Exception, match="invalid fields"):
+        await _read(mcp, "incidents://?fields=secret")
+
+
+@pytest.mark.asyncio
+async def test_runbook_projection_skips_content_and_sections_page_through_runbook() -> None:
+    calls: list[httpx.Request] = []
+    mcp = _server(calls)
+
+    listing = await _read(mcp, "runbooks://?fields=title,tags")
+    assert listing["items"][0] == {"id": "rb-0", "title": "Runbook 0", "tags": ["cache"]}
+    assert calls[-1].url.params["include_content"] == "false"
+
+    section = await _read(mcp, "runbooks://rb-0/sections/2")
+    assert section["heading"] == "Mitigate"
+    assert section["content"] == "Raise memory."
+    assert section["total"] == 3
+    assert section["next"] == "runbooks://rb-0/sections/3"
+    assert (await _read(mcp, "runbooks://rb-0/sections/3"))["next"] is None
+    with pytest.raises(Exception, match="not found"):
+        await _read(mcp, "runbooks://rb-0/sections/4")
+
+
+def test_split_sections_falls_back_to_paragraphs() -> None:
+    assert split_sections("Intro\n# One\na\n# Two\nb") == [(None, "Intro"), ("One", "a"), ("Two", "b")]
+    assert split_sections("a\nb\n\nc") == [(None, "a\nb"), (None, "c")]
+    assert split_sections("1. Confirm\n2. Promote") == [(None, "1. Confirm\n2. Promote")]
+
+
+def test_split_sections_keeps_fenced_code_blocks_whole() -> None:
+    shell = "```bash\n# drain the node first\nkubectl drain node-1\n\n# then restart\nkubectl rollout restart api\n```"
+    content = f"# Restart API\n{shell}\n# Verify\nWatch p99.\n~~~\n# not a heading\n~~~"
+
+    assert split_sections(content) == [
+        ("Restart API", shell),
+        ("Verify", "Watch p99.\n~~~\n# not a heading\n~~~"),
+    ]
+    assert split_sections(f"Intro\n\n{shell}") == [(None, "Intro"), (None, shell)]
@@ -0,0 +1,134 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+MCP_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(MCP_DIR))
+
+from app.client import BackendClient  # noqa: E402
+from app.models import Change  # noqa: E402
+from app.server import ChatGPTFastMCP  # noqa: E402
+from app.subscriptions import ChangeWatcher, SubscriptionRegistry, affects  # noqa: E402
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.updated: list[str] = []
+
+    async def send_resource_updated(self, uri) -> None:
+        self.updated.append(str(uri))
+
+
+def _change(seq: int, entity: str, entity_id: str) -> dict:
+    return {"seq": seq, "entity": entity, "id": entity_id, "op": "update", "at": "2024-01-01T00:00:00Z"}
+
+
+def _incident(incident_id: str) -> dict:
+    return {
+        "id": incident_id,
+        "title": "Checkout latency",
+        "severity": "P2",
+        "status": "Open",
+        "service": "Checkout",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+        "notes": [],
+    }
+
+
+def test_affects_matches_item_collection_and_query_uris() -> None:
+    change = Change.model_validate(_change(1, "incident", "inc-1"))
+
+    assert affects("incidents://inc-1", change)
+    assert affects("incidents://", change)
+    assert affects("incidents://?status=Open", change)
+    assert affects("incidents://?inc-1", change)
+    assert not affects("incidents://inc-2", change)
+    assert not affects("incidents://?inc-2", change)
+    assert not affects("runbooks://inc-1", change)
+    assert not affects("ui://widget/incident-list.html", change)
+
+
+@pytest.mark.asyncio
+async def test_watcher_invalidates_cache_and_notifies_only_changed_uris() -> None:
+    batches = [
+        {"changes": [], "latest": 3, "reset": False},
+        {"changes": [_change(4, "incident", "inc-1")], "latest": 4, "reset": False},
+        {"changes": [], "latest": 0, "reset": True},
+    ]
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/changes":
+            seen.append(request.url.params.get("since"))
+            return httpx.Response(200, json=batches.pop(0))
+        if request.url.path == "/api/v1/incidents":
+            return httpx.Response(200, json=[_incident("inc-1")])
+        return httpx.Response(200, json=_incident(request.url.path.rsplit("/", 1)[-1]))
+
+    client = BackendClient(base_url="http://backend", transport=httpx.MockTransport(handler))
+    registry = SubscriptionRegistry()
+    session = _Session()
+    for uri in ("incidents://inc-1", "incidents://inc-2", "incidents://", "runbooks://"):
+        registry.subscribe(uri, session)
+    watcher = ChangeWatcher(client, registry, wait_seconds=0)
+
+    await client.get_incident("inc-1")
+    await client.get_incident("inc-2")
+    await client.list_incidents()
+    await watcher.poll()
+    assert watcher.cursor == 3
+    assert session.updated == []
+
+    await watcher.poll()
+    assert watcher.cursor == 4
+    assert session.updated == ["incidents://inc-1", "incidents://"]
+    assert [key[0] for key in client.cache._entries] == ["/incidents/inc-2"]
+
+    session.updated.clear()
+    await watcher.poll()
+    assert watcher.cursor == 0
+    assert sorted(session.updated) == ["incidents://", "incidents://inc-1", "incidents://inc-2", "runbooks://"]
+    assert len(client.cache) == 0
+    assert seen == ["0", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_watcher_survives_a_malformed_batch() -> None:
+    batches = [
+        {"changes": [], "latest": 1, "reset": False},
+        {"changes": "not-a-list", "latest": 2, "reset": False},
+        {"changes": [_change(2, "incident", "inc-1")], "latest": 2, "reset": False},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if batches:
+            return httpx.Response(200, json=batches.pop(0))
+        return httpx.Response(503)
+
+    client = BackendClient(base_url="http://backend", transport=httpx.MockTransport(handler))
+    registry = SubscriptionRegistry()
+    session = _Session()
+    registry.subscribe("incidents://inc-1", session)
+    watcher = ChangeWatcher(client, registry, wait_seconds=0, backoff_seconds=0.001)
+
+    async with watcher.lifespan():
+        for _ in range(200):
+            if session.updated:
+                break
+            await asyncio.sleep(0.005)
+
+    assert session.updated[0] == "incidents://inc-1"
+    assert watcher.errors >= 1
+    assert watcher.cursor == 2
+
+
+def test_server_advertises_resource_subscriptions() -> None:
+    mcp = ChatGPTFastMCP("test")
+
+    options = mcp._mcp_server.create_initialization_options()
+
+    assert options.capabilities.resources.subscribe is True
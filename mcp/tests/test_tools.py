@@ -0,0 +1,107 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+MCP_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(MCP_DIR))
+
+from app.client import BackendClient  # noqa: E402
+from app.tools import register_tools  # noqa: E402
+
+
+def _incident(index: int) -> dict:
+    return {
+        "id": f"inc-{index}",
+        "title": f"Incident {index}",
+        "severity": "P2",
+        "status": "Open",
+        "service": "Checkout",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+        "notes": [{"timestamp": "2024-01-01T00:00:00Z", "author": "oncall", "text": "x" * 500}] * 3,
+    }
+
+
+def _runbook(index: int) -> dict:
+    return {
+        "id": f"rb-{index}",
+        "title": f"Runbook {index}",
+        "tags": ["cache"],
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+    }
+
+
+def _server(calls: list[httpx.Request]) -> FastMCP:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path == "/api/v1/runbooks":
+            return httpx.Response(200, json=[_runbook(index) for index in range(3)])
+        return httpx.Response(200, json=[_incident(index) for index in range(50)])
+
+    mcp = FastMCP("test")
+    register_tools(mcp, BackendClient(base_url="http://backend", transport=httpx.MockTransport(handler)))
+    return mcp
+
+
+@pytest.mark.asyncio
+async def test_incident_list_widget_pages_compact_summaries() -> None:
+    mcp = _server([])
+
+    first = await mcp.call_tool("incident_list_widget", {"status": "Open", "limit": 20})
+    page = first.structuredContent["page"]
+    assert page["returned"] == 20
+    assert page["truncated"]
+    assert set(first.structuredContent["items"][0]) == {
+        "id", "title", "severity", "status", "service", "updatedAt", "noteCount"
+    }
+    assert first.structuredContent["items"][0]["noteCount"] == 3
+    assert page["nextCursor"] in first.content[0].text
+
+    seen = [item["id"] for item in first.structuredContent["items"]]
+    cursor = page["nextCursor"]
+    while cursor:
+        result = await mcp.call_tool("incident_list_widget", {"status": "Open", "limit": 20, "cursor": cursor})
+        seen.extend(item["id"] for item in result.structuredContent["items"])
+        cursor = result.structuredContent["page"]["nextCursor"]
+    assert seen == [f"inc-{index}" for index in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_widget_payload_respects_byte_budget() -> None:
+    mcp = _server([])
+
+    result = await mcp.call_tool("incident_list_widget", {"limit": 100, "max_bytes": 1024})
+
+    page = result.structuredContent["page"]
+    assert page["bytes"] <= 1024
+    assert 0 < page["returned"] < 50
+    assert page["truncated"]
+
+
+@pytest.mark.asyncio
+async def test_widget_cursor_is_bound_to_filters() -> None:
+    mcp = _server([])
+    first = await mcp.call_tool("incident_list_widget", {"status": "Open", "limit": 5})
+    cursor = first.structuredContent["page"]["nextCursor"]
+
+    with pytest.raises(Exception) as excinfo:
+        await mcp.call_tool("incident_list_widget", {"status": "Closed", "cursor": cursor})
+    assert "invalid cursor" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_runbook_list_widget_skips_runbook_content() -> None:
+    calls: list[httpx.Request] = []
+    mcp = _server(calls)
+
+    result = await mcp.call_tool("runbook_list_widget", {})
+
+    assert calls[0].url.params["include_content"] == "false"
+    assert not result.structuredContent["page"]["truncated"]
+    assert result.structuredContent["items"][0] == {
+        "id": "rb-0", "title": "Runbook 0", "tags": ["cache"], "updatedAt": "2024-01-01T00:00:00Z"
+    }